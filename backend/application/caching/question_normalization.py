@@ -0,0 +1,56 @@
+"""Question normalization and a cheap local similarity score for answer caching.
+
+- normalize_question: NFKC + casefold, punctuation -> space, collapsed whitespace
+- question_shingles: character trigrams of the normalized text
+- shingle_similarity: Jaccard overlap of two shingle sets (1.0 == identical)
+- question_guard: numbers and negations, which must match exactly for a near-duplicate
+  (trigram overlap cannot tell "2022" from "2023" or "hire" from "not hire")
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+_NEGATIONS = frozenset({
+    "not", "no", "never", "none", "nor", "neither", "nobody", "nothing", "without",
+    "cannot", "cant", "dont", "doesnt", "didnt", "isnt", "arent", "wasnt", "werent",
+    "wont", "wouldnt", "shouldnt", "couldnt", "hasnt", "havent", "hadnt",
+    "nicht", "kein", "keine", "keinen", "nie", "ohne",
+})
+
+
+def normalize_question(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def question_shingles(normalized: str, size: int = 3) -> frozenset[str]:
+    padded = f" {normalized} "
+    if len(padded) <= size:
+        return frozenset({padded})
+    return frozenset(padded[i:i + size] for i in range(len(padded) - size + 1))
+
+
+def shingle_similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def question_guard(normalized: str) -> frozenset[str]:
+    tokens = normalized.split()
+    guard = set()
+    for index, token in enumerate(tokens):
+        if any(ch.isdigit() for ch in token):
+            guard.add(token)
+        elif token in _NEGATIONS:
+            guard.add("not")
+        elif token == "t" and index and tokens[index - 1].endswith("n"):
+            guard.add("not")  # "don't" normalizes to "don t"
+    return frozenset(guard)
+
+
+__all__ = ["normalize_question", "question_shingles", "shingle_similarity", "question_guard"]
@@ -0,0 +1,175 @@
+"""Bounded concurrency with a bounded FIFO wait queue (backpressure).
+
+At most `max_concurrent` holders run at once; up to `max_queue` callers wait (FIFO) for a
+slot, each for at most `max_wait_seconds`. Anything beyond that fails fast with
+`OverloadedError`, so a traffic spike turns into quick 429s instead of a pile of blocked
+threads and upstream rate-limit errors.
+
+One limiter can be shared by blocking (thread) and async callers: released slots are
+handed directly to the next waiter, whichever kind it is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+from ...domain.errors import OverloadedError
+
+
+class _Waiter:
+    __slots__ = ("granted", "event", "loop", "future")
+
+    def __init__(self, event: threading.Event | None = None, loop=None, future=None):
+        self.granted = False
+        self.event = event
+        self.loop = loop
+        self.future = future
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ConcurrencyLimiter:
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_queue: int = 32,
+        max_wait_seconds: float = 10.0,
+    ):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be >= 1")
+        self.max_concurrent = max_concurrent
+        self.max_queue = max(0, max_queue)
+        self.max_wait_seconds = max_wait_seconds
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: deque[_Waiter] = deque()
+        # Smoothed holding time, used to estimate Retry-After
+        self._avg_hold_s = 2.0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    # Slot bookkeeping (always under self._lock)
+    def _try_admit(self) -> bool:
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self.admitted += 1
+            return True
+        return False
+
+    def _enqueue(self, waiter: _Waiter) -> None:
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise self._overloaded("LLM capacity exhausted, please retry shortly")
+        self._waiters.append(waiter)
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Drop a waiter that gave up; returns True if it had already been handed a slot."""
+        if waiter.granted:
+            return True
+        self._waiters.remove(waiter)
+        return False
+
+    def _release(self, held_s: float) -> None:
+        with self._lock:
+            if held_s > 0:
+                self._avg_hold_s = 0.8 * self._avg_hold_s + 0.2 * held_s
+            if self._waiters:
+                # Hand the slot over directly: FIFO and no thundering herd
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                self.admitted += 1
+                waiter.wake()
+            else:
+                self._active -= 1
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free (rounded up, at least 1)."""
+        backlog = len(self._waiters) + 1
+        return max(1, math.ceil(self._avg_hold_s * backlog / self.max_concurrent))
+
+    def _overloaded(self, message: str) -> OverloadedError:
+        return OverloadedError(message, retry_after=self.retry_after())
+
+    def _timed_out(self) -> OverloadedError:
+        self.timed_out += 1
+        return self._overloaded("Timed out waiting for LLM capacity, please retry shortly")
+
+    # Public API
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one slot for the duration of the block (blocking callers)."""
+        with self._lock:
+            admitted = self._try_admit()
+            if not admitted:
+                waiter = _Waiter(event=threading.Event())
+                self._enqueue(waiter)
+        if not admitted:
+            waiter.event.wait(self.max_wait_seconds)
+            with self._lock:
+                if not self._abandon(waiter):
+                    raise self._timed_out()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started)
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of the block without blocking the event loop."""
+        with self._lock:
+            admitted = self._try_admit()
+            if not admitted:
+                loop = asyncio.get_running_loop()
+                waiter = _Waiter(loop=loop, future=loop.create_future())
+                self._enqueue(waiter)
+        if not admitted:
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter.future), self.max_wait_seconds)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                with self._lock:
+                    granted = self._abandon(waiter)
+                    if not granted and isinstance(e, asyncio.TimeoutError):
+                        raise self._timed_out() from None
+                if not granted:
+                    raise
+                if isinstance(e, asyncio.CancelledError):
+                    # Slot arrived just as we were cancelled: pass it on
+                    self._release(0.0)
+                    raise
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "active": self._active,
+                "waiting": len(self._waiters),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "retry_after_s": self.retry_after(),
+            }
+
+
+__all__ = ["ConcurrencyLimiter"]
@@ -0,0 +1,128 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+Concurrent callers with the same key share one upstream call: the first caller (leader)
+runs it, everyone else waits for its result. Three flavours share one set of counters:
+
+- `do`:        blocking callers (threads)
+- `do_async`:  coroutines; the call runs as its own task, so a cancelled waiter (client
+               disconnect) does not cancel the call for the others
+- `stream`:    async iterators; every subscriber replays the items produced so far and
+               then receives new ones as the leader task yields them
+
+Results are handed out as-is; callers that mutate them must copy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _StreamFlight:
+    def __init__(self):
+        self.items: list[Any] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.changed = asyncio.Event()
+        # Strong reference: the event loop only keeps weak ones to tasks
+        self.task: asyncio.Task | None = None
+
+    def _notify(self) -> None:
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class RequestCoalescer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sync_calls: dict[Hashable, Future] = {}
+        self._async_calls: dict[Hashable, asyncio.Task] = {}
+        self._streams: dict[Hashable, _StreamFlight] = {}
+        self.upstream_calls = 0
+        self.deduplicated = 0
+
+    def _count(self, leader: bool) -> None:
+        with self._lock:
+            if leader:
+                self.upstream_calls += 1
+            else:
+                self.deduplicated += 1
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._sync_calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._sync_calls[key] = future
+                self.upstream_calls += 1
+            else:
+                self.deduplicated += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._sync_calls.pop(key, None)
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._async_calls.get(key)
+        self._count(leader=task is None)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._async_calls[key] = task
+            task.add_done_callback(lambda _t: self._async_calls.pop(key, None))
+        return await asyncio.shield(task)
+
+    def stream(self, key: Hashable, make_iter: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        flight = self._streams.get(key)
+        self._count(leader=flight is None)
+        if flight is None:
+            flight = _StreamFlight()
+            self._streams[key] = flight
+            flight.task = asyncio.ensure_future(self._pump(key, flight, make_iter))
+            flight.task.add_done_callback(lambda _t: setattr(flight, "task", None))
+        return self._subscribe(flight)
+
+    async def _pump(self, key: Hashable, flight: _StreamFlight, make_iter: Callable[[], AsyncIterator[T]]) -> None:
+        try:
+            async for item in make_iter():
+                flight.items.append(item)
+                flight._notify()
+        except BaseException as e:  # noqa: BLE001 (re-raised in every subscriber)
+            flight.error = e
+        finally:
+            flight.done = True
+            self._streams.pop(key, None)
+            flight._notify()
+
+    @staticmethod
+    async def _subscribe(flight: _StreamFlight) -> AsyncIterator[T]:
+        index = 0
+        while True:
+            changed = flight.changed
+            while index < len(flight.items):
+                yield flight.items[index]
+                index += 1
+            if flight.done:
+                if flight.error is not None:
+                    raise flight.error
+                return
+            await changed.wait()
+
+    def stats(self) -> dict:
+        return {"upstream_calls": self.upstream_calls, "deduplicated": self.deduplicated}
+
+
+__all__ = ["RequestCoalescer"]
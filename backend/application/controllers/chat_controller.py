@@ -1,16 +1,37 @@
+import logging
+import uuid
+from typing import AsyncIterator
 from pydantic import BaseModel, Field
 from ...domain.entities import Answer
+from ...domain.errors import DomainError, OverloadedError, PIIBlockedError
 from ..use_cases.answer_questions_use_case import AnswerQuestionUseCase
 
 class ChatRequest(BaseModel):
     """Framework-agnostic request DTO serializable by delivery layer."""
     message: str = Field(..., min_length=1)
+    session_id: str | None = Field(default=None, min_length=1, max_length=64)
 
 class ChatResponse(BaseModel):
     """Structured response for delivery layer."""
     answer: str
     highlights: list[str]
     follow_up_questions: list[str]
+    session_id: str | None = None
+
+class ChatBatchRequest(BaseModel):
+    """Independent questions answered in one call (evaluation / bulk runs)."""
+    messages: list[str] = Field(..., min_length=1, max_length=100)
+
+class ChatBatchItem(BaseModel):
+    index: int
+    ok: bool
+    response: ChatResponse | None = None
+    error: dict | None = None
+
+class ChatBatchResponse(BaseModel):
+    results: list[ChatBatchItem]
+
+logger = logging.getLogger("ai_portfolio")
 
 class ChatController:
     """Thin coordination layer between delivery and use case.
@@ -18,13 +39,69 @@ class ChatController:
     - translates domain Answer -> response DTO
     - no knowledge of FastAPI / HTTP specifics
     """
-    def __init__(self, use_case: AnswerQuestionUseCase):
+    def __init__(self, use_case: AnswerQuestionUseCase, batch_concurrency: int = 8):
         self.use_case = use_case
+        self.batch_concurrency = batch_concurrency
+
+    def _session_id(self, req: ChatRequest) -> str | None:
+        """Client-provided session id, or a new one when sessions are enabled."""
+        if req.session_id or self.use_case.session_store is None:
+            return req.session_id
+        return uuid.uuid4().hex
 
     def handle(self, req: ChatRequest) -> ChatResponse:
-        answer: Answer = self.use_case.execute(req.message)
-        return ChatResponse(
+        session_id = self._session_id(req)
+        answer: Answer = self.use_case.execute(req.message, session_id)
+        return self._to_response(answer, session_id)
+
+    async def handle_async(self, req: ChatRequest) -> ChatResponse:
+        session_id = self._session_id(req)
+        answer: Answer = await self.use_case.execute_async(req.message, session_id)
+        return self._to_response(answer, session_id)
+
+    async def handle_batch(self, req: ChatBatchRequest) -> ChatBatchResponse:
+        results = await self.use_case.execute_many(req.messages, concurrency=self.batch_concurrency)
+        items = []
+        for index, result in enumerate(results):
+            if isinstance(result, Answer):
+                items.append(ChatBatchItem.model_construct(index=index, ok=True, response=self._to_response(result)))
+            else:
+                items.append(ChatBatchItem.model_construct(index=index, ok=False, error=self._error(result)))
+        return ChatBatchResponse.model_construct(results=items)
+
+    @staticmethod
+    def _error(exc: Exception) -> dict:
+        if isinstance(exc, PIIBlockedError):
+            return {"type": "pii_blocked", "message": str(exc), "findings": exc.findings}
+        if isinstance(exc, OverloadedError):
+            return {"type": "overloaded", "message": str(exc), "retry_after": exc.retry_after}
+        if isinstance(exc, DomainError):
+            return {"type": "domain_error", "message": str(exc)}
+        logger.error("Batch item failed", exc_info=exc)
+        return {"type": "server_error", "message": "Internal server error"}
+
+    def stream(self, req: ChatRequest) -> AsyncIterator[tuple[str, dict]]:
+        """Return (event, payload) pairs: `delta` text chunks, then one `final` response.
+
+        Validation / PII errors are raised here, before the first event.
+        """
+        session_id = self._session_id(req)
+        return self._stream_events(self.use_case.stream(req.message, session_id), session_id)
+
+    async def _stream_events(
+        self, items: AsyncIterator[str | Answer], session_id: str | None
+    ) -> AsyncIterator[tuple[str, dict]]:
+        async for item in items:
+            if isinstance(item, Answer):
+                yield "final", self._to_response(item, session_id).model_dump()
+            else:
+                yield "delta", {"text": item}
+
+    def _to_response(self, answer: Answer, session_id: str | None = None) -> ChatResponse:
+        # The Answer is already validated (schema-coerced LLM output): no second validation
+        return ChatResponse.model_construct(
             answer=answer.answer,
             highlights=answer.highlights,
             follow_up_questions=answer.follow_up_questions,
+            session_id=session_id,
         )
@@ -0,0 +1,68 @@
+"""Fit a conversation history into a fixed token budget.
+
+The newest messages are kept verbatim while they fit into most of the budget; everything
+older is folded into a single extractive summary (the earlier user questions, clipped),
+so the prompt stays bounded however long a conversation runs.
+"""
+
+from ...domain.entities import ChatMessage
+from ..tokens.token_counter import MESSAGE_OVERHEAD_TOKENS as _MESSAGE_OVERHEAD_TOKENS, count_tokens
+
+_SUMMARY_HEADER = "Earlier in this conversation the user asked:"
+_SUMMARY_QUESTION_CHARS = 160
+
+
+def estimate_tokens(text: str) -> int:
+    """Tokens of one message body (tiktoken if installed, else ~4 characters per token)."""
+    return max(1, count_tokens(text))
+
+
+def _message_tokens(message: ChatMessage) -> int:
+    return estimate_tokens(message.content) + _MESSAGE_OVERHEAD_TOKENS
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def _summarize(messages: list[ChatMessage], budget_tokens: int) -> ChatMessage | None:
+    used = estimate_tokens(_SUMMARY_HEADER) + _MESSAGE_OVERHEAD_TOKENS
+    lines: list[str] = []
+    # Most recent of the older questions first; they are the likeliest to be referenced
+    for message in reversed(messages):
+        if message.role != "user":
+            continue
+        line = f"- {_clip(message.content, _SUMMARY_QUESTION_CHARS)}"
+        cost = estimate_tokens(line)
+        if used + cost > budget_tokens:
+            break
+        lines.append(line)
+        used += cost
+    if not lines:
+        return None
+    lines.reverse()
+    return ChatMessage(role="system", content="\n".join([_SUMMARY_HEADER, *lines]))
+
+
+def compact_history(
+    history: list[ChatMessage], budget_tokens: int, summary_share: float = 0.25
+) -> list[ChatMessage]:
+    """Return at most `budget_tokens` worth of history, newest turns verbatim."""
+    if not history or budget_tokens <= 0:
+        return []
+    verbatim_budget = budget_tokens * (1 - summary_share)
+    used = 0
+    start = len(history)
+    for index in range(len(history) - 1, -1, -1):
+        cost = _message_tokens(history[index])
+        if used + cost > verbatim_budget:
+            break
+        used += cost
+        start = index
+    kept = history[start:]
+    if start:
+        summary = _summarize(history[:start], budget_tokens - used)
+        if summary is not None:
+            kept = [summary, *kept]
+    return kept
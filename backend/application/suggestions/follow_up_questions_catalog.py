@@ -8,6 +8,8 @@ Each entry has:
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
 from typing import List, Dict
 
 QuestionEntry = Dict[str, object]
@@ -27,4 +29,17 @@ QUESTIONS: List[QuestionEntry] = [
     {"id": "business_alignment", "text": "How do you align technical design with business impact?"},
 ]
 
-__all__ = ["QUESTIONS", "QuestionEntry"]
+# Suggestion prompts shown on the empty chat page live in `data/suggestion_prompts.json`,
+# read by the frontend and (for precomputing their answers) the backend
+
+
+def load_suggestion_prompts(path: str | Path) -> List[str]:
+    """Prompts from the shared JSON list; empty if the file is missing or unreadable."""
+    try:
+        prompts = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return [str(prompt) for prompt in prompts if str(prompt).strip()]
+
+
+__all__ = ["QUESTIONS", "QuestionEntry", "load_suggestion_prompts"]
@@ -0,0 +1,91 @@
+"""Sparse TF-IDF index over the follow-up question catalog.
+
+Built once per catalog: every entry becomes an L2-normalized term -> weight vector, and
+an inverted index maps each term to its (entry, weight) postings. Scoring a query only
+walks the postings of the query's terms, so the cost grows with the number of matching
+entries rather than the catalog size (a few hundred µs for thousands of entries).
+Pure Python on purpose, like the BM25 profile index: no NumPy dependency for a few
+thousand short questions.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Dict, List, Mapping, Sequence
+
+from ..caching.question_normalization import normalize_question
+
+_STOPWORDS = frozenset(
+    """a an and are as at be by can could do does did for from has have how i in is it its
+    me my of on or so that the their there these this to was what when where which who
+    why will with would you your yours about into also any been not we our us they them
+    tell more describe""".split()
+)
+
+Vector = Dict[str, float]
+
+
+def _stem(token: str) -> str:
+    # Crude prefix stemming: "reliable" / "reliability" and "monitor" / "monitoring"
+    # share a term; good enough for short English questions
+    return token[:6]
+
+
+def terms(text: str) -> List[str]:
+    return [_stem(t) for t in normalize_question(text).split() if len(t) > 1 and t not in _STOPWORDS]
+
+
+def _normalized(weights: Mapping[str, float]) -> Vector:
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    return {t: w / norm for t, w in weights.items()} if norm else {}
+
+
+def cosine(a: Vector, b: Vector) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())
+
+
+class QuestionIndex:
+    def __init__(self, entries: Sequence[Mapping[str, object]]):
+        self.ids: List[str] = [str(e["id"]) for e in entries]
+        self.texts: List[str] = [str(e["text"]) for e in entries]
+        term_counts = [Counter(terms(text)) for text in self.texts]
+        doc_freq: Counter = Counter()
+        for counts in term_counts:
+            doc_freq.update(counts.keys())
+        n = len(self.texts)
+        # Smoothed idf; sublinear tf
+        self.idf: Dict[str, float] = {t: math.log((1 + n) / (1 + df)) + 1 for t, df in doc_freq.items()}
+        self.vectors: List[Vector] = [
+            _normalized({t: (1 + math.log(c)) * self.idf[t] for t, c in counts.items()}) for counts in term_counts
+        ]
+        self.postings: Dict[str, List[tuple[int, float]]] = {}
+        for index, vector in enumerate(self.vectors):
+            for term, weight in vector.items():
+                self.postings.setdefault(term, []).append((index, weight))
+        self._position = {entry_id: index for index, entry_id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def vectorize(self, text: str) -> Vector:
+        """Unit query vector (terms outside the catalog vocabulary are ignored)."""
+        counts = Counter(t for t in terms(text) if t in self.idf)
+        return _normalized({t: (1 + math.log(c)) * self.idf[t] for t, c in counts.items()})
+
+    def scores(self, query: Vector) -> Dict[int, float]:
+        """Cosine similarity of `query` with every entry sharing at least one term."""
+        result: Dict[int, float] = {}
+        get = result.get
+        for term, q_weight in query.items():
+            for index, weight in self.postings.get(term, ()):
+                result[index] = get(index, 0.0) + q_weight * weight
+        return result
+
+    def position(self, entry_id: str) -> int | None:
+        return self._position.get(entry_id)
+
+
+__all__ = ["QuestionIndex", "cosine", "terms"]
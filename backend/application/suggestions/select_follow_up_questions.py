@@ -1,45 +1,92 @@
 """Selection logic for predefined follow-up questions.
 
-1. Filter out excluded IDs.
-2. Shuffle the remaining pool randomly.
-3. Return first k texts.
+1. Score the catalog against the current question and answer in one pass over the
+   TF-IDF index built once at import.
+2. Drop excluded IDs (e.g. questions already asked in the session) and entries that are
+   just the current question in other words.
+3. Pick k entries by maximal marginal relevance: relevant to the conversation but not
+   near-duplicates of each other. Entries without any overlap fill up the remaining slots
+   in catalog order.
 
-Deliberately no relevance scoring – keeps it simple and predictable in complexity.
+Deterministic: the same input always yields the same suggestions.
 """
 
 from __future__ import annotations
 
-from typing import List, Sequence
-import random
+import heapq
+from typing import Iterable, List, Sequence
 
 from .follow_up_questions_catalog import QUESTIONS
+from .question_index import QuestionIndex, cosine
+
+# Answer terms count less than the question's (answers are long and more generic)
+ANSWER_WEIGHT = 0.5
+# Cosine above which a catalog entry counts as the same question (paraphrase)
+DUPLICATE_THRESHOLD = 0.7
+# Relevance vs. diversity trade-off of the MMR re-ranking (1.0 = relevance only)
+MMR_LAMBDA = 0.7
+
+_INDEX = QuestionIndex(QUESTIONS)
+
+
+def catalog_ids_for(questions: Iterable[str], index: QuestionIndex = _INDEX) -> List[str]:
+    """IDs of catalog entries that the given questions (paraphrases included) match."""
+    ids: List[str] = []
+    for question in questions:
+        for position, score in index.scores(index.vectorize(question)).items():
+            if score >= DUPLICATE_THRESHOLD and index.ids[position] not in ids:
+                ids.append(index.ids[position])
+    return ids
+
 
 def select_follow_up_questions(
     current_question: str,
-    answer: str,  # bleibt vorhanden für API-Kompatibilität
+    answer: str,
     number_of_questions: int = 3,
     exclude_ids: Sequence[str] | None = None,
+    index: QuestionIndex = _INDEX,
 ) -> List[str]:
-    if number_of_questions <= 0:
+    if number_of_questions <= 0 or not len(index):
         return []
 
-    exclude = set(exclude_ids or [])
-
-    def _norm(s: str) -> str:
-        return s.strip().rstrip("?").casefold()
+    excluded = {p for p in (index.position(i) for i in exclude_ids or ()) if p is not None}
+    question = index.vectorize(current_question)
+    query = dict(question)
+    for term, weight in index.vectorize(answer).items():
+        query[term] = query.get(term, 0.0) + ANSWER_WEIGHT * weight
+    relevance = index.scores(query)  # one pass over the postings of all query terms
 
-    current_norm = _norm(current_question)
+    def _eligible(position: int) -> bool:
+        # Paraphrases of the current question score high by construction, so checking
+        # only the top of the ranking is enough
+        return position not in excluded and cosine(question, index.vectors[position]) < DUPLICATE_THRESHOLD
 
-    pool = [
-        question["text"]
-        for question in QUESTIONS
-        if question["id"] not in exclude and _norm(question["text"]) != current_norm
-    ]
-
-    if not pool:
-        return []
+    # MMR over a bounded pool of the most relevant entries keeps the cost independent of
+    # the catalog size; zero-relevance entries (catalog order) only pad the pool
+    pool_size = max(4 * number_of_questions, 20)
+    ranked = heapq.nlargest(2 * pool_size, relevance, key=lambda p: (relevance[p], -p))
+    candidates = [p for p in ranked if _eligible(p)][:pool_size]
+    if len(candidates) < pool_size:
+        chosen = set(candidates)
+        for position in range(len(index)):
+            if len(candidates) >= pool_size:
+                break
+            if position not in chosen and position not in relevance and _eligible(position):
+                candidates.append(position)
 
-    return random.sample(pool, k=min(number_of_questions, len(pool)))
+    selected: List[int] = []
+    while candidates and len(selected) < number_of_questions:
+        best = max(
+            candidates,
+            key=lambda p: (
+                MMR_LAMBDA * relevance.get(p, 0.0)
+                - (1 - MMR_LAMBDA) * max((cosine(index.vectors[p], index.vectors[s]) for s in selected), default=0.0),
+                -p,
+            ),
+        )
+        selected.append(best)
+        candidates.remove(best)
+    return [index.texts[p] for p in selected]
 
 
-__all__ = ["select_follow_up_questions"]
+__all__ = ["catalog_ids_for", "select_follow_up_questions"]
@@ -0,0 +1,155 @@
+"""Hard prompt token budget: shrink the profile context until the prompt fits.
+
+The context is split into markdown sections (`##` / `###` headings; text before the first
+heading is the preamble). When it does not fit, sections are dropped in a fixed order:
+configured low-priority sections first, then the remaining sections from the end of the
+document (the profile puts the most important material first, retrieval keeps chunks in
+document order). The preamble is never dropped; if it alone is still too large, it is cut
+at a line boundary. The result depends only on the inputs, so identical requests always
+produce an identical (prefix-cache friendly) context.
+
+Contexts within budget, the normal case, are returned unchanged.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Iterable, Mapping
+
+from .token_counter import count_message_tokens, count_tokens
+
+TRUNCATION_MARKER = "[… context truncated]"
+
+
+@dataclass(frozen=True)
+class FittedContext:
+    text: str
+    tokens: int
+    dropped_sections: tuple[str, ...] = ()
+    truncated: bool = False
+
+
+@dataclass(frozen=True)
+class _Section:
+    title: str  # "" for the preamble
+    text: str
+
+
+def _split_sections(markdown: str) -> list[_Section]:
+    sections: list[_Section] = []
+    title, lines = "", []
+    for line in markdown.splitlines():
+        if line.startswith("## ") or line.startswith("### "):
+            if lines:
+                sections.append(_Section(title, "\n".join(lines)))
+            title, lines = line.lstrip("#").strip(), [line]
+        else:
+            lines.append(line)
+    if lines:
+        sections.append(_Section(title, "\n".join(lines)))
+    return sections
+
+
+def _is_low_priority(title: str, low_priority: tuple[str, ...]) -> bool:
+    lowered = title.lower()
+    return any(lowered.startswith(prefix) for prefix in low_priority)
+
+
+def _truncate(text: str, budget_tokens: int, model: str | None) -> str:
+    kept: list[str] = []
+    used = count_tokens(TRUNCATION_MARKER, model)
+    for line in text.splitlines():
+        cost = count_tokens(line + "\n", model)
+        if used + cost > budget_tokens:
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join([*kept, TRUNCATION_MARKER]) if kept else ""
+
+
+@dataclass(frozen=True)
+class _Costs:
+    tokens: int
+    sections: tuple[_Section, ...]
+    section_tokens: tuple[int, ...]
+
+
+@lru_cache(maxsize=64)
+def _costs(context_md: str, model: str | None) -> _Costs:
+    """Token counts of a context and its sections, tokenized once per distinct context
+    (the budget changes with every question, the context rarely does)."""
+    sections = tuple(_split_sections(context_md))
+    return _Costs(
+        count_tokens(context_md, model),
+        sections,
+        tuple(count_tokens(s.text + "\n", model) for s in sections),
+    )
+
+
+def fit_context(
+    context_md: str,
+    budget_tokens: int,
+    low_priority_sections: tuple[str, ...] = (),
+    model: str | None = None,
+) -> FittedContext:
+    """Return `context_md` reduced to at most `budget_tokens` tokens (see module doc).
+
+    `low_priority_sections` are case-insensitive heading prefixes that are dropped first.
+    """
+    costs = _costs(context_md, model)
+    if costs.tokens <= budget_tokens:
+        return FittedContext(context_md, costs.tokens)
+
+    sections = costs.sections
+    low = tuple(p.lower() for p in low_priority_sections)
+    droppable = [i for i, s in enumerate(sections) if s.title]
+    # Low-priority sections first, everything else from the end of the document
+    order = sorted(droppable, key=lambda i: (not _is_low_priority(sections[i].title, low), -i))
+
+    keep = set(range(len(sections)))
+    used = sum(costs.section_tokens)
+    dropped: list[str] = []
+    for index in order:
+        if used <= budget_tokens:
+            break
+        keep.discard(index)
+        used -= costs.section_tokens[index]
+        dropped.append(sections[index].title)
+
+    text = "\n".join(sections[i].text for i in sorted(keep))
+    if used <= budget_tokens:
+        # Section costs include their line break, so they bound the joined text
+        return FittedContext(text, used, tuple(dropped))
+    text = _truncate(text, max(0, budget_tokens), model)
+    return FittedContext(text, count_tokens(text, model), tuple(dropped), True)
+
+
+@dataclass(frozen=True)
+class PromptBudget:
+    """Upper bound for the estimated prompt tokens of one LLM call.
+
+    `fixed_tokens` covers everything independent of the request (system prompt, message
+    templates and per-message overhead); question and history are counted per request and
+    the context gets whatever is left. Instead of a number, `fixed_messages` can build
+    those messages; they are then counted once, on first use rather than at startup.
+    """
+
+    max_prompt_tokens: int
+    fixed_tokens: int = 0
+    low_priority_sections: tuple[str, ...] = ()
+    model: str | None = None
+    fixed_messages: Callable[[], Iterable[Mapping[str, Any]]] | None = field(default=None, compare=False, repr=False)
+
+    @cached_property
+    def overhead_tokens(self) -> int:
+        """`fixed_tokens`, or the token count of `fixed_messages()` if given."""
+        if self.fixed_messages is None:
+            return self.fixed_tokens
+        return count_message_tokens(self.fixed_messages(), self.model)
+
+    def context_budget(self, question_tokens: int, history_tokens: int) -> int:
+        return self.max_prompt_tokens - self.overhead_tokens - question_tokens - history_tokens
+
+
+__all__ = ["FittedContext", "PromptBudget", "fit_context"]
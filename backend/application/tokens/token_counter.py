@@ -0,0 +1,60 @@
+"""Local token counting for prompts (before the LLM call).
+
+Uses `tiktoken` when it is installed (exact counts for OpenAI models); otherwise falls
+back to the ~4 characters per token rule of thumb, which is close enough for budgeting
+English prose. Chat messages add a few tokens each for role markers / separators.
+"""
+
+import math
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+
+try:  # optional dependency
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on the environment
+    tiktoken = None
+
+# Per-message role markers / separators and the priming of the assistant reply
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_OVERHEAD_TOKENS = 3
+
+_FALLBACK_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str | None):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding(_FALLBACK_ENCODING)
+    except (KeyError, ValueError):
+        return tiktoken.get_encoding(_FALLBACK_ENCODING)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Tokens in `text` for `model` (exact with tiktoken, estimated otherwise)."""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is None:
+        return max(1, math.ceil(len(text) / 4))
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: Iterable[Mapping[str, Any]], model: str | None = None) -> int:
+    """Prompt tokens of a chat completion request built from `messages`."""
+    return REPLY_OVERHEAD_TOKENS + sum(
+        count_tokens(str(m.get("content") or ""), model) + MESSAGE_OVERHEAD_TOKENS for m in messages
+    )
+
+
+def tokenizer_name() -> str:
+    return "tiktoken" if tiktoken is not None else "heuristic"
+
+
+__all__ = [
+    "MESSAGE_OVERHEAD_TOKENS",
+    "count_message_tokens",
+    "count_tokens",
+    "tokenizer_name",
+]
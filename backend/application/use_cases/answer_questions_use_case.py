@@ -1,17 +1,59 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
 from ...domain.ports.profile_repository import ProfileRepository
-from ...domain.ports.llm_service import LLMService
-from ...domain.entities import Answer, PIIFinding
+from ...domain.ports.llm_service import LLMService, AsyncLLMService
+from ...domain.ports.answer_cache import AnswerCache
+from ...domain.ports.session_store import SessionStore
+from ...domain.entities import Answer, ChatMessage, PIIFinding, UncacheableAnswer
 from ...domain.errors import ValidationError, PIIBlockedError
 from ...config import Settings
-from ...application.suggestions.select_follow_up_questions import select_follow_up_questions
+from ...application.suggestions.select_follow_up_questions import catalog_ids_for, select_follow_up_questions
+from ..caching.question_normalization import normalize_question
+from ..concurrency.request_coalescer import RequestCoalescer
+from ..sessions.history_compaction import compact_history
+from ..observability.metrics import METRICS, TOKEN_BUCKETS, stage
+from ..tokens.context_budget import PromptBudget, fit_context
+from ..tokens.token_counter import MESSAGE_OVERHEAD_TOKENS, count_tokens
 from .pii_processing_use_case import PIIProcessingUseCase
 
+logger = logging.getLogger("ai_portfolio")
+
+PROMPT_TOKENS_ESTIMATED = METRICS.histogram(
+    "llm_prompt_tokens_estimated", "Locally counted prompt tokens per LLM call", buckets=TOKEN_BUCKETS
+)
+CONTEXT_TRUNCATIONS = METRICS.counter(
+    "llm_context_truncations_total", "LLM calls whose context was cut to the prompt token budget"
+)
+
+
+@dataclass
+class PreparedQuestion:
+    """Validated, PII-processed request ready for the LLM."""
+    message: str
+    context_md: str
+    cache_namespace: str | None = None  # None => answer must not be cached or shared
+    session_id: str | None = None
+    history: list[ChatMessage] = field(default_factory=list)  # compacted, oldest first
+    asked: list[str] = field(default_factory=list)  # every earlier user question (not compacted)
+    prompt_tokens: int | None = None  # local estimate; None without a prompt budget
+
+
 class AnswerQuestionUseCase:
     """Core orchestration:
     1) Load profile context
     2) Run optional PII processing
-    3) Call LLM
-    4) Attach follow-up questions
+    3) Add the (compacted) session history, if a session id is given, and fit the context
+       into the prompt token budget
+    4) Serve from the answer cache or call LLM (identical in-flight calls coalesced)
+    5) Attach follow-up questions and record the turn in the session
+
+    `execute` is the blocking entry point; `execute_async` runs the same steps but awaits
+    the LLM call (native async service if wired, otherwise the sync one in a worker thread).
     """
 
     def __init__(
@@ -20,33 +62,309 @@ class AnswerQuestionUseCase:
         llm_service: LLMService,
         settings: Settings | None = None,
         pii_processor: PIIProcessingUseCase | None = None,
+        async_llm_service: AsyncLLMService | None = None,
+        answer_cache: AnswerCache | None = None,
+        coalescer: RequestCoalescer | None = None,
+        session_store: SessionStore | None = None,
+        prompt_budget: PromptBudget | None = None,
     ):
         self.profile_repository = profile_repository
         self.llm_service = llm_service
         self.settings = settings
         self.pii_processor = pii_processor
+        self.async_llm_service = async_llm_service
+        self.answer_cache = answer_cache
+        self.coalescer = coalescer
+        self.session_store = session_store
+        self.prompt_budget = prompt_budget
+
+    def cache_namespace(self, context_md: str | None = None) -> str:
+        """Cache key prefix: profile content version + model name."""
+        get_version = getattr(self.profile_repository, "get_profile_version", None)
+        if get_version is not None:
+            version = get_version()
+        else:
+            text = context_md if context_md is not None else self.profile_repository.get_profile_text()
+            version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        model = self.settings.llm_model if self.settings else getattr(self.llm_service, "model", "")
+        return f"{version}:{model}"
+
+    def _load_context(self, message: str) -> str:
+        retrieve = getattr(self.profile_repository, "get_relevant_profile_text", None)
+        with stage("profile"):
+            if retrieve is not None:
+                return retrieve(message)
+            return self.profile_repository.get_profile_text()
 
-    def execute(self, message: str) -> Answer:
+    def _history_budget(self) -> int:
+        try:
+            return self.settings.session_history_token_budget if self.settings else 1200
+        except Exception:
+            return 1200
+
+    def _load_history(self, session_id: str | None) -> tuple[list[ChatMessage], list[str]]:
+        """(compacted history, all earlier user questions) of the session."""
+        if not session_id or self.session_store is None:
+            return [], []
+        with stage("history"):
+            full = self.session_store.get_history(session_id)
+            asked = [m.content for m in full if m.role == "user"]
+            return compact_history(full, self._history_budget()), asked
+
+    def _apply_budget(self, prepared: PreparedQuestion) -> None:
+        """Count the prompt locally and cut the context to the budget (if one is set)."""
+        budget = self.prompt_budget
+        if budget is None:
+            return
+        question_tokens = count_tokens(prepared.message, budget.model)
+        history_tokens = sum(
+            count_tokens(m.content, budget.model) + MESSAGE_OVERHEAD_TOKENS for m in prepared.history
+        )
+        fixed = budget.overhead_tokens + question_tokens + history_tokens
+        if budget.max_prompt_tokens > 0:
+            fitted = fit_context(
+                prepared.context_md,
+                budget.context_budget(question_tokens, history_tokens),
+                budget.low_priority_sections,
+                budget.model,
+            )
+            if fitted.dropped_sections or fitted.truncated:
+                logger.warning(
+                    "Prompt over budget (%d tokens): dropped context sections %s%s",
+                    budget.max_prompt_tokens,
+                    list(fitted.dropped_sections),
+                    ", truncated the rest" if fitted.truncated else "",
+                )
+                CONTEXT_TRUNCATIONS.inc()
+            prepared.context_md = fitted.text
+            prepared.prompt_tokens = fixed + fitted.tokens
+        else:
+            prepared.prompt_tokens = fixed + count_tokens(prepared.context_md, budget.model)
+
+    def _record_prompt(self, prepared: PreparedQuestion) -> None:
+        if prepared.prompt_tokens is None:
+            return
+        PROMPT_TOKENS_ESTIMATED.observe(prepared.prompt_tokens)
+        logger.debug(
+            "LLM call prompt_tokens_estimated=%d history_messages=%d",
+            prepared.prompt_tokens,
+            len(prepared.history),
+        )
+
+    def _prepare(
+        self, message: str, session_id: str | None = None, context_md: str | None = None
+    ) -> PreparedQuestion:
         if not message or not message.strip():
             raise ValidationError("message must not be empty")
         if len(message) > 4000:
             raise ValidationError("message too long (max 4000 chars)")
-        context_md = self.profile_repository.get_profile_text()
+        original_message = message
+        if context_md is None:
+            context_md = self._load_context(message)
+        original_context = context_md
 
         # PII processing delegation
         if self.pii_processor:
-            message, context_md = self.pii_processor.process(message, context_md)
+            with stage("pii"):
+                message, context_md = self.pii_processor.process(message, context_md)
+
+        history, asked = self._load_history(session_id)
+        prepared = PreparedQuestion(
+            message=message,
+            context_md=context_md,
+            session_id=session_id,
+            history=history,
+            asked=asked,
+        )
+        self._apply_budget(prepared)
+        # Answers to masked / otherwise rewritten input or depending on earlier turns
+        # are never cached or shared
+        shares_answers = self.answer_cache is not None or self.coalescer is not None
+        if shares_answers and not history and message == original_message and context_md == original_context:
+            namespace = self.cache_namespace(context_md)
+            if prepared.context_md != context_md:
+                # Cut to the prompt budget: keyed on what the model actually saw
+                fitted = hashlib.sha256(prepared.context_md.encode("utf-8")).hexdigest()[:12]
+                namespace = f"{namespace}:fit-{fitted}"
+            prepared.cache_namespace = namespace
+        return prepared
+
+    def _flight_key(self, prepared: PreparedQuestion) -> tuple[str, str] | None:
+        if self.coalescer is None or prepared.cache_namespace is None:
+            return None
+        return prepared.cache_namespace, normalize_question(prepared.message)
+
+    def _cache_get(self, prepared: PreparedQuestion) -> Answer | None:
+        if self.answer_cache is None or prepared.cache_namespace is None:
+            return None
+        with stage("cache"):
+            return self.answer_cache.get(prepared.cache_namespace, prepared.message)
 
-        answer = self.llm_service.answer(prompt=message, context_markdown=context_md)
+    def _cache_put(self, prepared: PreparedQuestion, answer: Answer, latency_s: float) -> None:
+        # Unparseable output or another model's answer is served once, never cached
+        if self.answer_cache is None or prepared.cache_namespace is None or isinstance(answer, UncacheableAnswer):
+            return
+        self.answer_cache.put(prepared.cache_namespace, prepared.message, answer, latency_s=latency_s)
 
+    def _cache_blocks(self) -> bool:
+        # Caches doing file / lock I/O must not run on the event loop
+        return getattr(self.answer_cache, "blocking_io", False)
+
+    async def _cache_get_async(self, prepared: PreparedQuestion) -> Answer | None:
+        if self._cache_blocks():
+            return await asyncio.to_thread(self._cache_get, prepared)
+        return self._cache_get(prepared)
+
+    async def _cache_put_async(self, prepared: PreparedQuestion, answer: Answer, latency_s: float) -> None:
+        if self._cache_blocks():
+            await asyncio.to_thread(self._cache_put, prepared, answer, latency_s)
+        else:
+            self._cache_put(prepared, answer, latency_s)
+
+    @staticmethod
+    def _llm_kwargs(prepared: PreparedQuestion) -> dict:
+        kwargs = {"prompt": prepared.message, "context_markdown": prepared.context_md}
+        if prepared.history:
+            kwargs["history"] = prepared.history
+        return kwargs
+
+    def _finalize(self, prepared: PreparedQuestion, answer: Answer) -> Answer:
         try:
             count = self.settings.follow_up_questions_count if self.settings else 3
         except Exception:
             count = 3
-        answer.follow_up_questions = select_follow_up_questions(
-            current_question=message,
-            answer=answer.answer,
-            number_of_questions=count,
-            exclude_ids=[],
-        )
+        with stage("followups"):
+            # Never suggest what was already asked earlier in the session, including
+            # turns compacted into the history summary
+            answer.follow_up_questions = select_follow_up_questions(
+                current_question=prepared.message,
+                answer=answer.answer,
+                number_of_questions=count,
+                exclude_ids=catalog_ids_for(prepared.asked),
+            )
+        if prepared.session_id and self.session_store is not None:
+            self.session_store.append(
+                prepared.session_id,
+                [
+                    ChatMessage(role="user", content=prepared.message),
+                    ChatMessage(role="assistant", content=answer.answer),
+                ],
+            )
         return answer
+
+    def _call_llm(self, prepared: PreparedQuestion) -> Answer:
+        self._record_prompt(prepared)
+        started = time.perf_counter()
+        answer = self.llm_service.answer(**self._llm_kwargs(prepared))
+        self._cache_put(prepared, answer, time.perf_counter() - started)
+        return answer
+
+    def execute(self, message: str, session_id: str | None = None) -> Answer:
+        prepared = self._prepare(message, session_id)
+        answer = self._cache_get(prepared)
+        if answer is None:
+            key = self._flight_key(prepared)
+            with stage("llm"):
+                if key is None:
+                    answer = self._call_llm(prepared)
+                else:
+                    # Shared result: copy before attaching per-request follow-ups
+                    answer = self.coalescer.do(key, lambda: self._call_llm(prepared)).model_copy(deep=True)
+        return self._finalize(prepared, answer)
+
+    async def _answer_async(self, prepared: PreparedQuestion) -> Answer:
+        answer = await self._cache_get_async(prepared)
+        if answer is not None:
+            return answer
+        return await self._shared_llm_async(prepared)
+
+    async def _shared_llm_async(self, prepared: PreparedQuestion) -> Answer:
+        key = self._flight_key(prepared)
+        with stage("llm"):
+            if key is None:
+                return await self._call_llm_async(prepared)
+            shared = await self.coalescer.do_async(key, lambda: self._call_llm_async(prepared))
+        return shared.model_copy(deep=True)
+
+    async def _call_llm_async(self, prepared: PreparedQuestion) -> Answer:
+        self._record_prompt(prepared)
+        started = time.perf_counter()
+        if self.async_llm_service is not None:
+            answer = await self.async_llm_service.answer(**self._llm_kwargs(prepared))
+        else:
+            answer = await asyncio.to_thread(lambda: self.llm_service.answer(**self._llm_kwargs(prepared)))
+        await self._cache_put_async(prepared, answer, time.perf_counter() - started)
+        return answer
+
+    async def execute_async(self, message: str, session_id: str | None = None) -> Answer:
+        prepared = self._prepare(message, session_id)
+        answer = await self._answer_async(prepared)
+        return self._finalize(prepared, answer)
+
+    async def execute_many(self, messages: list[str], concurrency: int = 8) -> list[Answer | Exception]:
+        """Answer a batch of independent questions; results (or errors) in input order.
+
+        The full profile context is loaded once for the batch (per-question retrieval still
+        runs per item), PII processing runs per item and at most `concurrency` LLM calls
+        are in flight. Duplicates within the batch are served by the cache / coalescer.
+        """
+        shared_context = None
+        if getattr(self.profile_repository, "get_relevant_profile_text", None) is None:
+            shared_context = self.profile_repository.get_profile_text()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(message: str) -> Answer | Exception:
+            try:
+                prepared = self._prepare(message, context_md=shared_context)
+                async with semaphore:
+                    answer = await self._answer_async(prepared)
+                return self._finalize(prepared, answer)
+            except Exception as e:  # noqa: BLE001 (reported per item)
+                return e
+
+        return await asyncio.gather(*(_one(message) for message in messages))
+
+    async def precompute_async(self, message: str) -> Answer:
+        """Fresh LLM answer without cache lookup or follow-ups (used by the warm-up)."""
+        prepared = self._prepare(message)
+        return await self._call_llm_async(prepared)
+
+    def stream(self, message: str, session_id: str | None = None) -> AsyncIterator[str | Answer]:
+        """Validate eagerly (raises before any output), then return an async iterator
+        yielding answer text deltas followed by the final `Answer` with follow-ups."""
+        prepared = self._prepare(message, session_id)
+        return self._stream(prepared)
+
+    async def _stream(self, prepared: PreparedQuestion) -> AsyncIterator[str | Answer]:
+        streamer = getattr(self.async_llm_service, "stream_answer", None)
+        answer = await self._cache_get_async(prepared)
+        if answer is None and streamer is None:
+            answer = await self._shared_llm_async(prepared)
+        if answer is not None:
+            yield answer.answer
+        else:
+            key = self._flight_key(prepared)
+            items = (
+                self._stream_llm(prepared)
+                if key is None
+                else self.coalescer.stream(key, lambda: self._stream_llm(prepared))
+            )
+            with stage("llm"):
+                async for item in items:
+                    if isinstance(item, Answer):
+                        answer = item.model_copy(deep=True)
+                    else:
+                        yield item
+        yield self._finalize(prepared, answer)
+
+    async def _stream_llm(self, prepared: PreparedQuestion) -> AsyncIterator[str | Answer]:
+        self._record_prompt(prepared)
+        started = time.perf_counter()
+        answer: Answer | None = None
+        async for item in self.async_llm_service.stream_answer(**self._llm_kwargs(prepared)):
+            if isinstance(item, Answer):
+                answer = item
+            yield item
+        if answer is None:
+            raise RuntimeError("LLM stream ended without a final answer")
+        await self._cache_put_async(prepared, answer, time.perf_counter() - started)
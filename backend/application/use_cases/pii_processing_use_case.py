@@ -41,6 +41,9 @@ class PIIProcessingUseCase:
         last = 0
         counts: dict[str, int] = {}
         for f in ordered:
+            if f.start < last:
+                # Overlaps an already masked span (detectors without overlap resolution)
+                continue
             result.append(text[last:f.start])
             counts[f.category] = counts.get(f.category, 0) + 1
             token = f"<{f.category}_{counts[f.category]}>"
@@ -0,0 +1,200 @@
+"""Precompute answers for the fixed catalog / suggestion questions.
+
+Answers are generated with bounded parallelism, persisted to a JSON file stamped with the
+answer-cache namespace (profile content version + model) and loaded into the answer cache
+as pinned entries. On the next start the file is reused as long as the namespace still
+matches; only missing questions are generated. A changed profile or LLM_MODEL yields a new
+namespace and therefore a full regeneration.
+
+With several worker processes only the one holding an exclusive lock on `<file>.lock`
+generates; the others load what it saved on their next check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+try:  # POSIX only; elsewhere every process generates (single-worker setups)
+    import fcntl
+except ImportError:  # pragma: no cover - depends on the platform
+    fcntl = None
+
+from ...domain.entities import Answer, UncacheableAnswer
+from ...domain.ports.answer_cache import AnswerCache
+from ..caching.question_normalization import normalize_question
+from ..suggestions.follow_up_questions_catalog import QUESTIONS
+from ..use_cases.answer_questions_use_case import AnswerQuestionUseCase
+
+logger = logging.getLogger("ai_portfolio")
+
+
+def default_questions(suggestion_prompts: Iterable[str] = ()) -> List[str]:
+    """Catalog texts + suggestion prompts, de-duplicated on the normalized form."""
+    seen: set[str] = set()
+    result: List[str] = []
+    for text in [str(q["text"]) for q in QUESTIONS] + list(suggestion_prompts):
+        key = normalize_question(text)
+        if key not in seen:
+            seen.add(key)
+            result.append(text)
+    return result
+
+
+class AnswerWarmUp:
+    def __init__(
+        self,
+        use_case: AnswerQuestionUseCase,
+        answer_cache: AnswerCache,
+        store_path: str | Path,
+        concurrency: int = 4,
+        questions: Iterable[str] | None = None,
+        generate: bool = True,
+    ):
+        self.use_case = use_case
+        self.answer_cache = answer_cache
+        self.store_path = Path(store_path)
+        self.concurrency = max(1, concurrency)
+        self.questions = list(questions) if questions is not None else default_questions()
+        self.generate = generate
+        self._loaded_namespace: str | None = None
+
+    def _load(self, namespace: str) -> dict[str, Answer]:
+        if not self.store_path.exists():
+            return {}
+        try:
+            data = json.loads(self.store_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Ignoring unreadable precomputed answers file %s", self.store_path)
+            return {}
+        if data.get("namespace") != namespace:
+            return {}
+        answers: dict[str, Answer] = {}
+        for question, payload in (data.get("answers") or {}).items():
+            try:
+                answers[question] = Answer.model_validate(payload)
+            except Exception:  # noqa: BLE001 (skip single corrupt entries)
+                continue
+        return answers
+
+    def _save(self, namespace: str, answers: dict[str, Answer]) -> None:
+        payload = {
+            "namespace": namespace,
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "answers": {q: a.model_dump() for q, a in answers.items()},
+        }
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file in the same directory: os.replace stays atomic and no other
+        # writer can interleave its bytes with ours
+        fd, tmp = tempfile.mkstemp(dir=self.store_path.parent, prefix=self.store_path.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(payload, file, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.store_path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    @contextmanager
+    def _generation_lock(self) -> Iterator[bool]:
+        """Non-blocking exclusive lock across processes; yields whether it was acquired."""
+        if fcntl is None:
+            yield True
+            return
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.store_path.with_name(self.store_path.name + ".lock"), "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    async def _generate(self, questions: List[str]) -> dict[str, Answer]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _one(question: str) -> tuple[str, Answer | None]:
+            async with semaphore:
+                try:
+                    answer = await self.use_case.precompute_async(question)
+                except Exception:  # noqa: BLE001 (one failure must not stop the rest)
+                    logger.exception("Precomputing answer failed for %r", question)
+                    return question, None
+                if isinstance(answer, UncacheableAnswer):
+                    # Unparseable output / hedge model answer: retried on the next run instead of pinned
+                    logger.warning("Precomputed answer for %r is not cacheable, skipped", question)
+                    return question, None
+                return question, answer
+
+        results = await asyncio.gather(*(_one(q) for q in questions))
+        return {q: a for q, a in results if a is not None}
+
+    async def run(self, force: bool = False) -> dict:
+        """Load or (re)generate precomputed answers for the current namespace."""
+        namespace = self.use_case.cache_namespace()
+        if namespace == self._loaded_namespace and not force:
+            return {"namespace": namespace, "loaded": 0, "generated": 0}
+
+        answers = {} if force else self._load(namespace)
+        missing = [q for q in self.questions if q not in answers]
+        generated: dict[str, Answer] = {}
+        if missing and self.generate:
+            with self._generation_lock() as leader:
+                if leader:
+                    if not force:
+                        # Another worker may have finished generating since the first read
+                        answers = self._load(namespace)
+                        missing = [q for q in self.questions if q not in answers]
+                    if missing:
+                        generated = await self._generate(missing)
+                    if generated:
+                        answers.update(generated)
+                        self._save(namespace, answers)
+                else:
+                    logger.info("Another worker is precomputing answers; loading its results later")
+
+        def _pin() -> None:
+            for question, answer in answers.items():
+                self.answer_cache.put(namespace, question, answer, pinned=True)
+
+        if getattr(self.answer_cache, "blocking_io", False):
+            await asyncio.to_thread(_pin)
+        else:
+            _pin()
+        if len(answers) >= len(self.questions):
+            self._loaded_namespace = namespace
+        logger.info(
+            "Precomputed answers namespace=%s loaded=%d generated=%d missing=%d",
+            namespace,
+            len(answers) - len(generated),
+            len(generated),
+            len(self.questions) - len(answers),
+        )
+        return {
+            "namespace": namespace,
+            "loaded": len(answers) - len(generated),
+            "generated": len(generated),
+        }
+
+    async def watch(self, interval_seconds: float) -> None:
+        """Run now, then re-check periodically so profile edits trigger regeneration."""
+        while True:
+            try:
+                await self.run()
+            except Exception:  # noqa: BLE001 (keep the background task alive)
+                logger.exception("Answer warm-up failed")
+            await asyncio.sleep(interval_seconds)
+
+
+__all__ = ["AnswerWarmUp", "default_questions"]
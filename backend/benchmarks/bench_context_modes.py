@@ -0,0 +1,110 @@
+"""Compare full-context vs. retrieval-context prompts over the question catalog.
+
+Reports prompt token counts (system + context + question) per mode and end-to-end latency:
+- default: context build time measured locally, LLM time estimated from prompt size
+  (--base-ms + prompt tokens * --ms-per-1k-tokens / 1000)
+- --live: real OpenAI calls (requires OPENAI_API_KEY; costs money)
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_context_modes [--top-k 4] [--live] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from backend.config import Settings
+from backend.application.warmup.answer_warm_up import default_questions
+from backend.infrastructure.repositories.profile_repository import FileProfileRepository
+from backend.infrastructure.repositories.retrieval_profile_repository import RetrievalProfileRepository
+from backend.application.tokens.token_counter import count_message_tokens, tokenizer_name
+from backend.infrastructure.services.openai_prompt import build_messages
+
+
+def prompt_tokens(question: str, context: str, model: str | None = None) -> int:
+    return count_message_tokens(build_messages(question, context), model)
+
+
+def _summary(values: list[float]) -> dict:
+    ordered = sorted(values)
+    return {
+        "mean": round(statistics.fmean(ordered), 2),
+        "p50": round(ordered[len(ordered) // 2], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+def run(top_k: int, live: bool, base_ms: float, ms_per_1k: float) -> dict:
+    settings = Settings()
+    base = FileProfileRepository(
+        path=Path(settings.data_dir) / settings.background_file,
+        profile_json_path=Path(settings.data_dir) / settings.profile_json_file,
+    )
+    modes = {
+        "full": lambda q: base.get_profile_text(),
+        "retrieval": RetrievalProfileRepository(base=base, top_k=top_k).get_relevant_profile_text,
+    }
+    llm = None
+    if live:
+        from backend.infrastructure.services.openai_chat_service import OpenAIChatService
+        llm = OpenAIChatService(model=settings.llm_model, api_key=settings.openai_api_key)
+
+    questions = default_questions()
+    report: dict = {
+        "questions": len(questions),
+        "top_k": top_k,
+        "live": live,
+        "tokenizer": tokenizer_name(),
+        "modes": {},
+    }
+    for mode, load_context in modes.items():
+        tokens, latencies = [], []
+        load_context(questions[0])  # build caches / index outside the measurement
+        for question in questions:
+            started = time.perf_counter()
+            context = load_context(question)
+            build_ms = (time.perf_counter() - started) * 1000
+            n_tokens = prompt_tokens(question, context, settings.llm_model)
+            if llm is not None:
+                started = time.perf_counter()
+                llm.answer(prompt=question, context_markdown=context)
+                llm_ms = (time.perf_counter() - started) * 1000
+            else:
+                llm_ms = base_ms + n_tokens * ms_per_1k / 1000
+            tokens.append(n_tokens)
+            latencies.append(build_ms + llm_ms)
+        report["modes"][mode] = {"prompt_tokens": _summary(tokens), "latency_ms": _summary(latencies)}
+
+    full, rag = report["modes"]["full"], report["modes"]["retrieval"]
+    report["prompt_token_reduction"] = round(
+        1 - rag["prompt_tokens"]["mean"] / full["prompt_tokens"]["mean"], 3
+    )
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full vs. retrieval context benchmark")
+    parser.add_argument("--top-k", type=int, default=4)
+    parser.add_argument("--live", action="store_true", help="call OpenAI for real latencies")
+    parser.add_argument("--base-ms", type=float, default=600.0, help="estimated fixed LLM latency")
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=150.0, help="estimated prefill cost")
+    parser.add_argument("--json", action="store_true", help="print the machine-readable report only")
+    args = parser.parse_args()
+
+    report = run(args.top_k, args.live, args.base_ms, args.ms_per_1k_tokens)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(
+        f"{report['questions']} questions, top_k={report['top_k']}, live={report['live']},"
+        f" tokenizer={report['tokenizer']}"
+    )
+    for mode, stats in report["modes"].items():
+        print(f"  {mode:<10} prompt tokens {stats['prompt_tokens']}  latency ms {stats['latency_ms']}")
+    print(f"  prompt token reduction: {report['prompt_token_reduction']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
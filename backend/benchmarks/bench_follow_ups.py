@@ -0,0 +1,94 @@
+"""Follow-up selection latency as the question catalog grows.
+
+Builds synthetic catalogs (the real questions plus generated ones) of increasing size and times `select_follow_up_questions` for every catalog question with
+a typical answer.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_follow_ups [--sizes 12,1000,5000] [--json]
+"""
+
+import argparse
+import itertools
+import json
+import random
+import statistics
+import time
+
+from backend.application.suggestions.follow_up_questions_catalog import QUESTIONS
+from backend.application.suggestions.question_index import QuestionIndex
+from backend.application.suggestions.select_follow_up_questions import select_follow_up_questions
+
+_TEMPLATES = (
+    "How do you approach {} in {} projects?",
+    "What did you learn about {} and {}?",
+    "How would you improve {} for {}?",
+    "Which tools do you use for {} with {}?",
+)
+_ANSWER = (
+    "I monitor quality with evaluation sets and guardrails, and we ship prompt changes behind "
+    "feature flags so reliability in production stays measurable."
+)
+
+
+def _vocabulary(size: int, rng: random.Random) -> list[str]:
+    syllables = ["ka", "lo", "mi", "ren", "tas", "vo", "qui", "dex", "sor", "pa", "lin", "gro"]
+    words = {"".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(size * 2)}
+    return sorted(words)[:size]
+
+
+def synthetic_catalog(size: int, seed: int = 7) -> list[dict]:
+    """Real catalog plus generated questions whose topic words follow a Zipf-like
+    distribution (few common, many rare), like a hand-written catalog would."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(max(100, size), rng)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    catalog = [dict(q) for q in QUESTIONS]
+    while len(catalog) < size:
+        first, second = rng.choices(vocabulary, cum_weights=cum_weights, k=2)
+        text = rng.choice(_TEMPLATES).format(first, second)
+        catalog.append({"id": f"synthetic_{len(catalog)}", "text": text})
+    return catalog[:size]
+
+
+def run(sizes: list[int], count: int) -> dict:
+    report: dict = {"sizes": {}}
+    questions = [q["text"] for q in QUESTIONS]
+    for size in sizes:
+        catalog = synthetic_catalog(size)
+        started = time.perf_counter()
+        index = QuestionIndex(catalog)
+        build_ms = (time.perf_counter() - started) * 1000
+        timings = []
+        for question in questions * 5:
+            started = time.perf_counter()
+            select_follow_up_questions(question, _ANSWER, count, index=index)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        report["sizes"][size] = {
+            "build_ms": round(build_ms, 2),
+            "select_ms_p50": round(statistics.median(timings), 4),
+            "select_ms_max": round(timings[-1], 4),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Follow-up question selection benchmark")
+    parser.add_argument("--sizes", type=lambda s: [int(v) for v in s.split(",")], default=[12, 1000, 5000])
+    parser.add_argument("--count", type=int, default=3, help="suggestions per call")
+    parser.add_argument("--json", action="store_true", help="print the machine-readable report only")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.count)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for size, stats in report["sizes"].items():
+        print(
+            f"  {size:>6} questions  build {stats['build_ms']:>8.2f} ms"
+            f"  select p50 {stats['select_ms_p50']:.4f} ms  max {stats['select_ms_max']:.4f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
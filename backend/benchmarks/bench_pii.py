@@ -0,0 +1,100 @@
+"""PII detector throughput: single-pass combined matcher vs. one pass per category.
+
+Measures per-message latency and throughput in MB/s for a typical short question and,
+at the 4000-char input limit, for number-heavy prose without PII and prose with scattered
+PII of every category.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_pii [--iterations 2000] [--json]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from backend.infrastructure.services.pii_regex_detector import RegexPIIDetector, _CATEGORIES, _SINGLE
+
+MAX_MESSAGE_CHARS = 4000
+
+_PROSE = (
+    "I led the rollout of 3 LLM workflows in 2024 and cut editing time by 40 percent. "
+    "How do you evaluate structured outputs before deploying them to production? "
+)
+_PII = [
+    "marc@example.com",
+    "+49 1578 9281 878",
+    "079 123 45 67",
+    "DE89 3704 0044 0532 0130 00",
+    "4111 1111 1111 1111",
+    "192.168.0.1",
+    "Guisanstrasse 94",
+]
+
+
+def _message(with_pii: bool, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    parts: list[str] = []
+    while sum(len(p) for p in parts) < MAX_MESSAGE_CHARS:
+        parts.append(_PROSE)
+        if with_pii:
+            parts.append(rng.choice(_PII) + " ")
+    return "".join(parts)[:MAX_MESSAGE_CHARS]
+
+
+def _per_category_detect(text: str) -> int:
+    # Reference: one regex pass per category (the previous detector's strategy)
+    return sum(1 for pattern in _SINGLE for _ in pattern.finditer(text))
+
+
+def _measure(fn, text: str, iterations: int) -> dict:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn(text)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    total = sum(timings)
+    return {
+        "mean_us": round(total / iterations * 1e6, 1),
+        "p99_us": round(timings[int(iterations * 0.99) - 1] * 1e6, 1),
+        "mb_per_s": round(len(text.encode("utf-8")) * iterations / total / 1e6, 2),
+    }
+
+
+def run(iterations: int) -> dict:
+    detector = RegexPIIDetector()
+    report: dict = {"message_chars": MAX_MESSAGE_CHARS, "categories": len({c[0] for c in _CATEGORIES})}
+    scenarios = (
+        ("question", "How do you ensure reliability of LLM outputs in production?"),
+        ("clean", _message(False)),
+        ("with_pii", _message(True)),
+    )
+    for name, text in scenarios:
+        report[name] = {
+            "findings": len(detector.detect(text)),
+            "single_pass": _measure(detector.detect, text, iterations),
+            "per_category": _measure(_per_category_detect, text, iterations),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PII detector microbenchmark")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", action="store_true", help="print the machine-readable report only")
+    args = parser.parse_args()
+    report = run(args.iterations)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['message_chars']}-char messages, {report['categories']} categories")
+    for name in ("question", "clean", "with_pii"):
+        r = report[name]
+        print(f"  {name:<9} findings={r['findings']}")
+        for mode in ("single_pass", "per_category"):
+            print(f"    {mode:<13} {r[mode]}")
+
+
+if __name__ == "__main__":
+    main()
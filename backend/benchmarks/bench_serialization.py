@@ -0,0 +1,202 @@
+"""Response serialization cost: `response_model` path vs. the fast path, plus compression.
+
+Serves the same chat / batch responses from two in-process FastAPI apps, called directly
+over ASGI (no network, no request body), and reports CPU time per request:
+
+* legacy: validated `ChatResponse(...)` returned from the endpoint; FastAPI re-validates
+  it against `response_model`, runs `jsonable_encoder` and the stdlib `json.dumps`
+* fast:   `ChatResponse.model_construct(...)` wrapped in `FastJSONResponse` (pydantic-core
+  serializer, no second validation)
+
+Also reports response sizes and encode time for gzip and (if installed) brotli.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_serialization [--iterations 2000] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from fastapi import FastAPI
+
+from backend.application.controllers.chat_controller import ChatBatchItem, ChatBatchResponse, ChatResponse
+from backend.domain.entities import Answer
+from backend.presentation.compression import brotli, compress
+from backend.presentation.responses import FastJSONResponse, dumps
+
+BATCH_SIZE = 100
+
+ANSWER = Answer(
+    answer=(
+        "At simpleclub I led the introduction of LLM-assisted content production: a review "
+        "workflow where drafts are generated from the curriculum, checked against style and "
+        "correctness rubrics and then edited by subject experts. "
+    ) * 5,
+    highlights=[
+        "Cut editing time per lesson by about 40 percent",
+        "Structured JSON outputs validated before review",
+        "Evaluation set of 300 graded examples",
+        "Rolled out to three content teams",
+    ],
+    follow_up_questions=[
+        "How did you evaluate the quality of generated content?",
+        "What did the review workflow look like?",
+        "Which models did you compare?",
+    ],
+)
+
+# Distinct answers (shuffled words) so batch compression ratios aren't flattered by repetition
+_rng = random.Random(7)
+BATCH_ANSWERS = [
+    ANSWER.model_copy(update={"answer": " ".join(_rng.sample(ANSWER.answer.split(), k=len(ANSWER.answer.split())))})
+    for _ in range(BATCH_SIZE)
+]
+
+
+def _validated(answer: Answer) -> ChatResponse:
+    return ChatResponse(
+        answer=answer.answer,
+        highlights=answer.highlights,
+        follow_up_questions=answer.follow_up_questions,
+        session_id="3f2b9c",
+    )
+
+
+def _constructed(answer: Answer) -> ChatResponse:
+    return ChatResponse.model_construct(
+        answer=answer.answer,
+        highlights=answer.highlights,
+        follow_up_questions=answer.follow_up_questions,
+        session_id="3f2b9c",
+    )
+
+
+def _validated_batch() -> ChatBatchResponse:
+    items = [ChatBatchItem(index=i, ok=True, response=_validated(a)) for i, a in enumerate(BATCH_ANSWERS)]
+    return ChatBatchResponse(results=items)
+
+
+def _constructed_batch() -> ChatBatchResponse:
+    items = [
+        ChatBatchItem.model_construct(index=i, ok=True, response=_constructed(a)) for i, a in enumerate(BATCH_ANSWERS)
+    ]
+    return ChatBatchResponse.model_construct(results=items)
+
+
+def legacy_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/chat", response_model=ChatResponse)
+    async def chat() -> ChatResponse:
+        return _validated(ANSWER)
+
+    @app.get("/batch", response_model=ChatBatchResponse)
+    async def batch() -> ChatBatchResponse:
+        return _validated_batch()
+
+    return app
+
+
+def fast_app() -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/chat", response_model=ChatResponse)
+    async def chat() -> FastJSONResponse:
+        return FastJSONResponse(_constructed(ANSWER))
+
+    @app.get("/batch", response_model=ChatBatchResponse)
+    async def batch() -> FastJSONResponse:
+        return FastJSONResponse(_constructed_batch())
+
+    return app
+
+
+async def _request(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [], "client": ("127.0.0.1", 0), "server": ("bench", 80),
+    }
+    chunks: list[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def _measure(app: FastAPI, path: str, iterations: int) -> dict:
+    for _ in range(min(50, iterations)):  # warm up routing / serializer caches
+        body = await _request(app, path)
+    started = time.process_time()
+    for _ in range(iterations):
+        await _request(app, path)
+    cpu = time.process_time() - started
+    return {"cpu_us_per_request": round(cpu / iterations * 1e6, 1), "bytes": len(body)}
+
+
+def _compression(body: bytes, iterations: int) -> dict:
+    report = {}
+    for coding in ("gzip", "br") if brotli is not None else ("gzip",):
+        started = time.process_time()
+        for _ in range(iterations):
+            compressed = compress(body, coding)
+        report[coding] = {
+            "bytes": len(compressed),
+            "ratio": round(len(compressed) / len(body), 3),
+            "cpu_us": round((time.process_time() - started) / iterations * 1e6, 1),
+        }
+    return report
+
+
+async def _run(iterations: int) -> dict:
+    apps = {"legacy": legacy_app(), "fast": fast_app()}
+    report: dict = {"iterations": iterations, "batch_size": BATCH_SIZE, "endpoints": {}}
+    for path, count in (("/chat", iterations), ("/batch", max(1, iterations // 20))):
+        results = {name: await _measure(app, path, count) for name, app in apps.items()}
+        bodies = {name: json.loads(await _request(app, path)) for name, app in apps.items()}
+        assert bodies["legacy"] == bodies["fast"], "fast path must produce the same JSON"
+        legacy_us = results["legacy"]["cpu_us_per_request"]
+        fast_us = results["fast"]["cpu_us_per_request"]
+        results["saved_us_per_request"] = round(legacy_us - fast_us, 1)
+        results["speedup"] = round(legacy_us / fast_us, 2) if fast_us else None
+        results["compression"] = _compression(dumps(bodies["fast"]), count)
+        report["endpoints"][path] = results
+    return report
+
+
+def run(iterations: int) -> dict:
+    return asyncio.run(_run(iterations))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Response serialization / compression benchmark")
+    parser.add_argument("--iterations", type=int, default=2000, help="requests per app (batch: 1/20 of it)")
+    parser.add_argument("--json", action="store_true", help="print the machine-readable report only")
+    args = parser.parse_args()
+
+    report = run(args.iterations)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for path, results in report["endpoints"].items():
+        print(
+            f"{path:<7} legacy {results['legacy']['cpu_us_per_request']:>8.1f} us"
+            f"  fast {results['fast']['cpu_us_per_request']:>8.1f} us"
+            f"  saved {results['saved_us_per_request']:>8.1f} us/request (x{results['speedup']})"
+            f"  body {results['fast']['bytes']} B"
+        )
+        for coding, stats in results["compression"].items():
+            print(f"         {coding:<4} {stats['bytes']:>7} B (ratio {stats['ratio']})  {stats['cpu_us']:>7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
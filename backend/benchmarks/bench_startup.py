@@ -0,0 +1,112 @@
+"""Cold-start profile: import time of the API app (`python -X importtime`), lazy vs. eager.
+
+For each wiring mode, runs `import start` (imports and builds the app, as uvicorn does) in
+fresh interpreters and reports the median wall time, the median total of `-X importtime`
+and the slowest modules (cumulative). Pass `--max-ms` to fail (exit code 1) when the lazy
+import exceeds a budget, e.g. in CI.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_startup [--runs 5] [--top 10] [--max-ms 1500] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+MODES = {"lazy": "true", "eager": "false"}
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """{module: (self µs, cumulative µs)} from `-X importtime` output."""
+    modules: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        # A module is imported once per process; keep the first (only) record
+        modules.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return modules
+
+
+def _run_once(lazy: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    env = {
+        **os.environ,
+        "LAZY_WIRING": lazy,
+        "PRECOMPUTE_ANSWERS": "false",
+        # Eager wiring builds the OpenAI clients, which need some key
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "sk-benchmark",
+    }
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import start"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"import start failed:\n{result.stderr[-2000:]}")
+    return wall_ms, parse_importtime(result.stderr)
+
+
+def run(runs: int, top: int) -> dict:
+    report: dict = {"runs": runs, "modes": {}}
+    for mode, lazy in MODES.items():
+        walls, totals, samples = [], [], []
+        for _ in range(runs):
+            wall_ms, modules = _run_once(lazy)
+            walls.append(wall_ms)
+            totals.append(modules.get("start", (0, 0))[1] / 1000)
+            samples.append(modules)
+        last = samples[-1]
+        slowest = sorted(last.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        report["modes"][mode] = {
+            "process_wall_ms": round(statistics.median(walls), 1),
+            "import_start_ms": round(statistics.median(totals), 1),
+            "modules_loaded": len(last),
+            "slowest_cumulative_ms": {name: round(cum / 1000, 1) for name, (_, cum) in slowest},
+            "sdk_loaded": any(name == "openai" for name in last),
+        }
+    lazy_ms = report["modes"]["lazy"]["import_start_ms"]
+    eager_ms = report["modes"]["eager"]["import_start_ms"]
+    report["lazy_saving_ms"] = round(eager_ms - lazy_ms, 1)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API cold-start import time benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per mode")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--max-ms", type=float, help="fail if lazy `import start` takes longer")
+    parser.add_argument("--json", action="store_true", help="print the machine-readable report only")
+    args = parser.parse_args()
+
+    report = run(args.runs, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for mode, stats in report["modes"].items():
+            print(
+                f"{mode:<6} import start {stats['import_start_ms']:>7.1f} ms"
+                f"  process {stats['process_wall_ms']:>7.1f} ms"
+                f"  modules {stats['modules_loaded']}  openai loaded={stats['sdk_loaded']}"
+            )
+            for name, ms in stats["slowest_cumulative_ms"].items():
+                print(f"         {ms:>8.1f} ms  {name}")
+        print(f"lazy wiring saves {report['lazy_saving_ms']:.1f} ms")
+    if args.max_ms is not None and report["modes"]["lazy"]["import_start_ms"] > args.max_ms:
+        print(f"FAIL: lazy import {report['modes']['lazy']['import_start_ms']} ms > {args.max_ms} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
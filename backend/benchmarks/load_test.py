@@ -0,0 +1,244 @@
+"""Offline load test of the chat API through uvicorn, backed by the fake LLM.
+
+Starts `uvicorn start:app` in a subprocess with LLM_PROVIDER=fake (override anything with
+--env), then for each concurrency level sends --requests requests from that many
+concurrent clients and reports throughput, latency percentiles and error rates.
+
+Typical comparisons:
+- async path vs. sync threadpool path:  --env LLM_ASYNC_ENABLED=false
+- worker processes:                     --workers 4
+- caching:                              --unique 0.2  /  --env ANSWER_CACHE_ENABLED=false
+- upstream concurrency limit:           --env LLM_MAX_CONCURRENCY=16
+
+Usage (from the repository root):
+    python -m backend.benchmarks.load_test [--concurrency 1,8,32,64] [--requests 200]
+        [--workers 1] [--latency lognormal:0.8,0.5] [--error-rate 0] [--unique 1.0]
+        [--endpoint /v1/chat] [--env KEY=VALUE ...] [--url URL] [--json] [--output FILE]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from backend.application.warmup.answer_warm_up import default_questions
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def _latency_summary(values: list[float]) -> dict:
+    ordered = sorted(values)
+    return {
+        "mean": round(statistics.fmean(ordered) * 1000, 1) if ordered else 0.0,
+        "p50": round(_percentile(ordered, 50) * 1000, 1),
+        "p95": round(_percentile(ordered, 95) * 1000, 1),
+        "p99": round(_percentile(ordered, 99) * 1000, 1),
+        "max": round(ordered[-1] * 1000, 1) if ordered else 0.0,
+    }
+
+
+class _Server:
+    """uvicorn subprocess serving `start:app` with the given environment overrides."""
+
+    def __init__(self, workers: int, env: dict[str, str]):
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.workers = workers
+        self.env = {**os.environ, **env}
+        self.process: subprocess.Popen | None = None
+
+    def __enter__(self) -> "_Server":
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "start:app",
+                "--host", "127.0.0.1", "--port", str(self.port),
+                "--workers", str(self.workers), "--log-level", "warning",
+            ],
+            cwd=REPO_ROOT,
+            env=self.env,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {self.process.returncode}")
+            try:
+                if httpx.get(f"{self.url}/v1/cache/stats", timeout=1).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError("uvicorn did not become ready within 30s")
+
+    def __exit__(self, *exc) -> None:
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+def _questions(count: int, unique: float, seed: int) -> list[str]:
+    """Catalog questions; a `unique` fraction gets a suffix so it cannot be served from cache."""
+    rng = random.Random(seed)
+    catalog = default_questions()
+    out = []
+    for i in range(count):
+        question = rng.choice(catalog)
+        if rng.random() < unique:
+            # Random tokens long enough to defeat near-duplicate matching as well
+            nonce = " ".join(f"{rng.getrandbits(32):08x}" for _ in range(6))
+            question = f"{question} [{nonce}]"
+        out.append(question)
+    return out
+
+
+async def _one(client: httpx.AsyncClient, endpoint: str, question: str) -> tuple[str, float, float | None]:
+    """(outcome, latency, time to first byte) for one request."""
+    started = time.perf_counter()
+    ttfb = None
+    try:
+        async with client.stream("POST", endpoint, json={"message": question}) as response:
+            async for chunk in response.aiter_bytes():
+                if ttfb is None:
+                    ttfb = time.perf_counter() - started
+                if b"event: error" in chunk:
+                    return "stream_error", time.perf_counter() - started, ttfb
+            outcome = "ok" if response.status_code == 200 else str(response.status_code)
+    except httpx.HTTPError as e:
+        outcome = type(e).__name__
+    return outcome, time.perf_counter() - started, ttfb
+
+
+async def _run_level(url: str, endpoint: str, concurrency: int, questions: list[str], timeout: float) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    results: list[tuple[str, float, float | None]] = []
+    queue = iter(questions)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=timeout) as client:
+        async def worker() -> None:
+            for question in queue:
+                results.append(await _one(client, endpoint, question))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - started
+
+    ok = [latency for outcome, latency, _ in results if outcome == "ok"]
+    errors: dict[str, int] = {}
+    for outcome, _, _ in results:
+        if outcome != "ok":
+            errors[outcome] = errors.get(outcome, 0) + 1
+    level = {
+        "concurrency": concurrency,
+        "requests": len(results),
+        "ok": len(ok),
+        "errors": errors,
+        "error_rate": round(1 - len(ok) / len(results), 4) if results else 0.0,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(ok) / duration, 2) if duration else 0.0,
+        "latency_ms": _latency_summary(ok),
+    }
+    ttfbs = [ttfb for outcome, _, ttfb in results if outcome == "ok" and ttfb is not None]
+    if endpoint.endswith("/stream") and ttfbs:
+        level["ttfb_ms"] = _latency_summary(ttfbs)
+    return level
+
+
+def run(args: argparse.Namespace) -> dict:
+    env = {
+        "LLM_PROVIDER": "fake",
+        "FAKE_LLM_LATENCY": args.latency,
+        "FAKE_LLM_ERROR_RATE": str(args.error_rate),
+        # Keep runs independent of (and from touching) the persisted precomputed answers
+        "PRECOMPUTE_ANSWERS": "false",
+    }
+    for item in args.env:
+        key, _, value = item.partition("=")
+        env[key] = value
+
+    def _levels(url: str) -> list[dict]:
+        levels = []
+        for index, concurrency in enumerate(args.concurrency):
+            questions = _questions(args.requests, args.unique, seed=args.seed + index)
+            levels.append(asyncio.run(_run_level(url, args.endpoint, concurrency, questions, args.timeout)))
+        return levels
+
+    report: dict = {
+        "config": {
+            "endpoint": args.endpoint,
+            "requests_per_level": args.requests,
+            "workers": args.workers,
+            "unique": args.unique,
+            "env": env if not args.url else {},
+        }
+    }
+    if args.url:
+        report["levels"] = _levels(args.url)
+        report["server_stats"] = httpx.get(f"{args.url}/v1/cache/stats", timeout=5).json()
+        return report
+    with _Server(args.workers, env) as server:
+        report["levels"] = _levels(server.url)
+        # With several workers this is one (arbitrary) worker's view
+        report["server_stats"] = httpx.get(f"{server.url}/v1/cache/stats", timeout=5).json()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline chat API load test (fake LLM)")
+    parser.add_argument("--concurrency", type=lambda s: [int(v) for v in s.split(",")], default=[1, 8, 32, 64])
+    parser.add_argument("--requests", type=int, default=200, help="requests per concurrency level")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--latency", default="lognormal:0.8,0.5", help="fake LLM latency spec")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fake LLM failure probability")
+    parser.add_argument("--unique", type=float, default=1.0, help="fraction of cache-busting questions")
+    parser.add_argument("--endpoint", default="/v1/chat", choices=["/v1/chat", "/v1/chat/stream"])
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="server env override")
+    parser.add_argument("--url", help="load an already running server instead of starting one")
+    parser.add_argument("--timeout", type=float, default=120.0, help="client timeout per request (s)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="print the machine-readable report only")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run(args)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{args.endpoint}  workers={args.workers}  requests/level={args.requests}  unique={args.unique}")
+    for level in report["levels"]:
+        lat = level["latency_ms"]
+        print(
+            f"  c={level['concurrency']:<4} {level['throughput_rps']:>8.1f} req/s"
+            f"  p50={lat['p50']:>7.1f}ms p95={lat['p95']:>7.1f}ms p99={lat['p99']:>7.1f}ms"
+            f"  errors={level['error_rate']:.1%} {level['errors'] or ''}"
+        )
+
+
+if __name__ == "__main__":
+    main()
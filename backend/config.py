@@ -22,6 +22,10 @@ class Settings:
     background_file: str = os.getenv("BACKGROUND_FILE", "background.md")
     profile_json_file: str = os.getenv("PROFILE_JSON_FILE", "profile.json")
 
+    # Profile context: "full" (whole profile every request) or "retrieval" (BM25 top-k chunks)
+    profile_context_mode: str = os.getenv("PROFILE_CONTEXT_MODE", "full")
+    retrieval_top_k: int = int(os.getenv("RETRIEVAL_TOP_K", "4"))
+
     # PII
     pii_enabled: bool = os.getenv("PII_ENABLED", "true").lower() == "true"
     pii_block_severity: str = os.getenv("PII_BLOCK_SEVERITY", "high")
@@ -30,10 +34,80 @@ class Settings:
     # OpenAI / LLM
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     llm_model: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
+    llm_provider: str = os.getenv("LLM_PROVIDER", "openai").lower()  # openai | fake
+    llm_async_enabled: bool = os.getenv("LLM_ASYNC_ENABLED", "true").lower() == "true"
+
+    # Construct the OpenAI adapters (and import the SDK) on first use: faster cold start
+    lazy_wiring: bool = os.getenv("LAZY_WIRING", "true").lower() == "true"
+
+    # Fake LLM (LLM_PROVIDER=fake): offline load tests
+    fake_llm_latency: str = os.getenv("FAKE_LLM_LATENCY", "lognormal:0.8,0.5")
+    fake_llm_error_rate: float = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+    fake_llm_answer_words: int = int(os.getenv("FAKE_LLM_ANSWER_WORDS", "60"))
+
+    # Retries: only transient errors, all attempts within one deadline per request
+    llm_max_attempts: int = int(os.getenv("LLM_MAX_ATTEMPTS", "3"))
+    llm_deadline_seconds: float = float(os.getenv("LLM_DEADLINE_SECONDS", "30"))
+    llm_attempt_timeout_seconds: float = float(os.getenv("LLM_ATTEMPT_TIMEOUT_SECONDS", "20"))
+
+    # Upstream LLM concurrency limit (0 = unlimited) with a bounded wait queue
+    llm_max_concurrency: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    llm_max_queue: int = int(os.getenv("LLM_MAX_QUEUE", "32"))
+    llm_max_queue_wait_seconds: float = float(os.getenv("LLM_MAX_QUEUE_WAIT_SECONDS", "10"))
+
+    # Tail-latency hedging: second request once the primary exceeds the p-th latency
+    llm_hedging_enabled: bool = os.getenv("LLM_HEDGING_ENABLED", "false").lower() == "true"
+    llm_hedge_percentile: float = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+    llm_hedge_min_delay_seconds: float = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "1"))
+    llm_hedge_max_ratio: float = float(os.getenv("LLM_HEDGE_MAX_RATIO", "0.1"))
+    llm_hedge_model: str = os.getenv("LLM_HEDGE_MODEL", "")  # empty = same model
+
+    # Answer cache
+    answer_cache_enabled: bool = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+    answer_cache_max_entries: int = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "512"))
+    answer_cache_ttl_seconds: float = float(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))
+    answer_cache_similarity_threshold: float = float(os.getenv("ANSWER_CACHE_SIMILARITY_THRESHOLD", "0.9"))
+    # "memory" (per process) or "sqlite" (local file shared by all workers, survives restarts)
+    answer_cache_backend: str = os.getenv("ANSWER_CACHE_BACKEND", "memory").lower()
+    answer_cache_file: str = os.getenv("ANSWER_CACHE_FILE", "answer_cache.sqlite3")  # in data_dir
+
+    # Single-flight: identical in-flight questions share one LLM call
+    request_coalescing_enabled: bool = os.getenv("REQUEST_COALESCING_ENABLED", "true").lower() == "true"
+
+    # Multi-turn sessions (in-memory, bounded); history is compacted to a token budget
+    sessions_enabled: bool = os.getenv("SESSIONS_ENABLED", "true").lower() == "true"
+    session_max_sessions: int = int(os.getenv("SESSION_MAX_SESSIONS", "1000"))
+    session_ttl_seconds: float = float(os.getenv("SESSION_TTL_SECONDS", "3600"))
+    session_max_messages: int = int(os.getenv("SESSION_MAX_MESSAGES", "40"))
+    session_history_token_budget: int = int(os.getenv("SESSION_HISTORY_TOKEN_BUDGET", "1200"))
+
+    # Hard prompt budget (locally counted): low-priority context sections (heading
+    # prefixes) are dropped first, then trailing sections; 0 = count only, never cut
+    prompt_max_tokens: int = int(os.getenv("PROMPT_MAX_TOKENS", "4000"))
+    prompt_low_priority_sections: List[str] = field(
+        default_factory=lambda: _split_csv(os.getenv("PROMPT_LOW_PRIORITY_SECTIONS", "Interests"))
+    )
+
+    # Precomputed answers (catalog + suggestion prompts)
+    precompute_answers_enabled: bool = os.getenv("PRECOMPUTE_ANSWERS", "true").lower() == "true"
+    precomputed_answers_file: str = os.getenv("PRECOMPUTED_ANSWERS_FILE", "precomputed_answers.json")
+    # Suggestion prompts of the empty chat page (shared with the frontend), also precomputed
+    suggestion_prompts_file: str = os.getenv("SUGGESTION_PROMPTS_FILE", "suggestion_prompts.json")
+    precompute_concurrency: int = int(os.getenv("PRECOMPUTE_CONCURRENCY", "4"))
+    precompute_check_interval_seconds: float = float(os.getenv("PRECOMPUTE_CHECK_INTERVAL_SECONDS", "300"))
+
+    # Batch endpoint: max LLM calls in flight per batch request
+    # (0 = half of LLM_MAX_CONCURRENCY, leaving the rest to interactive chat; 8 without a limit)
+    batch_concurrency: int = int(os.getenv("BATCH_CONCURRENCY", "0"))
 
     # Follow-up questions
     follow_up_questions_count: int = int(os.getenv("FOLLOW_UP_QUESTIONS_COUNT", "3"))
 
+    # Observability: Prometheus /metrics + Server-Timing headers
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    # gzip / brotli for JSON responses of at least this many bytes (0 disables)
+    compression_min_bytes: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
     # Delivery / CORS
     cors_allowed_origins: List[str] = field(
         default_factory=lambda: _split_csv(os.getenv("CORS_ALLOWED_ORIGINS"))
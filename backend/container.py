@@ -1,45 +1,245 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .config import Settings
 
 from .infrastructure.repositories.profile_repository import FileProfileRepository
-from .infrastructure.services.openai_chat_service import OpenAIChatService
-from .infrastructure.services.pii_regex_detector import RegexPIIDetector
+from .infrastructure.services.llm_usage import UsageStats
+from .infrastructure.services.retry_stats import RetryStats
+from .infrastructure.services.lazy_llm_service import LazyLLMService, LazyAsyncLLMService
 from .application.use_cases.answer_questions_use_case import AnswerQuestionUseCase
-from .application.use_cases.pii_processing_use_case import PIIProcessingUseCase
 from .application.controllers.chat_controller import ChatController
+from .application.tokens.context_budget import PromptBudget
+
+# Optional subsystems are imported inside `build_container` only when enabled
+if TYPE_CHECKING:
+    from .infrastructure.repositories.retrieval_profile_repository import RetrievalProfileRepository
+    from .infrastructure.services.openai_chat_service import OpenAIChatService
+    from .infrastructure.services.async_openai_chat_service import AsyncOpenAIChatService
+    from .infrastructure.services.hedged_llm_service import HedgedLLMService
+    from .infrastructure.services.fake_llm_service import FakeLLMService, AsyncFakeLLMService
+    from .infrastructure.services.limited_llm_service import (
+        ConcurrencyLimitedLLMService,
+        AsyncConcurrencyLimitedLLMService,
+    )
+    from .infrastructure.services.pii_regex_detector import RegexPIIDetector
+    from .infrastructure.caches.in_memory_answer_cache import InMemoryAnswerCache
+    from .infrastructure.caches.sqlite_answer_cache import SQLiteAnswerCache
+    from .infrastructure.sessions.in_memory_session_store import InMemorySessionStore
+    from .application.use_cases.pii_processing_use_case import PIIProcessingUseCase
+    from .application.warmup.answer_warm_up import AnswerWarmUp
+    from .application.concurrency.request_coalescer import RequestCoalescer
+    from .application.concurrency.concurrency_limiter import ConcurrencyLimiter
+
+logger = logging.getLogger("ai_portfolio")
 
 @dataclass
 class Container:
     """Simple DI container assembling all components."""
     settings: Settings
-    profile_repository: FileProfileRepository
+    profile_repository: FileProfileRepository | RetrievalProfileRepository
     pii_detector: RegexPIIDetector | None
     pii_processor: PIIProcessingUseCase | None
-    llm_service: OpenAIChatService
+    llm_service: OpenAIChatService | FakeLLMService | LazyLLMService | ConcurrencyLimitedLLMService
+    async_llm_service: (
+        AsyncOpenAIChatService
+        | AsyncFakeLLMService
+        | LazyAsyncLLMService
+        | AsyncConcurrencyLimitedLLMService
+        | HedgedLLMService
+    )
+    llm_usage: UsageStats
+    llm_retry_stats: RetryStats
+    answer_cache: InMemoryAnswerCache | SQLiteAnswerCache | None
     answer_use_case: AnswerQuestionUseCase
     chat_controller: ChatController
+    answer_warm_up: AnswerWarmUp | None = None
+    coalescer: RequestCoalescer | None = None
+    llm_limiter: ConcurrencyLimiter | None = None
+    llm_hedging: HedgedLLMService | None = None
+    session_store: InMemorySessionStore | None = None
+    # Adapters whose construction is deferred (lazy wiring); see `prewarm`
+    lazy_services: list[LazyLLMService | LazyAsyncLLMService] = field(default_factory=list)
 
-def build_container() -> Container:
-    """Create and wire all implementations following Clean Architecture."""
+    def prewarm(self) -> None:
+        """Construct all deferred adapters now (blocking; run it off the event loop)."""
+        if self.answer_use_case.prompt_budget is not None:
+            self.answer_use_case.prompt_budget.overhead_tokens  # noqa: B018 (counts the prompt templates)
+        for service in self.lazy_services:
+            try:
+                service.resolve()
+            except Exception as e:  # noqa: BLE001 (retried on first use)
+                logger.warning("Pre-warming %s failed: %s", type(service).__name__, e)
+
+
+def build_container(lazy: bool | None = None) -> Container:
+    """Create and wire all implementations following Clean Architecture.
+
+    With lazy wiring (default, `LAZY_WIRING`) the OpenAI adapters, and with them the SDK
+    and tenacity imports, are constructed on first use instead of at startup.
+    """
     settings = Settings()
+    lazy = settings.lazy_wiring if lazy is None else lazy
+    lazy_services: list[LazyLLMService | LazyAsyncLLMService] = []
 
     # Repository
     background_path = Path(settings.data_dir) / settings.background_file
     profile_json_path = Path(settings.data_dir) / settings.profile_json_file
     profile_repository = FileProfileRepository(path=background_path, profile_json_path=profile_json_path)
-    pii_detector = RegexPIIDetector() if settings.pii_enabled else None
-    pii_processor = (
-        PIIProcessingUseCase(detector=pii_detector, settings=settings)
-        if (pii_detector and settings.pii_enabled)
-        else None
-    )
+    if settings.profile_context_mode == "retrieval":
+        from .infrastructure.repositories.retrieval_profile_repository import RetrievalProfileRepository
+
+        profile_repository = RetrievalProfileRepository(base=profile_repository, top_k=settings.retrieval_top_k)
+    pii_detector = pii_processor = None
+    if settings.pii_enabled:
+        from .infrastructure.services.pii_regex_detector import RegexPIIDetector
+        from .application.use_cases.pii_processing_use_case import PIIProcessingUseCase
+
+        pii_detector = RegexPIIDetector()
+        pii_processor = PIIProcessingUseCase(detector=pii_detector, settings=settings)
+
+    # LLM service (OpenAI Chat Completions, or an offline fake for load tests)
+    # Shared token usage totals (incl. provider prompt-cache hits)
+    llm_usage = UsageStats()
+    llm_retry_stats = RetryStats()
+
+    @cache
+    def retry_policy():
+        from .infrastructure.services.openai_retry import RetryPolicy
+
+        return RetryPolicy(
+            max_attempts=settings.llm_max_attempts,
+            deadline_seconds=settings.llm_deadline_seconds,
+            attempt_timeout_seconds=settings.llm_attempt_timeout_seconds,
+            stats=llm_retry_stats,
+        )
+
+    def openai_service(model: str):
+        from .infrastructure.services.openai_chat_service import OpenAIChatService
+
+        return OpenAIChatService(
+            model=model, api_key=settings.openai_api_key, usage_stats=llm_usage, retry_policy=retry_policy()
+        )
+
+    def async_openai_service(model: str):
+        from .infrastructure.services.async_openai_chat_service import AsyncOpenAIChatService
+
+        return AsyncOpenAIChatService(
+            model=model, api_key=settings.openai_api_key, usage_stats=llm_usage, retry_policy=retry_policy()
+        )
 
-    # LLM service (OpenAI Chat Completions)
-    llm_service = OpenAIChatService(
+    def wire(factory, lazy_cls, model: str):
+        if not lazy:
+            return factory()
+        service = lazy_cls(factory, model=model)
+        lazy_services.append(service)
+        return service
+
+    hedge_llm_service = None
+    if settings.llm_provider == "fake":
+        from .infrastructure.services.fake_llm_service import FakeLLMProfile, FakeLLMService, AsyncFakeLLMService
+
+        fake_profile = FakeLLMProfile(
+            latency=settings.fake_llm_latency,
+            error_rate=settings.fake_llm_error_rate,
+            answer_words=settings.fake_llm_answer_words,
+            model=settings.llm_model,
+        )
+        llm_service = FakeLLMService(fake_profile)
+        async_llm_service = AsyncFakeLLMService(fake_profile)
+    else:
+        model = settings.llm_model
+        llm_service = wire(lambda: openai_service(model), LazyLLMService, model)
+        async_llm_service = wire(lambda: async_openai_service(model), LazyAsyncLLMService, model)
+    if settings.llm_provider != "fake" and settings.llm_hedging_enabled and settings.llm_hedge_model:
+        hedge_model = settings.llm_hedge_model
+        hedge_llm_service = wire(lambda: async_openai_service(hedge_model), LazyAsyncLLMService, hedge_model)
+    # One limit shared by the sync and async paths: spikes queue briefly, then get 429
+    llm_limiter = None
+    if settings.llm_max_concurrency > 0:
+        from .application.concurrency.concurrency_limiter import ConcurrencyLimiter
+        from .infrastructure.services.limited_llm_service import (
+            ConcurrencyLimitedLLMService,
+            AsyncConcurrencyLimitedLLMService,
+        )
+
+        llm_limiter = ConcurrencyLimiter(
+            max_concurrent=settings.llm_max_concurrency,
+            max_queue=settings.llm_max_queue,
+            max_wait_seconds=settings.llm_max_queue_wait_seconds,
+        )
+        llm_service = ConcurrencyLimitedLLMService(llm_service, llm_limiter)
+        async_llm_service = AsyncConcurrencyLimitedLLMService(async_llm_service, llm_limiter)
+        if hedge_llm_service is not None:
+            hedge_llm_service = AsyncConcurrencyLimitedLLMService(hedge_llm_service, llm_limiter)
+    # Hedges count against the same concurrency limit as primary calls
+    llm_hedging = None
+    if settings.llm_hedging_enabled:
+        from .infrastructure.services.hedged_llm_service import HedgedLLMService
+
+        llm_hedging = HedgedLLMService(
+            primary=async_llm_service,
+            hedge=hedge_llm_service,
+            percentile=settings.llm_hedge_percentile,
+            min_delay_seconds=settings.llm_hedge_min_delay_seconds,
+            max_hedge_ratio=settings.llm_hedge_max_ratio,
+        )
+        async_llm_service = llm_hedging
+
+    # Answer cache (keys include profile version + model)
+    answer_cache = None
+    if settings.answer_cache_enabled and settings.answer_cache_backend == "sqlite":
+        from .infrastructure.caches.sqlite_answer_cache import SQLiteAnswerCache
+
+        answer_cache = SQLiteAnswerCache(
+            path=Path(settings.data_dir) / settings.answer_cache_file,
+            max_entries=settings.answer_cache_max_entries,
+            ttl_seconds=settings.answer_cache_ttl_seconds or None,
+            similarity_threshold=settings.answer_cache_similarity_threshold,
+        )
+    elif settings.answer_cache_enabled:
+        from .infrastructure.caches.in_memory_answer_cache import InMemoryAnswerCache
+
+        answer_cache = InMemoryAnswerCache(
+            max_entries=settings.answer_cache_max_entries,
+            ttl_seconds=settings.answer_cache_ttl_seconds or None,
+            similarity_threshold=settings.answer_cache_similarity_threshold,
+        )
+
+    coalescer = None
+    if settings.request_coalescing_enabled:
+        from .application.concurrency.request_coalescer import RequestCoalescer
+
+        coalescer = RequestCoalescer()
+
+    # Conversation history per session id (memory bounded by LRU / TTL / turn caps)
+    session_store = None
+    if settings.sessions_enabled:
+        from .infrastructure.sessions.in_memory_session_store import InMemorySessionStore
+
+        session_store = InMemorySessionStore(
+            max_sessions=settings.session_max_sessions,
+            ttl_seconds=settings.session_ttl_seconds or None,
+            max_messages=settings.session_max_messages,
+        )
+
+    def fixed_messages():
+        # Imported on first use: the system prompt is built from the answer schema
+        from .infrastructure.services.openai_prompt import build_messages
+
+        return build_messages("", "")
+
+    # Prompt token budget: system prompt + message templates are counted once, on first use
+    prompt_budget = PromptBudget(
+        max_prompt_tokens=settings.prompt_max_tokens,
+        fixed_messages=fixed_messages,
+        low_priority_sections=tuple(settings.prompt_low_priority_sections),
         model=settings.llm_model,
-        api_key=settings.openai_api_key,
     )
 
     # Use-Case
@@ -48,17 +248,58 @@ def build_container() -> Container:
         llm_service=llm_service,
         settings=settings,
         pii_processor=pii_processor,
+        # Without it the sync service runs in the threadpool (for comparisons)
+        async_llm_service=async_llm_service if settings.llm_async_enabled else None,
+        answer_cache=answer_cache,
+        coalescer=coalescer,
+        session_store=session_store,
+        prompt_budget=prompt_budget,
     )
 
     # Controller
-    chat_controller = ChatController(use_case=answer_use_case)
+    # A batch alone never needs more than the upstream limit (excess would only queue)
+    batch_concurrency = settings.batch_concurrency
+    if settings.llm_max_concurrency > 0:
+        if batch_concurrency <= 0:
+            # One batch must not take every LLM slot and push /v1/chat into 429s
+            batch_concurrency = max(1, settings.llm_max_concurrency // 2)
+        batch_concurrency = min(batch_concurrency, settings.llm_max_concurrency)
+    elif batch_concurrency <= 0:
+        batch_concurrency = 8
+    chat_controller = ChatController(use_case=answer_use_case, batch_concurrency=batch_concurrency)
+
+    # Precomputed answers for fixed questions (served from the answer cache)
+    answer_warm_up = None
+    if answer_cache and settings.precompute_answers_enabled:
+        from .application.suggestions.follow_up_questions_catalog import load_suggestion_prompts
+        from .application.warmup.answer_warm_up import AnswerWarmUp, default_questions
+
+        answer_warm_up = AnswerWarmUp(
+            use_case=answer_use_case,
+            answer_cache=answer_cache,
+            store_path=Path(settings.data_dir) / settings.precomputed_answers_file,
+            concurrency=settings.precompute_concurrency,
+            questions=default_questions(load_suggestion_prompts(Path(settings.data_dir) / settings.suggestion_prompts_file)),
+            # Fake answers must never end up in the persisted store
+            generate=bool(settings.openai_api_key) and settings.llm_provider != "fake",
+        )
 
     return Container(
         settings=settings,
         profile_repository=profile_repository,
         llm_service=llm_service,
+        async_llm_service=async_llm_service,
+        llm_usage=llm_usage,
+        llm_retry_stats=llm_retry_stats,
+        answer_cache=answer_cache,
         answer_use_case=answer_use_case,
         chat_controller=chat_controller,
-    pii_detector=pii_detector,
-    pii_processor=pii_processor,
+        answer_warm_up=answer_warm_up,
+        coalescer=coalescer,
+        llm_limiter=llm_limiter,
+        llm_hedging=llm_hedging,
+        session_store=session_store,
+        pii_detector=pii_detector,
+        pii_processor=pii_processor,
+        lazy_services=lazy_services,
     )
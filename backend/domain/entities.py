@@ -12,6 +12,17 @@ class Answer(BaseModel):
     highlights: list[str] = Field(..., default_factory=list, description="Key bullet points summarizing the answer")
     follow_up_questions: list[str] = Field(..., default_factory=list, description="Suggested follow-up questions")
 
+class UncacheableAnswer(Answer):
+    """Answer served to the caller but never cached, shared via the cache or precomputed."""
+
+class FallbackAnswer(UncacheableAnswer):
+    """Raw model output that did not match the schema, wrapped as an answer
+    (a retry may well produce a valid one)."""
+
+class SubstituteAnswer(UncacheableAnswer):
+    """Answer from a different model than the configured one (e.g. a hedge model), so it
+    does not belong under the configured model's cache namespace."""
+
 class PIIFinding(BaseModel):
     category: str = Field(..., description="Category of the PII finding")
     value: str = Field(..., description="The PII value found")
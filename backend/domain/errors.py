@@ -12,3 +12,9 @@ class PIIBlockedError(DomainError):
     def __init__(self, message: str, findings: list[dict]):
         super().__init__(message)
         self.findings = findings
+
+class OverloadedError(DomainError):
+    """Raised when no LLM capacity frees up in time; the caller should retry later."""
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,27 @@
+from typing import Protocol
+from ..entities import Answer
+
+
+class AnswerCache(Protocol):
+    """Outbound port: cache of LLM answers keyed by namespace + question.
+
+    The namespace must capture everything the answer depends on besides the question
+    (profile content version, model). Implementations may match near-duplicate questions.
+    """
+
+    def get(self, namespace: str, question: str) -> Answer | None:
+        ...
+
+    def put(
+        self,
+        namespace: str,
+        question: str,
+        answer: Answer,
+        latency_s: float = 0.0,
+        pinned: bool = False,
+    ) -> None:
+        """Store an answer; `pinned` entries (precomputed answers) never expire by TTL."""
+        ...
+
+    def stats(self) -> dict:
+        ...
@@ -1,12 +1,27 @@
-from typing import Protocol
-from ..entities import Answer
+from typing import AsyncIterator, Protocol
+from ..entities import Answer, ChatMessage
 
 
 class LLMService(Protocol):
     """
     Outbound port: domain layer requests answers from an LLM.
     Concrete implementations live in the infrastructure layer (e.g., OpenAI Chat).
+
+    `history` (earlier turns of the session, oldest first) is only passed when non-empty.
     """
 
-    def answer(self, prompt: str, context_markdown: str) -> Answer:
+    def answer(self, prompt: str, context_markdown: str, history: list[ChatMessage] | None = None) -> Answer:
+        ...
+
+
+class AsyncLLMService(Protocol):
+    """Async variant of `LLMService` used by the non-blocking request path."""
+
+    async def answer(self, prompt: str, context_markdown: str, history: list[ChatMessage] | None = None) -> Answer:
+        ...
+
+    def stream_answer(
+        self, prompt: str, context_markdown: str, history: list[ChatMessage] | None = None
+    ) -> AsyncIterator[str | Answer]:
+        """Yield answer text deltas, finishing with the complete `Answer`."""
         ...
@@ -3,6 +3,13 @@ from typing import Protocol
 class ProfileRepository(Protocol):
     """Outbound port: domain needs profile text but not its source.
     Implementations (file, DB, RAG, etc.) live in infrastructure layer.
+
+    Retrieval-backed implementations may additionally provide
+    `get_relevant_profile_text(question) -> str`, which the use case prefers when present.
     """
     def get_profile_text(self) -> str:
         ...
+
+    def get_profile_version(self) -> str:
+        """Stable identifier of the current profile content (usable as cache key)."""
+        ...
@@ -0,0 +1,19 @@
+from typing import Protocol
+from ..entities import ChatMessage
+
+
+class SessionStore(Protocol):
+    """Outbound port: conversation history per session id.
+
+    Implementations bound their memory (number of sessions, turns per session) and may
+    forget idle sessions; an unknown or expired id simply has an empty history.
+    """
+
+    def get_history(self, session_id: str) -> list[ChatMessage]:
+        ...
+
+    def append(self, session_id: str, messages: list[ChatMessage]) -> None:
+        ...
+
+    def stats(self) -> dict:
+        ...
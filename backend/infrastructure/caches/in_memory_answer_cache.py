@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from ...domain.entities import Answer
+from ...domain.ports.answer_cache import AnswerCache
+from ...application.caching.question_normalization import (
+    normalize_question,
+    question_guard,
+    question_shingles,
+    shingle_similarity,
+)
+
+
+@dataclass
+class _Entry:
+    answer: Answer
+    shingles: frozenset[str]
+    guard: frozenset[str]
+    latency_s: float
+    expires_at: float | None
+
+
+class InMemoryAnswerCache(AnswerCache):
+    """Process-local LRU + TTL answer cache with near-duplicate matching.
+
+    Pinned entries skip TTL expiry but still take part in LRU eviction, so answers of an
+    outdated namespace age out on their own.
+
+    Lookup order: exact match on the normalized question, then the most similar cached
+    question of the same namespace whose trigram similarity reaches `similarity_threshold`
+    and whose numbers and negations are the same (set it to 1.0 to disable fuzzy matching). Stored answers are copied in and out so
+    callers may mutate what they get back.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float | None = 24 * 3600,
+        similarity_threshold: float = 0.9,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple[str, str], _Entry]" = OrderedDict()
+        self._namespaces: dict[str, set[str]] = {}
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        keys = self._namespaces.get(key[0])
+        if keys is not None:
+            keys.discard(key[1])
+            if not keys:
+                del self._namespaces[key[0]]
+
+    def _live(self, key: tuple[str, str], now: float) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= now:
+            self._drop(key)
+            self.evictions += 1
+            return None
+        return entry
+
+    def _hit(self, key: tuple[str, str], entry: _Entry) -> Answer:
+        self._entries.move_to_end(key)
+        self.saved_seconds += entry.latency_s
+        return entry.answer.model_copy(deep=True)
+
+    def get(self, namespace: str, question: str) -> Answer | None:
+        normalized = normalize_question(question)
+        now = self._clock()
+        with self._lock:
+            key = (namespace, normalized)
+            entry = self._live(key, now)
+            if entry is not None:
+                self.hits += 1
+                return self._hit(key, entry)
+
+            if self.similarity_threshold < 1.0:
+                shingles, guard = question_shingles(normalized), question_guard(normalized)
+                best_key, best_score = None, self.similarity_threshold
+                for candidate in list(self._namespaces.get(namespace, ())):
+                    candidate_key = (namespace, candidate)
+                    candidate_entry = self._live(candidate_key, now)
+                    if candidate_entry is None or candidate_entry.guard != guard:
+                        continue
+                    score = shingle_similarity(shingles, candidate_entry.shingles)
+                    if score >= best_score:
+                        best_key, best_score = candidate_key, score
+                if best_key is not None:
+                    self.near_hits += 1
+                    return self._hit(best_key, self._entries[best_key])
+
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        namespace: str,
+        question: str,
+        answer: Answer,
+        latency_s: float = 0.0,
+        pinned: bool = False,
+    ) -> None:
+        normalized = normalize_question(question)
+        if not normalized:
+            return
+        stored = answer.model_copy(deep=True)
+        stored.follow_up_questions = []
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds and not pinned else None
+        key = (namespace, normalized)
+        with self._lock:
+            self._entries[key] = _Entry(
+                stored, question_shingles(normalized), question_guard(normalized), latency_s, expires_at
+            )
+            self._entries.move_to_end(key)
+            self._namespaces.setdefault(namespace, set()).add(normalized)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.near_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "near_hits": self.near_hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.near_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
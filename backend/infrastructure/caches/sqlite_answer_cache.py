@@ -0,0 +1,196 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from ...domain.entities import Answer
+from ...domain.ports.answer_cache import AnswerCache
+from ...application.caching.question_normalization import (
+    normalize_question,
+    question_guard,
+    question_shingles,
+    shingle_similarity,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    namespace TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    latency_s REAL NOT NULL,
+    expires_at REAL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (namespace, question)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used);
+"""
+
+# Recency is only rewritten when older than this, so hot entries don't cost a write per hit
+_TOUCH_INTERVAL_SECONDS = 60.0
+
+
+class SQLiteAnswerCache(AnswerCache):
+    """Answer cache in a local SQLite file, shared by all worker processes on the host.
+
+    Same contract as `InMemoryAnswerCache` (exact, then guarded near-duplicate lookup; TTL with
+    pinned entries exempt; LRU eviction beyond `max_entries`), but entries survive
+    restarts and every uvicorn worker sees what the others stored. The database runs in
+    WAL mode, so readers never block the (short) writes of other processes.
+
+    Expiry uses wall-clock time, which, unlike a monotonic clock, means the same in
+    every process and after a restart. Hit / miss counters are per process.
+
+    Calls can wait on another process's write lock (busy timeout) and scan a namespace,
+    so `blocking_io` tells async callers to run them in a worker thread.
+    """
+
+    blocking_io = True
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 512,
+        ttl_seconds: float | None = 24 * 3600,
+        similarity_threshold: float = 0.9,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Trigram sets + guards of questions seen by this process (recomputed if evicted from here)
+        self._shingles: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads: one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def _question_shingles(self, normalized: str) -> tuple[frozenset[str], frozenset[str]]:
+        shingles = self._shingles.get(normalized)
+        if shingles is None:
+            if len(self._shingles) >= 4 * self.max_entries:
+                self._shingles.clear()
+            shingles = self._shingles[normalized] = (question_shingles(normalized), question_guard(normalized))
+        return shingles
+
+    def _hit(self, conn: sqlite3.Connection, namespace: str, normalized: str, row: tuple, now: float) -> Answer:
+        answer_json, latency_s, _, last_used = row
+        if now - last_used > _TOUCH_INTERVAL_SECONDS:
+            conn.execute(
+                "UPDATE answers SET last_used = ? WHERE namespace = ? AND question = ?",
+                (now, namespace, normalized),
+            )
+        self._count("saved_seconds", latency_s)
+        return Answer.model_validate_json(answer_json)
+
+    def get(self, namespace: str, question: str) -> Answer | None:
+        normalized = normalize_question(question)
+        now = self._clock()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT answer, latency_s, expires_at, last_used FROM answers WHERE namespace = ? AND question = ?",
+            (namespace, normalized),
+        ).fetchone()
+        if row is not None and (row[2] is None or row[2] > now):
+            self._count("hits")
+            return self._hit(conn, namespace, normalized, row, now)
+
+        if self.similarity_threshold < 1.0:
+            shingles, guard = question_shingles(normalized), question_guard(normalized)
+            best, best_score = None, self.similarity_threshold
+            candidates = conn.execute(
+                "SELECT question FROM answers WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, now),
+            ).fetchall()
+            for (candidate,) in candidates:
+                candidate_shingles, candidate_guard = self._question_shingles(candidate)
+                if candidate_guard != guard:
+                    continue
+                score = shingle_similarity(shingles, candidate_shingles)
+                if score >= best_score:
+                    best, best_score = candidate, score
+            if best is not None:
+                row = conn.execute(
+                    "SELECT answer, latency_s, expires_at, last_used FROM answers WHERE namespace = ? AND question = ?",
+                    (namespace, best),
+                ).fetchone()
+                if row is not None:
+                    self._count("near_hits")
+                    return self._hit(conn, namespace, best, row, now)
+
+        self._count("misses")
+        return None
+
+    def put(
+        self,
+        namespace: str,
+        question: str,
+        answer: Answer,
+        latency_s: float = 0.0,
+        pinned: bool = False,
+    ) -> None:
+        normalized = normalize_question(question)
+        if not normalized:
+            return
+        stored = answer.model_copy()
+        stored.follow_up_questions = []
+        now = self._clock()
+        expires_at = now + self.ttl_seconds if self.ttl_seconds and not pinned else None
+        conn = self._connection()
+        with conn:  # one write transaction: upsert + eviction
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO answers (namespace, question, answer, latency_s, expires_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, normalized, stored.model_dump_json(), latency_s, expires_at, now),
+            )
+            expired = conn.execute("DELETE FROM answers WHERE expires_at <= ?", (now,)).rowcount
+            (entries,) = conn.execute("SELECT COUNT(*) FROM answers").fetchone()
+            overflow = max(0, entries - self.max_entries)
+            if overflow:
+                conn.execute(
+                    "DELETE FROM answers WHERE (namespace, question) IN"
+                    " (SELECT namespace, question FROM answers ORDER BY last_used LIMIT ?)",
+                    (overflow,),
+                )
+        if expired or overflow:
+            self._count("evictions", expired + overflow)
+
+    def stats(self) -> dict:
+        (entries,) = self._connection().execute("SELECT COUNT(*) FROM answers").fetchone()
+        with self._lock:
+            lookups = self.hits + self.near_hits + self.misses
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "near_hits": self.near_hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.near_hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "saved_seconds": round(self.saved_seconds, 3),
+            }
+
+
+__all__ = ["SQLiteAnswerCache"]
@@ -9,3 +9,11 @@ class FileProfileSource:
         if not self.md_path.exists():
             raise FileNotFoundError(f"Profile file not found: {self.md_path}")
         return self.md_path.read_text(encoding="utf-8")
+
+    def signature(self) -> tuple[int, int] | None:
+        """Cheap change marker (mtime_ns, size); None if the file is missing."""
+        try:
+            st = self.md_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
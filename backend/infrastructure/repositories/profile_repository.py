@@ -1,5 +1,7 @@
 from pathlib import Path
+import hashlib
 import json
+import threading
 from ...domain.ports.profile_repository import ProfileRepository as ProfileRepositoryPort
 from ..data_sources.file_profile_data_source import FileProfileSource
 
@@ -8,11 +10,20 @@ class FileProfileRepository(ProfileRepositoryPort):
     """Composite repository reading narrative background markdown and structured profile facts (JSON).
 
     Returns a single synthesized markdown blob used as LLM context.
+
+    The blob is cached and only rebuilt when the (mtime, size) signature of one of the
+    source files changes. `get_profile_version()` exposes a short content hash that
+    other layers can use as a cache key.
     """
 
     def __init__(self, path: str | Path, profile_json_path: str | Path | None = None):
         self.background_source = FileProfileSource(Path(path))
         self.profile_json_path = Path(profile_json_path) if profile_json_path else None
+        self._lock = threading.Lock()
+        # (signature, text, version), replaced as a whole so readers never mix generations
+        self._snapshot: tuple[tuple, str, str] | None = None
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _read_background(self) -> str:
         try:
@@ -66,10 +77,59 @@ class FileProfileRepository(ProfileRepositoryPort):
         return "\n".join([s for s in snapshot if s is not None])
 
 
+    def _current_signature(self) -> tuple:
+        facts_sig = None
+        if self.profile_json_path:
+            try:
+                st = self.profile_json_path.stat()
+                facts_sig = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                facts_sig = None
+        return (self.background_source.signature(), facts_sig)
+
+    def load_sources(self) -> tuple[str, dict]:
+        """Raw (background markdown, profile facts) – uncached, for derived indexes."""
+        return self._read_background(), self._read_facts()
+
+    def build_snapshot(self, facts: dict) -> str:
+        return self._build_snapshot(facts)
+
+    def _build(self) -> str:
+        background_md, facts = self.load_sources()
+        snapshot = self._build_snapshot(facts)
+        return snapshot + background_md
+
+    def _refresh(self, record: bool = True) -> tuple[tuple, str, str]:
+        signature = self._current_signature()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == signature:
+            if record:
+                self.cache_hits += 1
+            return snapshot
+        with self._lock:
+            # Another thread may have rebuilt while we waited for the lock
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot[0] == signature:
+                if record:
+                    self.cache_hits += 1
+                return snapshot
+            combined = self._build()
+            version = hashlib.sha256(combined.encode("utf-8")).hexdigest()[:16]
+            self._snapshot = snapshot = (signature, combined, version)
+            self.cache_misses += 1
+            return snapshot
+
     # Public API (Port)
     def get_profile_text(self) -> str:
-        background_md = self._read_background()
-        facts = self._read_facts()
-        snapshot = self._build_snapshot(facts)
-        combined = snapshot + background_md
-        return combined
+        return self._refresh()[1]
+
+    def get_profile_version(self) -> str:
+        """Content hash of the current profile text (changes whenever the files do)."""
+        return self._refresh(record=False)[2]
+
+    def cache_stats(self) -> dict:
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "version": self._snapshot[2] if self._snapshot else "",
+        }
@@ -0,0 +1,60 @@
+import threading
+
+from ...domain.ports.profile_repository import ProfileRepository as ProfileRepositoryPort
+from ..retrieval.bm25_index import BM25Index
+from ..retrieval.profile_chunker import ProfileChunk, chunk_markdown, chunk_profile_facts
+from .profile_repository import FileProfileRepository
+
+
+class RetrievalProfileRepository(ProfileRepositoryPort):
+    """Question-aware profile context backed by a BM25 index over profile chunks.
+
+    `get_relevant_profile_text(question)` returns an always-included core (candidate
+    snapshot + markdown preamble) plus the `top_k` best matching chunks in document order.
+    `get_profile_text()` still returns the full context. The index is rebuilt whenever the
+    underlying file repository reports a new content version.
+    """
+
+    def __init__(self, base: FileProfileRepository, top_k: int = 4):
+        self.base = base
+        self.top_k = top_k
+        self._lock = threading.Lock()
+        # (version, core, chunks, index), replaced as a whole so a reader never pairs a
+        # new index with old chunks
+        self._state: tuple[str | None, str, tuple[ProfileChunk, ...], BM25Index] = (None, "", (), BM25Index([]))
+
+    def _ensure_index(self) -> tuple[str | None, str, tuple[ProfileChunk, ...], BM25Index]:
+        version = self.base.get_profile_version()
+        state = self._state
+        if version == state[0]:
+            return state
+        with self._lock:
+            state = self._state
+            if version == state[0]:
+                return state
+            background_md, facts = self.base.load_sources()
+            md_chunks = chunk_markdown(background_md)
+            # Text before the first section heading (name/title line) belongs to the core
+            preamble = [c for c in md_chunks if not c.title]
+            chunks = tuple([c for c in md_chunks if c.title] + chunk_profile_facts(facts))
+            core = self.base.build_snapshot(facts) + "\n\n".join(c.text for c in preamble)
+            index = BM25Index([f"{c.title}\n{c.text}" for c in chunks])
+            self._state = state = (version, core, chunks, index)
+            return state
+
+    # Public API (Port)
+    def get_profile_text(self) -> str:
+        return self.base.get_profile_text()
+
+    def get_profile_version(self) -> str:
+        return f"{self.base.get_profile_version()}-rag{self.top_k}"
+
+    def get_relevant_profile_text(self, question: str) -> str:
+        _, core, chunks, index = self._ensure_index()
+        hits = index.search(question, self.top_k)
+        selected = sorted(i for i, _ in hits)
+        parts = [core.rstrip()] + [chunks[i].text for i in selected]
+        return "\n\n".join(p for p in parts if p)
+
+    def cache_stats(self) -> dict:
+        return {**self.base.cache_stats(), "retrieval_chunks": len(self._state[2])}
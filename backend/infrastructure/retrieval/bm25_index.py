@@ -0,0 +1,71 @@
+"""Small in-memory BM25 (Okapi) index for the profile chunks.
+
+Pure Python on purpose: the corpus is a few dozen chunks, so building the index at
+load time costs well under a millisecond and needs no extra dependency.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import List, Sequence
+
+_TOKEN = re.compile(r"[a-z0-9äöüß]+(?:[+#][a-z0-9+#]*)?")
+
+_STOPWORDS = frozenset(
+    """a an and are as at be by can do does did for from has have how i in is it its
+    me my of on or so that the their there these this to was what when where which who
+    why will with you your yours about into also any been did not""".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.casefold()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+class BM25Index:
+    def __init__(self, documents: Sequence[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._term_freqs: List[Counter] = [Counter(tokenize(doc)) for doc in documents]
+        self._lengths = [sum(tf.values()) for tf in self._term_freqs]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        doc_freq: Counter = Counter()
+        for tf in self._term_freqs:
+            doc_freq.update(tf.keys())
+        n = len(self._term_freqs)
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._term_freqs)
+
+    def scores(self, query: str) -> List[float]:
+        terms = [t for t in set(tokenize(query)) if t in self._idf]
+        result = [0.0] * len(self._term_freqs)
+        if not terms or not self._avg_length:
+            return result
+        k1, b, avg = self.k1, self.b, self._avg_length
+        for i, tf in enumerate(self._term_freqs):
+            norm = k1 * (1 - b + b * self._lengths[i] / avg)
+            score = 0.0
+            for term in terms:
+                f = tf.get(term)
+                if f:
+                    score += self._idf[term] * f * (k1 + 1) / (f + norm)
+            result[i] = score
+        return result
+
+    def search(self, query: str, top_k: int) -> List[tuple[int, float]]:
+        """Indices + scores of the best `top_k` documents with a positive score."""
+        ranked = sorted(
+            ((i, s) for i, s in enumerate(self.scores(query)) if s > 0),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return ranked[:top_k]
+
+
+__all__ = ["BM25Index", "tokenize"]
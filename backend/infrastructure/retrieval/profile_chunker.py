@@ -0,0 +1,72 @@
+"""Split the profile sources into retrievable chunks.
+
+- background markdown: one chunk per `##`/`###` section (parent heading kept as prefix)
+- profile.json: one chunk per fact section (each experience entry on its own)
+
+Contact details and references are deliberately not chunked: the full-context mode never
+sends them to the model either.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(frozen=True)
+class ProfileChunk:
+    title: str
+    text: str
+    source: str  # "background" | "facts"
+
+
+def chunk_markdown(markdown: str) -> List[ProfileChunk]:
+    chunks: List[ProfileChunk] = []
+    parent = ""
+    title = ""
+    lines: List[str] = []
+
+    def _flush() -> None:
+        body = "\n".join(lines).strip()
+        if body:
+            chunks.append(ProfileChunk(title=title, text=body, source="background"))
+
+    for line in markdown.splitlines():
+        if line.startswith("## ") or line.startswith("### "):
+            _flush()
+            heading = line.lstrip("#").strip()
+            if line.startswith("## "):
+                parent = heading
+                title = heading
+            else:
+                title = f"{parent} / {heading}" if parent else heading
+            lines = [line]
+        else:
+            lines.append(line)
+    _flush()
+    return chunks
+
+
+def chunk_profile_facts(facts: dict) -> List[ProfileChunk]:
+    chunks: List[ProfileChunk] = []
+
+    def _add(title: str, body: str) -> None:
+        if body.strip():
+            chunks.append(ProfileChunk(title=title, text=f"**{title}:** {body}", source="facts"))
+
+    skills = facts.get("skills", {})
+    for kind, items in skills.items() if isinstance(skills, dict) else []:
+        _add(f"Skills ({kind})", ", ".join(map(str, items)))
+    for item in facts.get("experience", []) or []:
+        if isinstance(item, dict):
+            title = f"Experience – {item.get('role', '')} at {item.get('company', '')}"
+            _add(title, f"{item.get('years', '')}. {item.get('summary', '')}")
+    _add("Education", "; ".join(map(str, facts.get("education", []) or [])))
+    languages = facts.get("languages", {}) or {}
+    _add("Languages", ", ".join(f"{k} ({v})" for k, v in languages.items()))
+    _add("Interests", ", ".join(map(str, facts.get("interests", []) or [])))
+    _add("Highlights", " ".join(map(str, facts.get("highlights", []) or [])))
+    return chunks
+
+
+__all__ = ["ProfileChunk", "chunk_markdown", "chunk_profile_facts"]
@@ -0,0 +1,144 @@
+"""Incremental extraction of the `answer` string from a streamed JSON object.
+
+The model streams a JSON document like `{"answer": "...", "highlights": [...], ...}` in
+arbitrary chunks. `AnswerStreamParser.feed` returns the newly decoded characters of the
+top-level `answer` value as soon as they arrive (escapes included, even when split across
+chunks), so the delivery layer can forward them before the object is complete.
+"""
+
+from __future__ import annotations
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class AnswerStreamParser:
+    def __init__(self, field: str = "answer"):
+        self.field = field
+        self._chunks: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._string_is_value = False
+        self._escape = False
+        self._key_chars: list[str] = []
+        self._last_key: str | None = None
+        self._awaiting_value = False
+        # Answer value decoding
+        self._streaming = False
+        self._field_done = False
+        self._unicode_digits: str | None = None
+        self._high_surrogate: int | None = None
+
+    @property
+    def raw(self) -> str:
+        """Everything fed so far (the complete JSON document once the stream ended)."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> str:
+        self._chunks.append(chunk)
+        out: list[str] = []
+        for c in chunk:
+            if self._streaming:
+                self._feed_value_char(c, out)
+            else:
+                self._feed_structure_char(c)
+        return "".join(out)
+
+    def _feed_value_char(self, c: str, out: list[str]) -> None:
+        if self._unicode_digits is not None:
+            self._unicode_digits += c
+            if len(self._unicode_digits) == 4:
+                self._emit_code_unit(int(self._unicode_digits, 16), out)
+                self._unicode_digits = None
+            return
+        if self._escape:
+            self._escape = False
+            if c == "u":
+                self._unicode_digits = ""
+            else:
+                self._flush_surrogate(out)
+                out.append(_SIMPLE_ESCAPES.get(c, c))
+            return
+        if c == "\\":
+            self._escape = True
+            return
+        self._flush_surrogate(out)
+        if c == '"':
+            self._streaming = False
+            self._field_done = True
+            self._awaiting_value = False
+            return
+        out.append(c)
+
+    def _emit_code_unit(self, code: int, out: list[str]) -> None:
+        if 0xD800 <= code <= 0xDBFF:
+            self._flush_surrogate(out)
+            self._high_surrogate = code
+            return
+        if 0xDC00 <= code <= 0xDFFF and self._high_surrogate is not None:
+            combined = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+            self._high_surrogate = None
+            out.append(chr(combined))
+            return
+        self._flush_surrogate(out)
+        out.append(chr(code))
+
+    def _flush_surrogate(self, out: list[str]) -> None:
+        if self._high_surrogate is not None:
+            out.append("�")
+            self._high_surrogate = None
+
+    def _feed_structure_char(self, c: str) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+                self._key_chars.append(c)
+            elif c == "\\":
+                self._escape = True
+            elif c == '"':
+                self._in_string = False
+                if self._string_is_value:
+                    if self._depth == 1:
+                        self._awaiting_value = False
+                elif self._depth == 1:
+                    self._last_key = "".join(self._key_chars)
+            elif not self._string_is_value:
+                self._key_chars.append(c)
+            return
+
+        if c == '"':
+            if self._depth == 1 and self._awaiting_value:
+                if self._last_key == self.field and not self._field_done:
+                    self._streaming = True
+                    return
+                self._string_is_value = True
+            else:
+                self._string_is_value = self._depth != 1
+            self._in_string = True
+            self._key_chars = []
+        elif c in "{[":
+            if self._depth == 1:
+                self._awaiting_value = False
+            self._depth += 1
+        elif c in "}]":
+            self._depth -= 1
+        elif c == ":":
+            if self._depth == 1:
+                self._awaiting_value = True
+        elif c == ",":
+            if self._depth == 1:
+                self._awaiting_value = False
+        elif not c.isspace() and self._depth == 1:
+            # Start of a literal value (number, true, false, null)
+            self._awaiting_value = False
+
+
+__all__ = ["AnswerStreamParser"]
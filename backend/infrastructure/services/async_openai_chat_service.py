@@ -0,0 +1,85 @@
+import os
+from typing import AsyncIterator, List, Dict, Any
+from openai import AsyncOpenAI
+
+from ...domain.ports.llm_service import AsyncLLMService
+from ...domain.entities import Answer, ChatMessage
+from .openai_prompt import build_messages, parse_answer
+from .llm_usage import UsageStats, usage_from_response
+from .answer_stream_parser import AnswerStreamParser
+from .openai_retry import RetryPolicy
+from ...application.observability.metrics import stage
+
+
+class AsyncOpenAIChatService(AsyncLLMService):
+    """AsyncOpenAI based twin of `OpenAIChatService`.
+
+    Awaits the HTTP round trip (and tenacity back-off sleeps) on the event loop instead of
+    occupying a threadpool worker, so one process can keep hundreds of chats in flight.
+    """
+
+    def __init__(
+        self,
+        model: str | None = None,
+        api_key: str | None = None,
+        usage_stats: UsageStats | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        self.model = model or os.getenv("LLM_MODEL", "gpt-4o-mini")
+        self.usage_stats = usage_stats or UsageStats()
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Retries are owned by `retry_policy` (deadline-aware), not the SDK
+        self.client = AsyncOpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"), max_retries=0)
+
+    async def aclose(self) -> None:
+        await self.client.close()
+
+    async def _create(self, messages: List[Dict[str, Any]], stream: bool = False):  # noqa: ANN202
+        extra: Dict[str, Any] = {"stream": True, "stream_options": {"include_usage": True}} if stream else {}
+
+        async def _call(timeout: float):  # noqa: ANN202
+            return await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                timeout=timeout,
+                **extra,
+            )
+
+        return await self.retry_policy.acall(_call)
+
+    # Public API (Port)
+    async def answer(self, prompt: str, context_markdown: str, history: list[ChatMessage] | None = None) -> Answer:
+        """Generate an answer enforcing JSON output with required keys."""
+        messages = build_messages(prompt, context_markdown, history)
+        response = await self._create(messages)
+        self.usage_stats.record(usage_from_response(response.usage), self.model)
+        raw = response.choices[0].message.content or ""
+        with stage("parse"):
+            return parse_answer(raw)
+
+    async def stream_answer(
+        self, prompt: str, context_markdown: str, history: list[ChatMessage] | None = None
+    ) -> AsyncIterator[str | Answer]:
+        """Stream `answer` text deltas as they arrive, then yield the validated `Answer`.
+
+        Only opening the stream is retried; once tokens flow a failure propagates.
+        """
+        messages = build_messages(prompt, context_markdown, history)
+        stream = await self._create(messages, stream=True)
+        parser = AnswerStreamParser()
+        async for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                # Final chunk (include_usage) carries usage and no choices
+                self.usage_stats.record(usage_from_response(chunk.usage), self.model)
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if not content:
+                continue
+            delta = parser.feed(content)
+            if delta:
+                yield delta
+        with stage("parse"):
+            answer = parse_answer(parser.raw)
+        yield answer
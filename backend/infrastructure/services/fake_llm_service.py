@@ -0,0 +1,118 @@
+"""Offline stand-ins for the OpenAI adapters (load tests, local development).
+
+Behaviour is described by `FakeLLMProfile`:
+- latency: "fixed:S", "uniform:LO,HI" or "lognormal:MEDIAN,SIGMA" (seconds)
+- error_rate: probability that a call fails with `FakeLLMError`
+- answer_words: length of the generated answer
+
+No network access or API key is needed. Select with `LLM_PROVIDER=fake`.
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
+
+from ...domain.ports.llm_service import LLMService, AsyncLLMService
+from ...domain.entities import Answer
+
+_FILLER = (
+    "I designed and shipped production LLM features end to end, from evaluation sets and "
+    "prompt iterations to monitoring, and I worked closely with product to measure impact"
+).split()
+
+
+class FakeLLMError(RuntimeError):
+    """Injected upstream failure."""
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Build a latency sampler (seconds) from a "kind:params" spec."""
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",")] if params else []
+    kind = kind.strip().lower()
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        low, high = values
+        return lambda rng: rng.uniform(low, high)
+    if kind == "lognormal" and len(values) == 2:
+        median, sigma = values
+        return lambda rng: rng.lognormvariate(math.log(median), sigma)
+    raise ValueError(f"Invalid latency spec {spec!r} (fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA)")
+
+
+@dataclass
+class FakeLLMProfile:
+    latency: str = "lognormal:0.8,0.5"
+    error_rate: float = 0.0
+    answer_words: int = 60
+    seed: int | None = None
+    model: str = "fake"
+    _sampler: Callable[[random.Random], float] = field(init=False, repr=False)
+    _rng: random.Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self):
+        self._sampler = parse_latency(self.latency)
+        self._rng = random.Random(self.seed)
+
+    def draw(self) -> tuple[float, bool]:
+        """(latency seconds, fails?) for one call."""
+        with self._lock:
+            return max(0.0, self._sampler(self._rng)), self._rng.random() < self.error_rate
+
+    def answer_for(self, prompt: str) -> Answer:
+        words = [_FILLER[i % len(_FILLER)] for i in range(max(1, self.answer_words))]
+        text = f"Regarding \"{prompt[:60]}\": " + " ".join(words) + "."
+        return Answer(answer=text, highlights=["Fake highlight"], follow_up_questions=[])
+
+
+class FakeLLMService(LLMService):
+    """Blocking fake: sleeps for the sampled latency (occupies the calling thread)."""
+
+    def __init__(self, profile: FakeLLMProfile):
+        self.profile = profile
+        self.model = profile.model
+
+    def answer(self, prompt: str, context_markdown: str, history=None) -> Answer:
+        latency, fails = self.profile.draw()
+        time.sleep(latency)
+        if fails:
+            raise FakeLLMError("Injected fake LLM failure")
+        return self.profile.answer_for(prompt)
+
+
+class AsyncFakeLLMService(AsyncLLMService):
+    """Async fake; streams the answer word by word spread over the sampled latency."""
+
+    def __init__(self, profile: FakeLLMProfile):
+        self.profile = profile
+        self.model = profile.model
+
+    async def aclose(self) -> None:
+        return None
+
+    async def answer(self, prompt: str, context_markdown: str, history=None) -> Answer:
+        latency, fails = self.profile.draw()
+        await asyncio.sleep(latency)
+        if fails:
+            raise FakeLLMError("Injected fake LLM failure")
+        return self.profile.answer_for(prompt)
+
+    async def stream_answer(self, prompt: str, context_markdown: str, history=None) -> AsyncIterator[str | Answer]:
+        latency, fails = self.profile.draw()
+        answer = self.profile.answer_for(prompt)
+        words = answer.answer.split(" ")
+        # ~30% of the latency before the first token, the rest spread over the words
+        await asyncio.sleep(latency * 0.3)
+        if fails:
+            raise FakeLLMError("Injected fake LLM failure")
+        step = latency * 0.7 / len(words)
+        for index, word in enumerate(words):
+            yield word if index == 0 else " " + word
+            await asyncio.sleep(step)
+        yield answer
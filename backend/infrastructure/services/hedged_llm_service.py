@@ -0,0 +1,142 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import AsyncIterator
+
+from ...domain.ports.llm_service import AsyncLLMService
+from ...domain.entities import Answer, FallbackAnswer, SubstituteAnswer, UncacheableAnswer
+
+
+class HedgedLLMService(AsyncLLMService):
+    """Tail-latency hedging around an async LLM service.
+
+    If the primary call is still running after the hedge delay (a percentile of recent
+    primary latencies), a second request goes to `hedge` (e.g. the same or a faster
+    fallback model). The first valid `Answer` wins and the other call is cancelled; if one
+    fails or returns a `FallbackAnswer` (unparseable output), the other is still awaited.
+
+    Hedges are capped at `max_hedge_ratio` of the calls in the recent window, so extra
+    spend stays bounded even when the upstream is slow across the board. Streams are not
+    hedged (they are delegated to the primary).
+
+    A winning answer from a hedge service with a different model is returned as a
+    `SubstituteAnswer`, which callers do not cache under the primary model's namespace.
+    Primaries cancelled by a winning hedge record their elapsed time as a lower bound of
+    their latency, so slow calls still push the hedge delay up.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncLLMService,
+        hedge: AsyncLLMService | None = None,
+        percentile: float = 95.0,
+        min_delay_seconds: float = 1.0,
+        initial_delay_seconds: float = 8.0,
+        max_hedge_ratio: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.primary = primary
+        self.hedge = hedge or primary
+        self.model = getattr(primary, "model", "")
+        self.percentile = percentile
+        self.min_delay_seconds = min_delay_seconds
+        self.initial_delay_seconds = initial_delay_seconds
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._recent_hedged: deque[bool] = deque(maxlen=window)
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.skipped_by_budget = 0
+
+    async def aclose(self) -> None:
+        for service in {id(self.primary): self.primary, id(self.hedge): self.hedge}.values():
+            close = getattr(service, "aclose", None)
+            if close is not None:
+                await close()
+
+    def hedge_delay(self) -> float:
+        """Current hedge delay: `percentile` of recent primary latencies (nearest rank)."""
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay_seconds
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(self.percentile / 100 * len(ordered)))
+        return max(self.min_delay_seconds, ordered[rank - 1])
+
+    def _may_hedge(self) -> bool:
+        hedged_recently = sum(self._recent_hedged)
+        if hedged_recently + 1 > self.max_hedge_ratio * len(self._recent_hedged):
+            self.skipped_by_budget += 1
+            return False
+        return True
+
+    async def _timed_primary(self, prompt: str, context_markdown: str, **kwargs) -> Answer:
+        started = time.monotonic()
+        try:
+            answer = await self.primary.answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+        except asyncio.CancelledError:
+            self._latencies.append(time.monotonic() - started)
+            raise
+        self._latencies.append(time.monotonic() - started)
+        return answer
+
+    async def answer(self, prompt: str, context_markdown: str, **kwargs) -> Answer:
+        self.calls += 1
+        self._recent_hedged.append(False)
+        delay = self.hedge_delay()
+        primary = asyncio.ensure_future(self._timed_primary(prompt, context_markdown, **kwargs))
+        hedge: asyncio.Future | None = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._may_hedge():
+                return await primary
+            self.hedged += 1
+            self._recent_hedged[-1] = True
+            hedge = asyncio.ensure_future(
+                self.hedge.answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+            )
+            pending = {primary, hedge}
+            fallback: asyncio.Future | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    if not isinstance(task.result(), FallbackAnswer):
+                        return self._winner(task, hedge)
+                    # Unparseable output: only served if the other call has nothing better
+                    fallback = fallback or task
+            if fallback is not None:
+                return self._winner(fallback, hedge)
+            # Both failed: surface the primary's error
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def _winner(self, task: asyncio.Future, hedge: asyncio.Future) -> Answer:
+        answer = task.result()
+        if task is not hedge:
+            return answer
+        self.hedge_wins += 1
+        if isinstance(answer, UncacheableAnswer) or getattr(self.hedge, "model", self.model) == self.model:
+            return answer
+        return SubstituteAnswer(**answer.model_dump())
+
+    def stream_answer(self, prompt: str, context_markdown: str, **kwargs) -> AsyncIterator[str | Answer]:
+        return self.primary.stream_answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_rate": round(self.hedged / self.calls, 4) if self.calls else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "hedge_win_ratio": round(self.hedge_wins / self.hedged, 4) if self.hedged else 0.0,
+            "skipped_by_budget": self.skipped_by_budget,
+            "hedge_delay_s": round(self.hedge_delay(), 3),
+        }
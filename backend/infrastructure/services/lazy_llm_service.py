@@ -0,0 +1,72 @@
+"""Deferred construction of LLM adapters (lazy container wiring).
+
+The OpenAI adapters pull in the SDK (several hundred ms of imports) and build an HTTP
+client. Behind these proxies that happens on the first call, or earlier via `resolve()`
+from a background task, instead of while the process starts.
+"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Generic, TypeVar
+
+from ...domain.ports.llm_service import LLMService, AsyncLLMService
+from ...domain.entities import Answer
+
+S = TypeVar("S")
+
+
+class _Lazy(Generic[S]):
+    def __init__(self, factory: Callable[[], S], model: str = ""):
+        self._factory = factory
+        self._service: S | None = None
+        self._lock = threading.Lock()
+        self.model = model
+
+    @property
+    def constructed(self) -> bool:
+        return self._service is not None
+
+    def resolve(self) -> S:
+        """The wrapped service, constructed exactly once (thread-safe)."""
+        service = self._service
+        if service is None:
+            with self._lock:
+                if self._service is None:
+                    self._service = self._factory()
+                service = self._service
+        return service
+
+    async def aresolve(self) -> S:
+        """`resolve()` without blocking the event loop: construction (or waiting for the
+        prewarm thread that holds the lock) happens in a worker thread."""
+        service = self._service
+        if service is None:
+            service = await asyncio.to_thread(self.resolve)
+        return service
+
+
+class LazyLLMService(_Lazy[LLMService], LLMService):
+    def answer(self, prompt: str, context_markdown: str, **kwargs) -> Answer:
+        return self.resolve().answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+
+
+class LazyAsyncLLMService(_Lazy[AsyncLLMService], AsyncLLMService):
+    async def aclose(self) -> None:
+        # Nothing to release if it was never built
+        close = getattr(self._service, "aclose", None)
+        if close is not None:
+            await close()
+
+    async def answer(self, prompt: str, context_markdown: str, **kwargs) -> Answer:
+        service = await self.aresolve()
+        return await service.answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+
+    def stream_answer(self, prompt: str, context_markdown: str, **kwargs) -> AsyncIterator[str | Answer]:
+        if self._service is not None:
+            return self._service.stream_answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+        return self._stream_once_resolved(prompt, context_markdown, **kwargs)
+
+    async def _stream_once_resolved(self, prompt: str, context_markdown: str, **kwargs) -> AsyncIterator[str | Answer]:
+        service = await self.aresolve()
+        async for item in service.stream_answer(prompt=prompt, context_markdown=context_markdown, **kwargs):
+            yield item
@@ -0,0 +1,45 @@
+from typing import AsyncIterator
+
+from ...domain.ports.llm_service import LLMService, AsyncLLMService
+from ...domain.entities import Answer
+from ...application.concurrency.concurrency_limiter import ConcurrencyLimiter
+
+
+class ConcurrencyLimitedLLMService(LLMService):
+    """Runs every call of the wrapped service inside a `ConcurrencyLimiter` slot.
+
+    The adapter's own retries happen inside the slot, so they never add upstream
+    concurrency. Raises `OverloadedError` when no slot frees up in time.
+    """
+
+    def __init__(self, inner: LLMService, limiter: ConcurrencyLimiter):
+        self.inner = inner
+        self.limiter = limiter
+        self.model = getattr(inner, "model", "")
+
+    def answer(self, prompt: str, context_markdown: str, **kwargs) -> Answer:
+        with self.limiter.slot():
+            return self.inner.answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+
+
+class AsyncConcurrencyLimitedLLMService(AsyncLLMService):
+    """Async twin of `ConcurrencyLimitedLLMService`; a stream holds its slot until it ends."""
+
+    def __init__(self, inner: AsyncLLMService, limiter: ConcurrencyLimiter):
+        self.inner = inner
+        self.limiter = limiter
+        self.model = getattr(inner, "model", "")
+
+    async def aclose(self) -> None:
+        close = getattr(self.inner, "aclose", None)
+        if close is not None:
+            await close()
+
+    async def answer(self, prompt: str, context_markdown: str, **kwargs) -> Answer:
+        async with self.limiter.slot_async():
+            return await self.inner.answer(prompt=prompt, context_markdown=context_markdown, **kwargs)
+
+    async def stream_answer(self, prompt: str, context_markdown: str, **kwargs) -> AsyncIterator[str | Answer]:
+        async with self.limiter.slot_async():
+            async for item in self.inner.stream_answer(prompt=prompt, context_markdown=context_markdown, **kwargs):
+                yield item
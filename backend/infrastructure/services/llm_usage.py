@@ -0,0 +1,88 @@
+"""Token usage reported by the provider, incl. prompt-cache hits.
+
+`usage.prompt_tokens_details.cached_tokens` tells how much of the prompt was served from
+OpenAI's automatic prompt cache. Older SDK versions do not type the field, so it is read
+defensively (attribute or plain dict).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+from ...application.observability.metrics import METRICS, TOKEN_BUCKETS
+
+logger = logging.getLogger("ai_portfolio")
+
+USAGE_TOKENS = METRICS.histogram(
+    "llm_usage_tokens", "Provider-reported tokens per LLM response", ("kind",), buckets=TOKEN_BUCKETS
+)
+
+
+@dataclass(frozen=True)
+class LLMUsage:
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+
+
+def _field(obj, name: str) -> int:
+    if obj is None:
+        return 0
+    value = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+    return int(value or 0)
+
+
+def usage_from_response(usage) -> LLMUsage | None:  # noqa: ANN001 (SDK CompletionUsage)
+    if usage is None:
+        return None
+    details = usage.get("prompt_tokens_details") if isinstance(usage, dict) else getattr(
+        usage, "prompt_tokens_details", None
+    )
+    return LLMUsage(
+        prompt_tokens=_field(usage, "prompt_tokens"),
+        completion_tokens=_field(usage, "completion_tokens"),
+        cached_tokens=_field(details, "cached_tokens"),
+    )
+
+
+class UsageStats:
+    """Thread-safe running totals across requests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.cache_hit_requests = 0
+
+    def record(self, usage: LLMUsage | None, model: str = "") -> None:
+        if usage is None:
+            return
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += usage.prompt_tokens
+            self.completion_tokens += usage.completion_tokens
+            self.cached_tokens += usage.cached_tokens
+            if usage.cached_tokens:
+                self.cache_hit_requests += 1
+        USAGE_TOKENS.observe(usage.prompt_tokens, "prompt")
+        USAGE_TOKENS.observe(usage.completion_tokens, "completion")
+        logger.info(
+            "LLM usage model=%s prompt=%d cached=%d completion=%d",
+            model,
+            usage.prompt_tokens,
+            usage.cached_tokens,
+            usage.completion_tokens,
+        )
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cached_tokens": self.cached_tokens,
+                "cached_token_ratio": self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0,
+                "cache_hit_request_ratio": self.cache_hit_requests / self.requests if self.requests else 0.0,
+            }
@@ -0,0 +1,87 @@
+"""Prompt assembly and response parsing shared by the OpenAI chat adapters.
+
+Message layout is prefix-cache friendly: the static system prompt comes first, the
+profile context second, then the (compacted) conversation history and the per-request
+question last. The first two messages are built once (system prompt at import, context
+message once per distinct context string) and reused as identical objects, so the
+serialized prefix is byte-stable across requests and the provider's automatic prompt
+caching can hit.
+"""
+
+import json
+from functools import lru_cache
+from typing import Iterable, List, Dict, Any
+from pydantic import ValidationError
+
+from ...domain.entities import Answer, ChatMessage, FallbackAnswer
+
+
+def _schema_description() -> str:
+    # Build schema description from the Answer model
+    _ans_schema = Answer.model_json_schema()
+    _schema_core = {
+        "type": _ans_schema.get("type", "object"),
+        "properties": _ans_schema.get("properties", {}),
+        "required": _ans_schema.get("required", []),
+    }
+    return json.dumps(_schema_core, separators=(",", ":"), sort_keys=True)
+
+
+SYSTEM_PROMPT = (
+    f"""System: You are an assistant specializing in answering questions specifically about a job candidate's qualifications, experience, and fit for a particular role within AI-focused companies (e.g., AI Engineers, AI Software Engineers).
+
+    Your output MUST strictly follow this schema: {_schema_description()}
+
+    Guidelines:
+    - Respond ONLY with a valid JSON object. No markdown, no code fences, no explanations outside JSON.
+    - The "answer" should sound natural and human, as if the candidate is speaking directly, but remain concise (2–4 sentences).
+    - Always write the "answer" in first-person singular ("I") perspective of the candidate (e.g., "I live in Germany", "I worked on AI systems", "I am Marc"). Never use third-person references like "the candidate", "he", "she".
+    - "highlights" should emphasize remarkable achievements, distinctive skills, or unusual aspects that strengthen the answer. They must not be verbatim repeats of the "answer". There is no highlight needed for factual information.
+    - Set "follow_up_questions" to an empty array []; it will be populated by the system after your response.
+    - If information is unavailable, set "answer" to "I don't know about this topic. But I got some suggestions on related topics." and leave "highlights" empty.
+    - Always provide arrays, even if empty.
+    - Ensure output is valid JSON (parsable, no trailing commas).
+    - Use English only.
+    - Do not invent information; only rely on the candidate’s knowledge base.
+    - If multiple possible interpretations exist, choose the most relevant to AI/Software Engineering context.
+    """
+)
+
+_SYSTEM_MESSAGE: Dict[str, Any] = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+@lru_cache(maxsize=16)
+def _context_message(context_markdown: str) -> Dict[str, Any]:
+    # Keyed on the context string: one entry per profile version (full mode)
+    return {"role": "system", "content": f"Context (Markdown):\n{context_markdown}"}
+
+
+def build_messages(
+    prompt: str, context_markdown: str, history: Iterable[ChatMessage] | None = None
+) -> List[Dict[str, Any]]:
+    """Build the chat messages for one question, in prefix-cache friendly order:
+
+    1. system prompt with the JSON schema instructions (shared object)
+    2. profile context (one shared object per distinct context string)
+    3. the (compacted) session history, if any
+    4. the question, asking for a JSON object matching the schema
+
+    JSON mode is requested by the adapters; `parse_answer` validates the output.
+    """
+    return [
+        _SYSTEM_MESSAGE,
+        _context_message(context_markdown),
+        *({"role": m.role, "content": m.content} for m in history or ()),
+        {
+            "role": "user",
+            "content": f"Question:\n{prompt}\n\nReturn ONLY a JSON object matching the schema.",
+        },
+    ]
+
+
+def parse_answer(raw: str) -> Answer:
+    """Validate the model output; fall back to wrapping raw text as answer."""
+    try:
+        return Answer.model_validate_json(raw)
+    except (json.JSONDecodeError, ValidationError):
+        return FallbackAnswer(answer=raw, highlights=[], follow_up_questions=[])
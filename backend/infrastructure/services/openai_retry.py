@@ -0,0 +1,172 @@
+"""Retry policy for OpenAI calls: error-class aware, bounded by a per-request deadline.
+
+- Retryable: timeouts / connection errors, 408, 409, 429 (rate limit, honouring the
+  server's `retry-after(-ms)` header), 5xx.
+- Permanent (raised immediately): auth, permission, bad request, not found, 422 and
+  429 `insufficient_quota`.
+- Every attempt gets `timeout=min(attempt_timeout, time left)`, and a retry is only
+  started if its back-off sleep ends before the deadline (with room for a short attempt).
+
+The OpenAI SDK's own retries must be disabled (`max_retries=0`) so this is the only
+retry layer.
+"""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import openai
+from tenacity import AsyncRetrying, RetryCallState, Retrying, retry_if_exception
+
+from .retry_stats import RetryStats
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS = {408, 409, 429}
+# Don't start an attempt that cannot realistically finish in what is left
+_MIN_ATTEMPT_SECONDS = 1.0
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (openai.APITimeoutError, openai.APIConnectionError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        if exc.status_code == 429 and getattr(exc, "code", None) == "insufficient_quota":
+            return False
+        return exc.status_code in _RETRYABLE_STATUS or exc.status_code >= 500
+    return False
+
+
+def error_reason(exc: BaseException) -> str:
+    if isinstance(exc, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(exc, openai.APIConnectionError):
+        return "connection"
+    if isinstance(exc, openai.APIStatusError):
+        return str(exc.status_code)
+    return type(exc).__name__
+
+
+def server_retry_after(exc: BaseException) -> float | None:
+    """Delay requested by the server (`retry-after-ms` / `retry-after`), if any."""
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        deadline_seconds: float = 30.0,
+        attempt_timeout_seconds: float = 20.0,
+        backoff_base_seconds: float = 0.5,
+        backoff_max_seconds: float = 8.0,
+        stats: RetryStats | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.deadline_seconds = deadline_seconds
+        self.attempt_timeout_seconds = attempt_timeout_seconds
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.stats = stats or RetryStats()
+        self.clock = clock
+
+    # tenacity hooks (the planned sleep is computed once in `_stop` and reused by `_wait`)
+    def _backoff(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception()
+        requested = server_retry_after(exc)
+        if requested is not None:
+            return requested
+        cap = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (retry_state.attempt_number - 1))
+        return random.uniform(cap / 2, cap)  # jitter: spread synchronized retries
+
+    def _make_stop(self, deadline: float) -> Callable[[RetryCallState], bool]:
+        def _stop(retry_state: RetryCallState) -> bool:
+            exc = retry_state.outcome.exception()
+            sleep_s = self._backoff(retry_state)
+            out_of_attempts = retry_state.attempt_number >= self.max_attempts
+            out_of_time = self.clock() + sleep_s + _MIN_ATTEMPT_SECONDS > deadline
+            if out_of_attempts or out_of_time:
+                self.stats.record_failure(permanent=False, deadline=out_of_time and not out_of_attempts)
+                return True
+            retry_state.planned_sleep = sleep_s
+            self.stats.record_retry(error_reason(exc), sleep_s)
+            return False
+
+        return _stop
+
+    @staticmethod
+    def _wait(retry_state: RetryCallState) -> float:
+        return getattr(retry_state, "planned_sleep", 0.0)
+
+    def _retrying_kwargs(self, deadline: float) -> dict:
+        return {
+            "stop": self._make_stop(deadline),
+            "wait": self._wait,
+            "retry": retry_if_exception(is_retryable),
+            "reraise": True,
+        }
+
+    def _attempt_timeout(self, deadline: float) -> float:
+        return max(0.001, min(self.attempt_timeout_seconds, deadline - self.clock()))
+
+    def _failed(self, exc: BaseException, started: float) -> None:
+        self.stats.record_attempt(failed_after=self.clock() - started)
+        if not is_retryable(exc):
+            self.stats.record_failure(permanent=True, deadline=False)
+
+    # Public API
+    def call(self, fn: Callable[[float], T]) -> T:
+        """Run `fn(timeout)` with retries; `timeout` is the budget for that attempt."""
+        self.stats.record_call()
+        deadline = self.clock() + self.deadline_seconds
+
+        def _attempt() -> T:
+            started = self.clock()
+            try:
+                result = fn(self._attempt_timeout(deadline))
+            except Exception as e:
+                self._failed(e, started)
+                raise
+            self.stats.record_attempt()
+            return result
+
+        return Retrying(**self._retrying_kwargs(deadline))(_attempt)
+
+    async def acall(self, fn: Callable[[float], Awaitable[T]]) -> T:
+        """Async twin of `call`; back-off sleeps are awaited on the event loop."""
+        self.stats.record_call()
+        deadline = self.clock() + self.deadline_seconds
+
+        async def _attempt() -> T:
+            started = self.clock()
+            try:
+                result = await fn(self._attempt_timeout(deadline))
+            except Exception as e:
+                self._failed(e, started)
+                raise
+            self.stats.record_attempt()
+            return result
+
+        return await AsyncRetrying(**self._retrying_kwargs(deadline))(_attempt)
+
+
+__all__ = ["RetryPolicy", "RetryStats", "is_retryable", "server_retry_after"]
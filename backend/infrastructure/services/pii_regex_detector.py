@@ -1,30 +1,134 @@
+"""Single-pass regex PII detector.
+
+All categories are compiled into one alternation of named groups. At a given position the
+first alternative wins, which is how overlaps are resolved: the more specific, checksum-
+validated categories (IBAN, credit card) come before the generic phone pattern. If a match
+fails its checksum, the remaining categories are tried at the same position.
+
+Every category needs an anchor character ('@', a digit or ':') in or right next to the
+match. One regex scan collects windows of whitespace-delimited tokens holding an anchor,
+joined across separator-only tokens ("-", "/") and widened by one neighbouring token (e.g.
+the street name before a house number), and the combined matcher only runs inside those
+windows. Plain prose is skipped without trying
+every alternative at every character.
+"""
+
 import re
-from typing import List
+from typing import Callable, List
 from ...domain.entities import PIIFinding
 from ...domain.ports.pii_detector import PIIDetector
 
-_EMAIL = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
-_PHONE = re.compile(r"\b\+?\d[\d ()-]{7,}\d\b")
-_STREET = re.compile(r"\b\d{1,4}\s+[A-ZÄÖÜa-zäöüß]+(?:straße|str\.|Street|Road|Rd|Ave|Allee)\b")
 
-_PATTERNS = [
-    ("EMAIL", _EMAIL, "medium"),
-    ("PHONE", _PHONE, "medium"),
-    ("ADDRESS", _STREET, "medium"),
+def _luhn_valid(value: str) -> bool:
+    digits = [int(c) for c in value if c.isdigit()]
+    if not 13 <= len(digits) <= 19:
+        return False
+    total = 0
+    for i, d in enumerate(reversed(digits)):
+        if i % 2:
+            d *= 2
+            if d > 9:
+                d -= 9
+        total += d
+    return total % 10 == 0
+
+
+def _iban_valid(value: str) -> bool:
+    compact = value.replace(" ", "").upper()
+    if not 15 <= len(compact) <= 34:
+        return False
+    rearranged = compact[4:] + compact[:4]
+    numeric = "".join(str(int(c, 36)) for c in rearranged)
+    return int(numeric) % 97 == 1
+
+
+def _ipv6_compressed_valid(value: str) -> bool:
+    # Before "::", need two groups or one longer than two characters ("fe80::1",
+    # "2001:db8::1"), so code tokens like "fe::add" are not taken for addresses
+    head = value.split("::", 1)[0].split(":")
+    return len(head) >= 2 or any(len(group) > 2 for group in head)
+
+
+_OCTET = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+_H16 = r"[0-9A-Fa-f]{1,4}"
+
+# (category, pattern, severity, validator) – order defines priority at the same position
+_CATEGORIES: list[tuple[str, str, str, Callable[[str], bool] | None]] = [
+    ("EMAIL", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", "medium", None),
+    ("IBAN", r"\b[A-Z]{2}\d{2}(?: ?[A-Z0-9]{4}){2,7}(?: ?[A-Z0-9]{1,3})?\b", "high", _iban_valid),
+    ("CREDIT_CARD", r"\b\d(?:[ -]?\d){12,18}\b", "high", _luhn_valid),
+    ("IP_ADDRESS", rf"\b{_OCTET}(?:\.{_OCTET}){{3}}\b", "low", None),
+    ("IP_ADDRESS", rf"(?<![\w:])(?:{_H16}:){{7}}{_H16}(?![\w:])", "low", None),
+    ("IP_ADDRESS", rf"(?<![\w:])(?:{_H16}:){{1,6}}:(?:{_H16}(?::{_H16}){{0,5}})?(?![\w:])", "low", _ipv6_compressed_valid),
+    # Swiss: +41 / 0041 / 0, then 2-3-2-2 digits (e.g. +41 71 123 45 67, 079 123 45 67)
+    ("PHONE", r"(?<![\w+])(?:\+41|0041|0)[ ]?\(?0?\d{2}\)?[ ]?\d{3}[ ]?\d{2}[ ]?\d{2}\b", "medium", None),
+    # German: +49 / 0049 / 0, area code, subscriber number with common separators
+    ("PHONE", r"(?<![\w+])(?:\+49|0049|0)[ ]?\(?0?\d{2,5}\)?[ /-]?\d{3,8}(?:[ -]?\d{1,5})?\b", "medium", None),
+    ("PHONE", r"(?<![\w+])\+?\d[\d ()-]{7,}\d\b", "medium", None),
+    ("ADDRESS", r"\b\d{1,4}\s+[A-ZÄÖÜa-zäöüß]+(?:straße|str\.|Street|Road|Rd|Ave|Allee)\b", "medium", None),
+    ("ADDRESS", r"\b[A-ZÄÖÜ][a-zäöüß]+(?:straße|strasse|str\.|gasse|weg|allee|platz)\s+\d{1,4}[a-z]?\b", "medium", None),
 ]
 
+_GROUPS = [f"g{i}" for i in range(len(_CATEGORIES))]
+_COMBINED = re.compile("|".join(f"(?P<{g}>{c[1]})" for g, c in zip(_GROUPS, _CATEGORIES)))
+_SINGLE = [re.compile(c[1]) for c in _CATEGORIES]
+_GROUP_INDEX = {g: i for i, g in enumerate(_GROUPS)}
+# Candidate windows: runs of tokens holding an anchor ('@', digit, ':'), each optionally
+# preceded by one plain token (street name before a house number), plus one trailing token.
+# Separator-only tokens ("-", "--", "/", "(") inside a run never break it, so numbers split
+# by loose punctuation ("0171 - - 1234567") stay in one window.
+_ANCHORED = r"\S*?[@\d:]\S*"
+_SEPARATOR = r"[-./()+]+"
+_WINDOW = re.compile(
+    rf"(?<!\S)(?:\S+\s+)??{_ANCHORED}(?:\s+(?:{_SEPARATOR}\s+)*(?:\S+\s+)??{_ANCHORED})*(?:\s+\S+)?"
+)
+
+
 class RegexPIIDetector(PIIDetector):
     def detect(self, text: str) -> List[PIIFinding]:
         findings: List[PIIFinding] = []
-        for category, pattern, severity in _PATTERNS:
-            for m in pattern.finditer(text):
-                findings.append(
-                    PIIFinding(
-                        category=category,
-                        value=m.group(0),
-                        start=m.start(),
-                        end=m.end(),
-                        severity=severity,
-                    )
-                )
+        search = _COMBINED.search
+        pos = 0
+        for window in _WINDOW.finditer(text):
+            window_start, window_end = window.span()
+            pos = max(pos, window_start)
+            while pos < window_end:
+                m = search(text, pos, window_end)
+                if m is None:
+                    break
+                pos = self._accept(text, m, window_end, findings)
         return findings
+
+    def _accept(self, text: str, m: re.Match, window_end: int, findings: List[PIIFinding]) -> int:
+        """Validate one match, record the finding and return the next scan position."""
+        index = _GROUP_INDEX[m.lastgroup]
+        start, end = m.start(), m.end()
+        validator = _CATEGORIES[index][3]
+        if validator is not None and not validator(m.group()):
+            # Fall back to the lower-priority categories at the same position
+            index, end = self._fallback(text, start, window_end, index + 1)
+            if index < 0:
+                return start + 1
+        category, _, severity, _ = _CATEGORIES[index]
+        findings.append(
+            # Values come straight from the regex – skip pydantic validation
+            PIIFinding.model_construct(
+                category=category,
+                value=text[start:end],
+                start=start,
+                end=end,
+                severity=severity,
+            )
+        )
+        return end if end > start else start + 1
+
+    @staticmethod
+    def _fallback(text: str, start: int, window_end: int, first_index: int) -> tuple[int, int]:
+        for index in range(first_index, len(_CATEGORIES)):
+            m = _SINGLE[index].match(text, start, window_end)
+            if m is None or m.end() == start:
+                continue
+            validator = _CATEGORIES[index][3]
+            if validator is None or validator(m.group()):
+                return index, m.end()
+        return -1, start
@@ -0,0 +1,54 @@
+"""Retry counters, kept apart from `openai_retry` so the container can create them
+without importing the OpenAI SDK / tenacity (lazy wiring)."""
+
+import threading
+
+
+class RetryStats:
+    """Thread-safe retry counters shared by the sync and async adapters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.permanent_errors = 0
+        self.deadline_exhausted = 0
+        self.wasted_seconds = 0.0  # failed attempts + back-off sleeps
+        self.retries_by_reason: dict[str, int] = {}
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def record_attempt(self, failed_after: float | None = None) -> None:
+        with self._lock:
+            self.attempts += 1
+            if failed_after is not None:
+                self.wasted_seconds += failed_after
+
+    def record_retry(self, reason: str, sleep_s: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.wasted_seconds += sleep_s
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+
+    def record_failure(self, permanent: bool, deadline: bool) -> None:
+        with self._lock:
+            self.failures += 1
+            self.permanent_errors += int(permanent)
+            self.deadline_exhausted += int(deadline)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "failures": self.failures,
+                "permanent_errors": self.permanent_errors,
+                "deadline_exhausted": self.deadline_exhausted,
+                "wasted_seconds": round(self.wasted_seconds, 3),
+                "retries_by_reason": dict(self.retries_by_reason),
+            }
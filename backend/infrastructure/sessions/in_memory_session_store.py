@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+from ...domain.entities import ChatMessage
+from ...domain.ports.session_store import SessionStore
+
+
+@dataclass
+class _Session:
+    messages: deque = field(default_factory=deque)
+    chars: int = 0
+    last_seen: float = 0.0
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local session histories with LRU + idle-TTL eviction.
+
+    Memory is bounded three ways: at most `max_sessions` sessions (least recently used
+    evicted first), at most `max_messages` messages per session and `max_message_chars`
+    characters per message (oldest messages / message tails dropped first).
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        ttl_seconds: float | None = 3600,
+        max_messages: int = 40,
+        max_message_chars: int = 4000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.max_messages = max_messages
+        self.max_message_chars = max_message_chars
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self.evictions = 0
+        self.expirations = 0
+
+    def _live(self, session_id: str, now: float) -> _Session | None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        if self.ttl_seconds is not None and now - session.last_seen > self.ttl_seconds:
+            del self._sessions[session_id]
+            self.expirations += 1
+            return None
+        self._sessions.move_to_end(session_id)
+        session.last_seen = now
+        return session
+
+    def get_history(self, session_id: str) -> list[ChatMessage]:
+        with self._lock:
+            session = self._live(session_id, self._clock())
+            return list(session.messages) if session else []
+
+    def append(self, session_id: str, messages: list[ChatMessage]) -> None:
+        with self._lock:
+            now = self._clock()
+            session = self._live(session_id, now)
+            if session is None:
+                session = self._sessions[session_id] = _Session(last_seen=now)
+            for message in messages:
+                if len(message.content) > self.max_message_chars:
+                    message = ChatMessage(role=message.role, content=message.content[: self.max_message_chars])
+                session.messages.append(message)
+                session.chars += len(message.content)
+            while len(session.messages) > self.max_messages:
+                session.chars -= len(session.messages.popleft().content)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "messages": sum(len(s.messages) for s in self._sessions.values()),
+                "chars": sum(s.chars for s in self._sessions.values()),
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,98 @@
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:  # optional: brotli is ~15-25% smaller than gzip on JSON at similar CPU
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Never buffered or compressed: events must reach the client as they are produced
+_UNCOMPRESSED_TYPES = ("text/event-stream",)
+
+
+def accepted_encoding(accept_encoding: str, brotli_available: bool = brotli is not None) -> str | None:
+    """Preferred supported coding ("br", then "gzip") the client accepts, if any."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    for coding in (("br", "gzip") if brotli_available else ("gzip",)):
+        if accepted.get(coding, accepted.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def compress(body: bytes, coding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    if coding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware: gzip / brotli for single-body responses of at least
+    `minimum_size` bytes (batch results, cache stats, metrics).
+
+    Server-Sent Events, responses that are already encoded and streamed bodies pass
+    through untouched, so streaming latency is unaffected; small chat answers are not
+    worth the CPU. Brotli is used when the `brotli` package is installed.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        coding = accepted_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if "content-encoding" in headers or headers.get("content-type", "").startswith(_UNCOMPRESSED_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message  # held until the body shows whether it's worth it
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+            compressed = compress(body, coding, self.gzip_level, self.brotli_quality)
+            headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+            headers["content-encoding"] = coding
+            headers["content-length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send({**start_message, "headers": headers.raw})
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+__all__ = ["CompressionMiddleware", "accepted_encoding", "compress"]
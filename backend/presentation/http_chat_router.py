@@ -1,30 +1,134 @@
+import math
+import logging
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends, Body, HTTPException
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from ..application.controllers.chat_controller import (
-    ChatController, ChatRequest, ChatResponse
+    ChatController, ChatRequest, ChatResponse, ChatBatchRequest, ChatBatchResponse
 )
 from ..container import Container
-from ..domain.errors import PIIBlockedError
+from ..application.observability.metrics import METRICS
+from ..domain.errors import DomainError, PIIBlockedError, OverloadedError
+from .responses import FastJSONResponse, dumps
+
+logger = logging.getLogger("ai_portfolio")
+
+
+def _pii_blocked(e: PIIBlockedError) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail={
+            "error": "PII_BLOCKED",
+            "message": str(e),
+            "findings": getattr(e, "findings", []),
+        },
+    )
+
+
+def _overloaded(e: OverloadedError) -> HTTPException:
+    retry_after = max(1, math.ceil(e.retry_after))
+    return HTTPException(
+        status_code=429,
+        detail={"error": "OVERLOADED", "message": str(e), "retry_after": retry_after},
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def _sse(event: str, payload: dict) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + dumps(payload) + b"\n\n"
+
+
+async def _sse_stream(
+    first: tuple[str, dict] | None, events: AsyncIterator[tuple[str, dict]]
+) -> AsyncIterator[bytes]:
+    try:
+        if first is not None:
+            yield _sse(*first)
+        async for event, payload in events:
+            yield _sse(event, payload)
+    except OverloadedError as e:
+        yield _sse("error", {"type": "overloaded", "message": str(e), "retry_after": max(1, math.ceil(e.retry_after))})
+    except DomainError as e:
+        yield _sse("error", {"type": "domain_error", "message": str(e)})
+    except Exception:  # noqa: BLE001 (headers already sent; report in-band)
+        logger.exception("Chat stream failed")
+        yield _sse("error", {"type": "server_error", "message": "Internal server error"})
+
 
 def get_chat_router(container: "Container") -> APIRouter:
     api_router = APIRouter()
 
+    # Async dependency: resolved on the event loop instead of a threadpool worker
+    async def get_chat_controller() -> ChatController:
+        return container.chat_controller
 
     @api_router.post("/v1/chat", response_model=ChatResponse)
-    def chat(
+    async def chat(
         req: ChatRequest = Body(...),
-        chat_controller: ChatController = Depends(lambda: container.chat_controller),
-    ) -> ChatResponse:
+        chat_controller: ChatController = Depends(get_chat_controller),
+    ) -> FastJSONResponse:
+        # Returning a Response skips FastAPI's response_model re-validation / encoding
         try:
-            return chat_controller.handle(req)
+            return FastJSONResponse(await chat_controller.handle_async(req))
         except PIIBlockedError as e:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "PII_BLOCKED",
-                    "message": str(e),
-                    "findings": getattr(e, "findings", []),
-                },
-            )
+            raise _pii_blocked(e)
+        except OverloadedError as e:
+            raise _overloaded(e)
+
+    @api_router.post("/v1/chat/batch", response_model=ChatBatchResponse)
+    async def chat_batch(
+        req: ChatBatchRequest = Body(...),
+        chat_controller: ChatController = Depends(get_chat_controller),
+    ) -> FastJSONResponse:
+        """Answer up to 100 independent questions concurrently; per-item results in input order."""
+        return FastJSONResponse(await chat_controller.handle_batch(req))
+
+    @api_router.post("/v1/chat/stream")
+    async def chat_stream(
+        req: ChatRequest = Body(...),
+        chat_controller: ChatController = Depends(get_chat_controller),
+    ) -> StreamingResponse:
+        """Server-Sent Events: `delta` events carry answer text, `final` the full response.
+
+        The first event is awaited before responding, so a saturated LLM limit still
+        surfaces as a plain 429 + Retry-After rather than an in-band error.
+        """
+        try:
+            events = chat_controller.stream(req)
+            first = await anext(events, None)
+        except PIIBlockedError as e:
+            raise _pii_blocked(e)
+        except OverloadedError as e:
+            raise _overloaded(e)
+        return StreamingResponse(
+            _sse_stream(first, events),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @api_router.get("/v1/cache/stats")
+    async def cache_stats() -> dict:
+        """Hit/miss counters of the profile context, answer and provider prompt caches
+        plus single-flight deduplication, LLM concurrency limiter state, retry
+        and hedging counters and session store size."""
+        profile_stats = getattr(container.profile_repository, "cache_stats", None)
+        return {
+            "profile": profile_stats() if profile_stats else None,
+            "answers": container.answer_cache.stats() if container.answer_cache else None,
+            "prompt_cache": container.llm_usage.snapshot(),
+            "coalescing": container.coalescer.stats() if container.coalescer else None,
+            "llm_concurrency": container.llm_limiter.stats() if container.llm_limiter else None,
+            "llm_retries": container.llm_retry_stats.snapshot(),
+            "llm_hedging": container.llm_hedging.stats() if container.llm_hedging else None,
+            "sessions": container.session_store.stats() if container.session_store else None,
+        }
+
+    if container.settings.metrics_enabled:
+        @api_router.get("/metrics", response_class=PlainTextResponse)
+        async def metrics() -> PlainTextResponse:
+            """Prometheus text exposition (stage histograms, in-flight, tokens, retries)."""
+            return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4")
 
     return api_router
@@ -0,0 +1,96 @@
+import time
+from typing import Iterable
+
+from ..application.observability.metrics import METRICS, MetricsRegistry, Family, start_request_timings
+
+
+def server_timing(timings: list[tuple[str, float]], total_ms: float) -> str:
+    """`Server-Timing` value; repeated stages (e.g. two cache lookups) are summed."""
+    merged: dict[str, float] = {}
+    for name, ms in timings:
+        merged[name] = merged.get(name, 0.0) + ms
+    parts = [f"{name};dur={ms:.1f}" for name, ms in merged.items()]
+    parts.append(f"app;dur={total_ms:.1f}")
+    return ", ".join(parts)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: in-flight gauge, request duration histogram per route and a
+    `Server-Timing` header (stages completed before the response starts) on chat routes.
+
+    Pure ASGI rather than `BaseHTTPMiddleware`, so streamed responses pass through
+    untouched and the endpoint runs in the context holding the request's timings.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = METRICS, server_timing_prefix: str = "/v1/chat"):
+        self.app = app
+        self.server_timing_prefix = server_timing_prefix
+        self.in_flight = registry.gauge("http_requests_in_flight", "HTTP requests currently being served")
+        self.duration = registry.histogram(
+            "http_request_duration_seconds", "HTTP request duration until the response ends", ("route", "method", "status")
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timings = start_request_timings()
+        started = time.perf_counter()
+        add_header = scope["path"].startswith(self.server_timing_prefix)
+        status = "500"
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+                if add_header:
+                    value = server_timing(timings, (time.perf_counter() - started) * 1000)
+                    message = {**message, "headers": [*message.get("headers", []), (b"server-timing", value.encode())]}
+            await send(message)
+
+        self.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            self.in_flight.dec()
+            # Route template (set by routing) keeps label cardinality bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            self.duration.observe(time.perf_counter() - started, route, scope["method"], status)
+
+
+def _counters(prefix: str, help: str, values: dict, keys: Iterable[str]) -> Iterable[Family]:
+    for key in keys:
+        if key in values:
+            yield f"{prefix}_{key}_total", "counter", f"{help} ({key})", [({}, values[key])]
+
+
+def register_container_collectors(container, registry: MetricsRegistry = METRICS) -> None:
+    """Export counters that components already keep (read only at scrape time)."""
+
+    def collect() -> Iterable[Family]:
+        usage = container.llm_usage.snapshot()
+        yield from _counters("llm", "LLM token usage", usage, ("prompt_tokens", "completion_tokens", "cached_tokens"))
+        yield "llm_responses_total", "counter", "LLM responses with usage", [({}, usage["requests"])]
+        retries = container.llm_retry_stats.snapshot()
+        yield from _counters(
+            "llm_retry", "LLM retry policy", retries, ("attempts", "retries", "failures", "deadline_exhausted")
+        )
+        yield (
+            "llm_retries_by_reason_total", "counter", "LLM retries by error reason",
+            [({"reason": reason}, count) for reason, count in sorted(retries["retries_by_reason"].items())],
+        )
+        if container.answer_cache is not None:
+            answers = container.answer_cache.stats()
+            yield from _counters("answer_cache", "Answer cache", answers, ("hits", "near_hits", "misses", "evictions"))
+            yield "answer_cache_entries", "gauge", "Answer cache entries", [({}, answers["entries"])]
+        if container.coalescer is not None:
+            yield from _counters("coalescer", "Request coalescing", container.coalescer.stats(), ("upstream_calls", "deduplicated"))
+        if container.llm_limiter is not None:
+            limiter = container.llm_limiter.stats()
+            yield "llm_concurrency_active", "gauge", "LLM calls holding a slot", [({}, limiter["active"])]
+            yield "llm_concurrency_waiting", "gauge", "LLM calls waiting for a slot", [({}, limiter["waiting"])]
+            yield from _counters("llm_concurrency", "LLM concurrency limiter", limiter, ("rejected", "timed_out"))
+        if container.llm_hedging is not None:
+            yield from _counters("llm_hedge", "LLM hedging", container.llm_hedging.stats(), ("hedged", "hedge_wins"))
+
+    registry.set_collector("container", collect)
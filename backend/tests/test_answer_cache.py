@@ -0,0 +1,158 @@
+from backend.application.use_cases.answer_questions_use_case import AnswerQuestionUseCase
+from backend.domain.entities import Answer, FallbackAnswer
+from backend.infrastructure.caches.in_memory_answer_cache import InMemoryAnswerCache
+from backend.infrastructure.caches.sqlite_answer_cache import SQLiteAnswerCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLLM:
+    model = "test-model"
+    def __init__(self):
+        self.calls = 0
+    def answer(self, prompt: str, context_markdown: str) -> Answer:
+        self.calls += 1
+        return Answer(answer=f"Answer {self.calls}", highlights=[], follow_up_questions=[])
+
+
+class StaticRepo:
+    def get_profile_text(self) -> str:
+        return "Profile"
+
+
+def _answer(text: str) -> Answer:
+    return Answer(answer=text, highlights=[], follow_up_questions=[])
+
+
+def test_normalized_and_near_duplicate_hits():
+    cache = InMemoryAnswerCache(similarity_threshold=0.8)
+    cache.put("v1:m", "How did you enable AI‑assisted content production at simpleclub?", _answer("A"))
+    assert cache.get("v1:m", "how did you enable AI-assisted content production at simpleclub").answer == "A"
+    assert cache.get("v1:m", "How did you enable AI assisted content production at simple club?").answer == "A"
+    assert cache.get("v2:m", "How did you enable AI-assisted content production at simpleclub?") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["near_hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_unrelated_question_misses():
+    cache = InMemoryAnswerCache(similarity_threshold=0.9)
+    cache.put("ns", "What is your experience with Python?", _answer("A"))
+    assert cache.get("ns", "What is your experience with Java?") is None
+
+
+def test_ttl_and_lru_eviction():
+    clock = FakeClock()
+    cache = InMemoryAnswerCache(max_entries=2, ttl_seconds=10, similarity_threshold=1.0, clock=clock)
+    cache.put("ns", "one", _answer("1"))
+    cache.put("ns", "two", _answer("2"))
+    cache.get("ns", "one")
+    cache.put("ns", "three", _answer("3"))  # evicts least recently used "two"
+    assert cache.get("ns", "two") is None
+    clock.now = 11
+    assert cache.get("ns", "one") is None
+
+
+def test_use_case_serves_repeated_question_from_cache():
+    llm = CountingLLM()
+    uc = AnswerQuestionUseCase(StaticRepo(), llm, answer_cache=InMemoryAnswerCache())
+    first = uc.execute("What project are you most proud of?")
+    second = uc.execute("what project are you most proud of")
+    assert llm.calls == 1
+    assert first.answer == second.answer
+    assert second.follow_up_questions
+
+
+def test_sqlite_cache_is_shared_between_instances_and_survives_restarts(tmp_path):
+    path = tmp_path / "answers.sqlite3"
+    worker_a = SQLiteAnswerCache(path, similarity_threshold=0.8)
+    worker_b = SQLiteAnswerCache(path, similarity_threshold=0.8)
+    worker_a.put("ns", "What project are you most proud of?", _answer("A"), latency_s=2.0)
+    assert worker_b.get("ns", "what project are you most proud of").answer == "A"
+    assert worker_b.get("ns", "What projects are you most proud of?").answer == "A"
+    assert worker_b.get("other", "What project are you most proud of?") is None
+    stats = worker_b.stats()
+    assert (stats["entries"], stats["hits"], stats["near_hits"], stats["misses"]) == (1, 1, 1, 1)
+    assert SQLiteAnswerCache(path).get("ns", "What project are you most proud of?").answer == "A"
+
+
+def test_sqlite_cache_ttl_pinning_and_lru_eviction(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteAnswerCache(tmp_path / "answers.sqlite3", max_entries=2, ttl_seconds=300, similarity_threshold=1.0, clock=clock)
+    cache.put("ns", "one", _answer("1"), pinned=True)
+    clock.now = 1
+    cache.put("ns", "two", _answer("2"))
+    clock.now = 100
+    cache.get("ns", "one")
+    cache.put("ns", "three", _answer("3"))  # evicts least recently used "two"
+    assert cache.get("ns", "two") is None
+    clock.now = 1000
+    assert cache.get("ns", "three") is None
+    assert cache.get("ns", "one").answer == "1"
+
+
+def test_use_case_with_sqlite_cache(tmp_path):
+    llm = CountingLLM()
+    uc = AnswerQuestionUseCase(StaticRepo(), llm, answer_cache=SQLiteAnswerCache(tmp_path / "answers.sqlite3"))
+    first = uc.execute("What project are you most proud of?")
+    second = uc.execute("what project are you most proud of")
+    assert llm.calls == 1
+    assert first.answer == second.answer
+    assert second.follow_up_questions
+
+
+def test_near_duplicates_must_agree_on_numbers_and_negations(tmp_path):
+    for cache in (InMemoryAnswerCache(), SQLiteAnswerCache(tmp_path / "answers.sqlite3")):
+        cache.put("ns", "What did you work on between 2021 and 2022?", _answer("A"))
+        cache.put("ns", "Why should we hire you for this role?", _answer("B"))
+        assert cache.get("ns", "What did you work on between 2021 and 2023?") is None
+        assert cache.get("ns", "Why should we not hire you for this role?") is None
+        assert cache.get("ns", "Why shouldn't we hire you for this role?") is None
+        assert cache.get("ns", "What did you work on between 2021 and 2022 ?!").answer == "A"
+
+
+def test_fallback_answers_are_not_cached():
+    class UnparseableLLM(CountingLLM):
+        def answer(self, prompt: str, context_markdown: str) -> Answer:
+            self.calls += 1
+            return FallbackAnswer(answer="not json", highlights=[], follow_up_questions=[])
+
+    llm = UnparseableLLM()
+    cache = InMemoryAnswerCache()
+    uc = AnswerQuestionUseCase(StaticRepo(), llm, answer_cache=cache)
+    uc.execute("What project are you most proud of?")
+    uc.execute("What project are you most proud of?")
+    assert llm.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_async_paths_run_blocking_cache_io_off_the_event_loop(tmp_path):
+    import asyncio
+    import threading
+
+    class RecordingSQLiteCache(SQLiteAnswerCache):
+        threads: list[int] = []
+
+        def get(self, namespace, question):
+            self.threads.append(threading.get_ident())
+            return super().get(namespace, question)
+
+        def put(self, namespace, question, answer, latency_s=0.0, pinned=False):
+            self.threads.append(threading.get_ident())
+            super().put(namespace, question, answer, latency_s=latency_s, pinned=pinned)
+
+    cache = RecordingSQLiteCache(tmp_path / "answers.sqlite3")
+    uc = AnswerQuestionUseCase(StaticRepo(), CountingLLM(), answer_cache=cache)
+
+    async def main() -> int:
+        await uc.execute_async("What project are you most proud of?")
+        await uc.execute_async("What project are you most proud of?")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert len(cache.threads) == 3  # miss, put, hit
+    assert loop_thread not in cache.threads
@@ -0,0 +1,23 @@
+import json
+from backend.infrastructure.services.answer_stream_parser import AnswerStreamParser
+
+
+def _feed_in_chunks(doc: str, size: int) -> tuple[str, AnswerStreamParser]:
+    parser = AnswerStreamParser()
+    out = "".join(parser.feed(doc[i:i + size]) for i in range(0, len(doc), size))
+    return out, parser
+
+
+def test_streams_answer_across_chunk_boundaries():
+    text = 'I built "X"\nat simpleclub \\ 😀'
+    doc = json.dumps({"highlights": ["answer"], "answer": text, "follow_up_questions": []})
+    for size in (1, 2, 3, 7):
+        out, parser = _feed_in_chunks(doc, size)
+        assert out == text
+        assert parser.raw == doc
+
+
+def test_ignores_nested_answer_keys():
+    doc = json.dumps({"meta": {"answer": "nested"}, "answer": "top"})
+    out, _ = _feed_in_chunks(doc, 4)
+    assert out == "top"
@@ -0,0 +1,76 @@
+import asyncio
+from pathlib import Path
+
+from backend.application.suggestions.follow_up_questions_catalog import load_suggestion_prompts
+from backend.application.use_cases.answer_questions_use_case import AnswerQuestionUseCase
+from backend.application.warmup.answer_warm_up import AnswerWarmUp, default_questions
+from backend.config import Settings
+from backend.domain.entities import Answer
+from backend.infrastructure.caches.in_memory_answer_cache import InMemoryAnswerCache
+
+
+class VersionedRepo:
+    def __init__(self, version: str):
+        self.version = version
+    def get_profile_text(self) -> str:
+        return "Profile"
+    def get_profile_version(self) -> str:
+        return self.version
+
+
+class CountingAsyncLLM:
+    def __init__(self):
+        self.calls = 0
+    async def answer(self, prompt: str, context_markdown: str) -> Answer:
+        self.calls += 1
+        return Answer(answer=f"Precomputed: {prompt}", highlights=[], follow_up_questions=[])
+
+
+def _warm_up(tmp_path, repo, llm):
+    cache = InMemoryAnswerCache()
+    uc = AnswerQuestionUseCase(repo, llm, settings=Settings(), async_llm_service=llm, answer_cache=cache)
+    warm_up = AnswerWarmUp(uc, cache, tmp_path / "precomputed.json", concurrency=2)
+    return uc, warm_up
+
+
+def test_generates_persists_and_reuses(tmp_path):
+    llm = CountingAsyncLLM()
+    uc, warm_up = _warm_up(tmp_path, VersionedRepo("v1"), llm)
+    result = asyncio.run(warm_up.run())
+    assert result["generated"] == len(default_questions()) == llm.calls
+
+    # Clicking a catalog question is now a cache hit
+    ans = uc.execute("What project are you most proud of?")
+    assert ans.answer.startswith("Precomputed:")
+    assert llm.calls == len(default_questions())
+
+    # Fresh process, same profile + model: loaded from file, no LLM calls
+    llm_restart = CountingAsyncLLM()
+    _, warm_up_restart = _warm_up(tmp_path, VersionedRepo("v1"), llm_restart)
+    assert asyncio.run(warm_up_restart.run())["generated"] == 0
+    assert llm_restart.calls == 0
+
+    # Profile changed: everything is regenerated
+    llm_changed = CountingAsyncLLM()
+    _, warm_up_changed = _warm_up(tmp_path, VersionedRepo("v2"), llm_changed)
+    assert asyncio.run(warm_up_changed.run())["generated"] == len(default_questions())
+
+
+def test_only_the_lock_holder_generates(tmp_path):
+    import fcntl
+
+    llm = CountingAsyncLLM()
+    _, warm_up = _warm_up(tmp_path, VersionedRepo("v1"), llm)
+    with open(tmp_path / "precomputed.json.lock", "a") as other_worker:
+        fcntl.flock(other_worker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        assert asyncio.run(warm_up.run())["generated"] == 0
+    assert llm.calls == 0
+    assert asyncio.run(warm_up.run())["generated"] == len(default_questions())
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_suggestion_prompts_come_from_the_shared_file():
+    prompts = load_suggestion_prompts(Path(__file__).resolve().parents[2] / "data" / "suggestion_prompts.json")
+    assert prompts
+    assert len(default_questions(prompts)) >= len(default_questions())
+    assert load_suggestion_prompts("missing.json") == []
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.application.concurrency.concurrency_limiter import ConcurrencyLimiter
+from backend.domain.entities import Answer
+from backend.domain.errors import OverloadedError
+from backend.infrastructure.services.limited_llm_service import AsyncConcurrencyLimitedLLMService
+
+
+class GatedAsyncLLM:
+    model = "test-model"
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.gate = asyncio.Event()
+    async def answer(self, prompt: str, context_markdown: str) -> Answer:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await self.gate.wait()
+        self.running -= 1
+        return Answer(answer=prompt, highlights=[], follow_up_questions=[])
+
+
+def test_full_queue_fails_fast_with_retry_after():
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=0, max_wait_seconds=5)
+    with limiter.slot():
+        with pytest.raises(OverloadedError) as exc:
+            with limiter.slot():
+                pass
+    assert exc.value.retry_after >= 1
+    assert limiter.stats()["rejected"] == 1
+    with limiter.slot():  # slot was released
+        pass
+
+
+def test_queued_caller_times_out():
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1, max_wait_seconds=0.05)
+    with limiter.slot():
+        with pytest.raises(OverloadedError):
+            with limiter.slot():
+                pass
+    stats = limiter.stats()
+    assert (stats["timed_out"], stats["waiting"], stats["active"]) == (1, 0, 0)
+
+
+def test_released_slot_is_handed_to_waiting_thread():
+    limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1, max_wait_seconds=2)
+    entered, done = threading.Event(), threading.Event()
+
+    def waiter():
+        with limiter.slot():
+            entered.set()
+            done.wait(2)
+
+    with limiter.slot():
+        t = threading.Thread(target=waiter)
+        t.start()
+        while limiter.stats()["waiting"] == 0:
+            time.sleep(0.001)
+    assert entered.wait(2)
+    assert limiter.stats()["active"] == 1
+    done.set()
+    t.join(2)
+    assert limiter.stats()["active"] == 0
+
+
+def test_async_wrapper_bounds_concurrency_and_rejects_overflow():
+    llm = GatedAsyncLLM()
+    limiter = ConcurrencyLimiter(max_concurrent=2, max_queue=2, max_wait_seconds=2)
+    service = AsyncConcurrencyLimitedLLMService(llm, limiter)
+
+    async def run():
+        tasks = [asyncio.create_task(service.answer(f"q{i}", "ctx")) for i in range(5)]
+        await asyncio.sleep(0.01)
+        llm.gate.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert [r.answer for r in results if isinstance(r, Answer)] == ["q0", "q1", "q2", "q3"]
+    assert isinstance(results[4], OverloadedError)
+    assert llm.peak == 2
+    stats = limiter.stats()
+    assert (stats["active"], stats["waiting"], stats["admitted"]) == (0, 0, 4)
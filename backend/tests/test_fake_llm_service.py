@@ -0,0 +1,43 @@
+import asyncio
+import random
+
+import pytest
+
+from backend.domain.entities import Answer
+from backend.infrastructure.services.fake_llm_service import (
+    AsyncFakeLLMService,
+    FakeLLMError,
+    FakeLLMProfile,
+    FakeLLMService,
+    parse_latency,
+)
+
+
+def test_latency_specs():
+    rng = random.Random(1)
+    assert parse_latency("fixed:0.5")(rng) == 0.5
+    assert 0.1 <= parse_latency("uniform:0.1,0.2")(rng) <= 0.2
+    samples = sorted(parse_latency("lognormal:1.0,0.5")(rng) for _ in range(2000))
+    assert 0.9 < samples[1000] < 1.1
+    with pytest.raises(ValueError):
+        parse_latency("gamma:1")
+
+
+def test_sync_fake_answers_and_injects_errors():
+    ok = FakeLLMService(FakeLLMProfile(latency="fixed:0", answer_words=5))
+    answer = ok.answer("What did you build?", "ctx")
+    assert "What did you build?" in answer.answer
+    failing = FakeLLMService(FakeLLMProfile(latency="fixed:0", error_rate=1.0))
+    with pytest.raises(FakeLLMError):
+        failing.answer("q", "ctx")
+
+
+def test_async_fake_streams_words_then_answer():
+    service = AsyncFakeLLMService(FakeLLMProfile(latency="fixed:0.01", answer_words=8))
+
+    async def collect():
+        return [item async for item in service.stream_answer("q", "ctx")]
+
+    items = asyncio.run(collect())
+    assert isinstance(items[-1], Answer)
+    assert "".join(items[:-1]) == items[-1].answer
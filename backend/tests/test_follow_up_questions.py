@@ -0,0 +1,39 @@
+from backend.application.suggestions.question_index import QuestionIndex
+from backend.application.suggestions.select_follow_up_questions import catalog_ids_for, select_follow_up_questions
+
+CATALOG = [
+    {"id": "reliability", "text": "How do you ensure reliability of LLM outputs in production?"},
+    {"id": "reliability_2", "text": "How do you make LLM outputs reliable for production use?"},
+    {"id": "monitoring", "text": "How do you monitor LLM systems in production?"},
+    {"id": "hobbies", "text": "What do you do in your free time?"},
+    {"id": "education", "text": "Where did you study?"},
+]
+
+
+def test_selection_is_relevant_diverse_and_skips_paraphrases():
+    index = QuestionIndex(CATALOG)
+    picked = select_follow_up_questions(
+        "How do you keep LLM outputs reliable in production?",
+        "I monitor every release.",
+        number_of_questions=2,
+        index=index,
+    )
+    # Paraphrases of the current question are dropped; monitoring is the closest topic
+    assert picked[0] == "How do you monitor LLM systems in production?"
+    assert all("reliab" not in text for text in picked)
+    assert len(picked) == 2
+
+
+def test_session_exclusions_and_padding():
+    index = QuestionIndex(CATALOG)
+    asked = catalog_ids_for(["How do you monitor LLM systems in production?"], index=index)
+    assert asked == ["monitoring"]
+    picked = select_follow_up_questions(
+        "Where did you study?", "", number_of_questions=3, exclude_ids=asked, index=index
+    )
+    assert "Where did you study?" not in picked
+    assert "How do you monitor LLM systems in production?" not in picked
+    assert len(picked) == 3
+    assert picked == select_follow_up_questions(
+        "Where did you study?", "", number_of_questions=3, exclude_ids=asked, index=index
+    )
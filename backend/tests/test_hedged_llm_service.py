@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from backend.domain.entities import Answer, FallbackAnswer, SubstituteAnswer
+from backend.infrastructure.services.hedged_llm_service import HedgedLLMService
+
+
+class DelayedLLM:
+    def __init__(self, name: str, delays: list[float], fail: bool = False, unparseable: bool = False):
+        self.name = name
+        self.delays = delays
+        self.fail = fail
+        self.unparseable = unparseable
+        self.started = 0
+        self.cancelled = 0
+    async def answer(self, prompt: str, context_markdown: str) -> Answer:
+        delay = self.delays[min(self.started, len(self.delays) - 1)]
+        self.started += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        if self.unparseable:
+            return FallbackAnswer(answer=f"{self.name} raw", highlights=[], follow_up_questions=[])
+        return Answer(answer=self.name, highlights=[], follow_up_questions=[])
+
+
+def _hedged(primary, hedge, **kwargs) -> HedgedLLMService:
+    kwargs = {"initial_delay_seconds": 0.02, "min_delay_seconds": 0.0, "max_hedge_ratio": 1.0, **kwargs}
+    return HedgedLLMService(primary, hedge, **kwargs)
+
+
+def test_fast_primary_is_not_hedged():
+    primary, hedge = DelayedLLM("primary", [0.0]), DelayedLLM("hedge", [0.0])
+    service = _hedged(primary, hedge)
+    assert asyncio.run(service.answer("q", "ctx")).answer == "primary"
+    assert hedge.started == 0
+
+
+def test_slow_primary_loses_to_hedge_and_is_cancelled():
+    primary, hedge = DelayedLLM("primary", [1.0]), DelayedLLM("hedge", [0.0])
+    service = _hedged(primary, hedge)
+    assert asyncio.run(service.answer("q", "ctx")).answer == "hedge"
+    assert primary.cancelled == 1
+    stats = service.stats()
+    assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+
+
+def test_failed_hedge_falls_back_to_primary():
+    primary, hedge = DelayedLLM("primary", [0.05]), DelayedLLM("hedge", [0.0], fail=True)
+    service = _hedged(primary, hedge)
+    assert asyncio.run(service.answer("q", "ctx")).answer == "primary"
+    assert service.stats()["hedge_wins"] == 0
+
+
+def test_both_failing_raises():
+    service = _hedged(DelayedLLM("primary", [0.05], fail=True), DelayedLLM("hedge", [0.0], fail=True))
+    with pytest.raises(RuntimeError, match="primary failed"):
+        asyncio.run(service.answer("q", "ctx"))
+
+
+def test_hedge_rate_is_capped():
+    primary, hedge = DelayedLLM("primary", [0.05]), DelayedLLM("hedge", [0.0])
+    service = _hedged(primary, hedge, max_hedge_ratio=0.25)
+
+    async def run():
+        for _ in range(8):
+            await service.answer("q", "ctx")
+
+    asyncio.run(run())
+    stats = service.stats()
+    assert stats["hedged"] == 2
+    assert stats["skipped_by_budget"] == 6
+
+
+def test_delay_follows_latency_percentile():
+    service = HedgedLLMService(DelayedLLM("p", [0.0]), percentile=90, min_samples=10, min_delay_seconds=0.0)
+    service._latencies.extend([0.1 * i for i in range(1, 11)])
+    assert service.hedge_delay() == pytest.approx(0.9)
+
+
+def test_cancelled_primary_records_its_elapsed_time():
+    primary, hedge = DelayedLLM("primary", [1.0]), DelayedLLM("hedge", [0.05])
+    service = _hedged(primary, hedge)
+
+    async def run():
+        await service.answer("q", "ctx")
+        await asyncio.sleep(0)  # let the cancelled primary unwind
+
+    asyncio.run(run())
+    assert primary.cancelled == 1
+    assert len(service._latencies) == 1
+    assert service._latencies[0] >= 0.05
+
+
+def test_hedge_answer_from_another_model_is_a_substitute():
+    primary, hedge = DelayedLLM("primary", [1.0]), DelayedLLM("hedge", [0.0])
+    primary.model, hedge.model = "main-model", "fast-model"
+    answer = asyncio.run(_hedged(primary, hedge).answer("q", "ctx"))
+    assert isinstance(answer, SubstituteAnswer) and answer.answer == "hedge"
+
+    primary, same_model = DelayedLLM("primary", [1.0]), DelayedLLM("hedge", [0.0])
+    primary.model = same_model.model = "main-model"
+    answer = asyncio.run(_hedged(primary, same_model).answer("q", "ctx"))
+    assert not isinstance(answer, SubstituteAnswer)
+
+
+def test_fallback_answer_does_not_beat_a_slower_valid_one():
+    primary, hedge = DelayedLLM("primary", [0.1]), DelayedLLM("hedge", [0.0], unparseable=True)
+    service = _hedged(primary, hedge)
+    answer = asyncio.run(service.answer("q", "ctx"))
+    assert answer.answer == "primary" and not isinstance(answer, FallbackAnswer)
+    assert primary.cancelled == 0 and service.hedge_wins == 0
+
+    primary, hedge = DelayedLLM("primary", [0.1], fail=True), DelayedLLM("hedge", [0.0], unparseable=True)
+    answer = asyncio.run(_hedged(primary, hedge).answer("q", "ctx"))
+    assert isinstance(answer, FallbackAnswer) and answer.answer == "hedge raw"
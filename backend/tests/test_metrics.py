@@ -0,0 +1,47 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.application.observability.metrics import MetricsRegistry, stage
+from backend.presentation.metrics import MetricsMiddleware
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value, "llm")
+    registry.counter("demo_total", "Demo").inc(amount=2)
+    text = registry.render()
+    assert 'demo_seconds_bucket{stage="llm",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{stage="llm",le="1"} 3' in text
+    assert 'demo_seconds_bucket{stage="llm",le="+Inf"} 4' in text
+    assert 'demo_seconds_count{stage="llm"} 4' in text
+    assert "# TYPE demo_total counter\ndemo_total 2" in text
+
+
+def test_middleware_adds_server_timing_and_request_metrics():
+    registry = MetricsRegistry()
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, registry=registry)
+
+    @app.post("/v1/chat")
+    async def chat() -> dict:
+        with stage("profile"):
+            pass
+        with stage("llm"):
+            pass
+        return {"ok": True}
+
+    @app.get("/other")
+    async def other() -> dict:
+        return {}
+
+    with TestClient(app) as client:
+        header = client.post("/v1/chat").headers["server-timing"]
+        assert client.get("/other").headers.get("server-timing") is None
+        client.get("/missing")
+    assert [part.split(";")[0] for part in header.split(", ")] == ["profile", "llm", "app"]
+    text = registry.render()
+    assert 'http_request_duration_seconds_count{route="/v1/chat",method="POST",status="200"} 1' in text
+    assert 'route="unmatched",method="GET",status="404"' in text
+    assert "http_requests_in_flight 0" in text
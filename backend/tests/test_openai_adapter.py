@@ -0,0 +1,85 @@
+import asyncio
+import json
+
+import httpx
+from openai import AsyncOpenAI
+
+from backend.infrastructure.services.async_openai_chat_service import AsyncOpenAIChatService
+from backend.infrastructure.services.openai_prompt import build_messages
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "c1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": {
+            "prompt_tokens": 1500,
+            "completion_tokens": 40,
+            "total_tokens": 1540,
+            "prompt_tokens_details": {"cached_tokens": 1280},
+        },
+    }
+
+
+def _service(handler) -> AsyncOpenAIChatService:
+    service = AsyncOpenAIChatService(model="gpt-4o-mini", api_key="test")
+    service.client = AsyncOpenAI(
+        api_key="test", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return service
+
+
+def test_prompt_prefix_is_stable_across_questions():
+    first = build_messages("What project are you most proud of?", "Profile context")
+    second = build_messages("How do you monitor AI systems?", "Profile context")
+    assert first[:2] == second[:2]
+    assert json.dumps(first[:2]) == json.dumps(second[:2])
+    assert "Profile context" not in first[2]["content"]
+
+
+def test_answer_records_cached_prompt_tokens():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(200, json=_completion('{"answer": "I did X", "highlights": [], "follow_up_questions": []}'))
+
+    service = _service(handler)
+    answer = asyncio.run(service.answer("Question?", "Profile context"))
+    assert answer.answer == "I did X"
+    assert [m["role"] for m in seen["body"]["messages"]] == ["system", "system", "user"]
+    stats = service.usage_stats.snapshot()
+    assert stats["cached_tokens"] == 1280
+    assert stats["cache_hit_request_ratio"] == 1.0
+
+
+def test_stream_answer_yields_deltas_then_answer():
+    content = json.dumps({"answer": "I built it", "highlights": ["h"], "follow_up_questions": []})
+    pieces = [content[i:i + 5] for i in range(0, len(content), 5)]
+
+    def chunk(delta: dict, usage: dict | None = None) -> str:
+        choices = [] if usage else [{"index": 0, "delta": delta, "finish_reason": None}]
+        body = {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": "m", "choices": choices}
+        if usage:
+            body["usage"] = usage
+        return f"data: {json.dumps(body)}\n\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream_options"] == {"include_usage": True}
+        events = [chunk({"content": p}) for p in pieces]
+        events.append(chunk({}, usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}))
+        events.append("data: [DONE]\n\n")
+        return httpx.Response(200, content="".join(events), headers={"content-type": "text/event-stream"})
+
+    service = _service(handler)
+
+    async def collect():
+        return [item async for item in service.stream_answer("Q", "Profile context")]
+
+    items = asyncio.run(collect())
+    assert "".join(i for i in items if isinstance(i, str)) == "I built it"
+    assert items[-1].highlights == ["h"]
+    assert service.usage_stats.snapshot()["prompt_tokens"] == 10
@@ -0,0 +1,76 @@
+import json
+
+import httpx
+import openai
+import pytest
+from openai import OpenAI
+
+from backend.infrastructure.services.openai_chat_service import OpenAIChatService
+from backend.infrastructure.services.openai_retry import RetryPolicy
+
+_OK = {
+    "id": "c1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [{
+        "index": 0,
+        "finish_reason": "stop",
+        "message": {"role": "assistant", "content": json.dumps({"answer": "ok", "highlights": [], "follow_up_questions": []})},
+    }],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+}
+
+
+def _service(responses: list[httpx.Response], **policy) -> tuple[OpenAIChatService, list]:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    policy.setdefault("backoff_base_seconds", 0.01)
+    service = OpenAIChatService(model="gpt-4o-mini", api_key="test", retry_policy=RetryPolicy(**policy))
+    service.client = OpenAI(
+        api_key="test", max_retries=0, http_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    return service, requests
+
+
+def _error(status: int, headers: dict | None = None, code: str | None = None) -> httpx.Response:
+    return httpx.Response(status, headers=headers, json={"error": {"message": "x", "type": "t", "code": code}})
+
+
+def test_transient_errors_are_retried():
+    service, requests = _service([_error(500), _error(429, {"retry-after-ms": "10"}), httpx.Response(200, json=_OK)])
+    assert service.answer("q", "ctx").answer == "ok"
+    assert len(requests) == 3
+    stats = service.retry_policy.stats.snapshot()
+    assert (stats["attempts"], stats["retries"], stats["failures"]) == (3, 2, 0)
+    assert stats["retries_by_reason"] == {"500": 1, "429": 1}
+
+
+@pytest.mark.parametrize("response", [_error(401), _error(400), _error(429, code="insufficient_quota")])
+def test_permanent_errors_fail_immediately(response):
+    service, requests = _service([response, httpx.Response(200, json=_OK)])
+    with pytest.raises(openai.APIStatusError):
+        service.answer("q", "ctx")
+    assert len(requests) == 1
+    assert service.retry_policy.stats.snapshot()["permanent_errors"] == 1
+
+
+def test_no_retry_starts_past_the_deadline():
+    # Server asks for 5s, but only 2s of budget are left: give up right away
+    service, requests = _service([_error(503, {"retry-after": "5"}), httpx.Response(200, json=_OK)], deadline_seconds=2)
+    with pytest.raises(openai.InternalServerError):
+        service.answer("q", "ctx")
+    assert len(requests) == 1
+    stats = service.retry_policy.stats.snapshot()
+    assert (stats["retries"], stats["deadline_exhausted"]) == (0, 1)
+
+
+def test_attempt_timeout_is_capped_by_remaining_budget():
+    seen = []
+    policy = RetryPolicy(deadline_seconds=3, attempt_timeout_seconds=20)
+    policy.call(lambda timeout: seen.append(timeout))
+    assert 0 < seen[0] <= 3
@@ -0,0 +1,55 @@
+from backend.application.use_cases.pii_processing_use_case import PIIProcessingUseCase
+from backend.config import Settings
+from backend.infrastructure.services.pii_regex_detector import RegexPIIDetector
+
+
+def _found(text: str) -> list[tuple[str, str]]:
+    return [(f.category, f.value) for f in RegexPIIDetector().detect(text)]
+
+
+def test_detects_all_categories_in_one_message():
+    text = (
+        "Mail marc@example.com, call +49 1578 9281 878 or 079 123 45 67, "
+        "IBAN DE89 3704 0044 0532 0130 00, card 4111 1111 1111 1111, "
+        "host 192.168.0.1, office Guisanstrasse 94"
+    )
+    assert _found(text) == [
+        ("EMAIL", "marc@example.com"),
+        ("PHONE", "+49 1578 9281 878"),
+        ("PHONE", "079 123 45 67"),
+        ("IBAN", "DE89 3704 0044 0532 0130 00"),
+        ("CREDIT_CARD", "4111 1111 1111 1111"),
+        ("IP_ADDRESS", "192.168.0.1"),
+        ("ADDRESS", "Guisanstrasse 94"),
+    ]
+
+
+def test_checksums_reject_lookalikes():
+    assert ("CREDIT_CARD", "4111 1111 1111 1112") not in _found("card 4111 1111 1111 1112")
+    assert "IBAN" not in {c for c, _ in _found("code DE00 3704 0044 0532 0130 00")}
+
+
+def test_compressed_ipv6_needs_an_address_like_head():
+    assert _found("server fe80::1 and 2001:db8::8a2e:370:7334") == [
+        ("IP_ADDRESS", "fe80::1"),
+        ("IP_ADDRESS", "2001:db8::8a2e:370:7334"),
+    ]
+    assert _found("call fe::add or a::b in the vector code") == []
+
+
+def test_numbers_split_by_loose_punctuation_are_still_found():
+    assert _found("phone: 0171 - - 1234567") == [("PHONE", "0171 - - 1234567")]
+    assert _found("call 555 -- - 555 1234") == [("PHONE", "555 -- - 555 1234")]
+
+
+def test_plain_prose_has_no_findings():
+    assert _found("I have 5 years of experience (2024 – Present) with Python 3.11.") == []
+
+
+def test_mask_uses_non_overlapping_spans():
+    settings = Settings()
+    settings.pii_enabled = True
+    settings.pii_block_severity = "none"
+    processor = PIIProcessingUseCase(RegexPIIDetector(), settings)
+    masked, _ = processor.process("Reach me at 4111 1111 1111 1111 or a@b.com", "ctx")
+    assert masked == "Reach me at <CREDIT_CARD_1> or <EMAIL_1>"
@@ -0,0 +1,51 @@
+import json
+from backend.infrastructure.repositories.profile_repository import FileProfileRepository
+from backend.infrastructure.repositories.retrieval_profile_repository import RetrievalProfileRepository
+
+
+def _write_profile(tmp_path, bio: str):
+    md = tmp_path / "background.md"
+    md.write_text("## Who I Am\nBackground", encoding="utf-8")
+    facts = tmp_path / "profile.json"
+    facts.write_text(json.dumps({"person": {"name": "Marc", "short_bio": bio}}), encoding="utf-8")
+    return md, facts
+
+
+def test_profile_text_is_cached(tmp_path):
+    md, facts = _write_profile(tmp_path, "Engineer")
+    repo = FileProfileRepository(path=md, profile_json_path=facts)
+    first = repo.get_profile_text()
+    second = repo.get_profile_text()
+    assert first == second
+    assert "Engineer" in first
+    assert repo.cache_misses == 1
+    assert repo.cache_hits == 1
+
+
+def test_profile_cache_invalidated_on_change(tmp_path):
+    md, facts = _write_profile(tmp_path, "Engineer")
+    repo = FileProfileRepository(path=md, profile_json_path=facts)
+    version_before = repo.get_profile_version()
+    _write_profile(tmp_path, "AI Software Engineer")
+    assert "AI Software Engineer" in repo.get_profile_text()
+    assert repo.get_profile_version() != version_before
+    assert repo.cache_misses == 2
+
+
+def test_retrieval_returns_core_plus_relevant_chunks(tmp_path):
+    md = tmp_path / "background.md"
+    md.write_text(
+        "# Marc\n\n## Cooking\nI bake sourdough bread.\n\n## Evaluation\nAutomated evaluators check LLM outputs.\n",
+        encoding="utf-8",
+    )
+    facts = tmp_path / "profile.json"
+    facts.write_text(
+        json.dumps({"person": {"name": "Marc"}, "contact": {"phone": "+49 1578 9281 878"}}),
+        encoding="utf-8",
+    )
+    repo = RetrievalProfileRepository(FileProfileRepository(path=md, profile_json_path=facts), top_k=1)
+    context = repo.get_relevant_profile_text("How do you evaluate LLM outputs?")
+    assert "Candidate Snapshot" in context
+    assert "Automated evaluators" in context
+    assert "sourdough" not in context
+    assert "9281" not in context
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+from backend.application.concurrency.request_coalescer import RequestCoalescer
+from backend.application.use_cases.answer_questions_use_case import AnswerQuestionUseCase
+from backend.domain.entities import Answer
+
+
+class StaticRepo:
+    def get_profile_text(self) -> str:
+        return "Profile"
+
+
+class SlowAsyncLLM:
+    model = "test-model"
+    def __init__(self):
+        self.calls = 0
+    async def answer(self, prompt: str, context_markdown: str) -> Answer:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return Answer(answer="Shared", highlights=[], follow_up_questions=[])
+    async def stream_answer(self, prompt: str, context_markdown: str):
+        self.calls += 1
+        for part in ("Sha", "red"):
+            await asyncio.sleep(0.01)
+            yield part
+        yield Answer(answer="Shared", highlights=[], follow_up_questions=[])
+
+
+def test_sync_callers_share_one_call():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(1)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coalescer.do("k", slow))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    while coalescer.deduplicated < 3:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    assert coalescer.stats() == {"upstream_calls": 1, "deduplicated": 3}
+
+
+def test_async_errors_reach_every_waiter_and_key_is_released():
+    coalescer = RequestCoalescer()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        results = await asyncio.gather(*(coalescer.do_async("k", boom) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await coalescer.do_async("k", lambda: asyncio.sleep(0, result="ok")) == "ok"
+
+    asyncio.run(run())
+    assert coalescer.stats() == {"upstream_calls": 2, "deduplicated": 2}
+
+
+def test_use_case_coalesces_concurrent_identical_questions():
+    llm = SlowAsyncLLM()
+    uc = AnswerQuestionUseCase(StaticRepo(), llm_service=None, async_llm_service=llm, coalescer=RequestCoalescer())
+
+    async def run():
+        return await asyncio.gather(
+            uc.execute_async("What is your experience?"),
+            uc.execute_async("what is your experience"),
+            uc.execute_async("Tell me about a different topic"),
+        )
+
+    first, second, other = asyncio.run(run())
+    assert llm.calls == 2
+    assert first.answer == second.answer == other.answer == "Shared"
+    assert first is not second
+
+
+def test_use_case_streams_share_one_upstream_stream():
+    llm = SlowAsyncLLM()
+    uc = AnswerQuestionUseCase(StaticRepo(), llm_service=None, async_llm_service=llm, coalescer=RequestCoalescer())
+
+    async def consume():
+        return [item async for item in uc.stream("What is your experience?")]
+
+    async def run():
+        return await asyncio.gather(consume(), consume())
+
+    a, b = asyncio.run(run())
+    assert llm.calls == 1
+    assert a[:-1] == b[:-1] == ["Sha", "red"]
+    assert a[-1].answer == b[-1].answer == "Shared"
+    assert a[-1] is not b[-1]
+
+
+def test_stream_pump_task_is_held_until_done():
+    coalescer = RequestCoalescer()
+
+    async def parts():
+        for part in ("a", "b"):
+            await asyncio.sleep(0.01)
+            yield part
+
+    async def run():
+        items = coalescer.stream("k", parts)
+        flight = coalescer._streams["k"]
+        assert isinstance(flight.task, asyncio.Task)
+        assert [item async for item in items] == ["a", "b"]
+        await asyncio.sleep(0)  # done callbacks run on the next loop iteration
+        assert flight.task is None and not coalescer._streams
+
+    asyncio.run(run())
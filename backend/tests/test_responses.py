@@ -0,0 +1,91 @@
+import json
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.application.controllers.chat_controller import ChatBatchRequest, ChatController
+from backend.domain.entities import Answer
+from backend.presentation.compression import CompressionMiddleware, accepted_encoding
+from backend.presentation.http_chat_router import get_chat_router
+
+
+class StaticUseCase:
+    session_store = None
+
+    async def execute_async(self, message: str, session_id: str | None = None) -> Answer:
+        return Answer(answer=f"Re: {message} – ünïcode", highlights=["h"], follow_up_questions=["f?"])
+
+    async def execute_many(self, messages: list[str], concurrency: int = 8) -> list:
+        return [await self.execute_async(m) if m != "fail" else ValueError("boom") for m in messages]
+
+
+def _client() -> TestClient:
+    container = SimpleNamespace(
+        chat_controller=ChatController(StaticUseCase()),
+        settings=SimpleNamespace(metrics_enabled=False),
+    )
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=512)
+    app.include_router(get_chat_router(container))
+    return TestClient(app)
+
+
+def test_accepted_encoding_prefers_brotli_and_honours_q_zero():
+    assert accepted_encoding("gzip, deflate, br", brotli_available=True) == "br"
+    assert accepted_encoding("gzip, deflate, br", brotli_available=False) == "gzip"
+    assert accepted_encoding("br;q=0, gzip;q=0.5", brotli_available=True) == "gzip"
+    assert accepted_encoding("identity") is None
+    assert accepted_encoding("") is None
+
+
+def test_chat_response_skips_revalidation_but_keeps_the_schema():
+    with _client() as client:
+        response = client.post("/v1/chat", json={"message": "Hi"}, headers={"Accept-Encoding": "gzip"})
+        schema = client.get("/openapi.json").json()
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") is None  # below minimum_size
+    assert response.json() == {
+        "answer": "Re: Hi – ünïcode",
+        "highlights": ["h"],
+        "follow_up_questions": ["f?"],
+        "session_id": None,
+    }
+    assert "ChatResponse" in json.dumps(schema["paths"]["/v1/chat"]["post"]["responses"]["200"])
+
+
+def test_large_batch_response_is_gzipped():
+    messages = [f"Question number {i}?" for i in range(40)] + ["fail"]
+    with _client() as client:
+        response = client.post(
+            "/v1/chat/batch", json=ChatBatchRequest(messages=messages).model_dump(), headers={"Accept-Encoding": "gzip"}
+        )
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content)  # httpx decoded it
+    results = response.json()["results"]
+    assert len(results) == 41 and results[0]["ok"] and results[0]["response"]["answer"] == "Re: Question number 0? – ünïcode"
+    assert results[-1] == {"index": 40, "ok": False, "response": None, "error": {"type": "server_error", "message": "Internal server error"}}
+
+
+def test_event_streams_and_unaccepted_encodings_pass_through():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1)
+
+    @app.get("/events")
+    async def events() -> StreamingResponse:
+        async def body():
+            yield "event: delta\ndata: {}\n\n" * 100
+        return StreamingResponse(body(), media_type="text/event-stream")
+
+    @app.get("/text")
+    async def text() -> PlainTextResponse:
+        return PlainTextResponse("x" * 2000)
+
+    with TestClient(app) as client:
+        assert client.get("/events", headers={"Accept-Encoding": "gzip"}).headers.get("content-encoding") is None
+        assert client.get("/text", headers={"Accept-Encoding": "identity"}).headers.get("content-encoding") is None
+        raw = client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert raw.headers["content-encoding"] == "gzip"
+    assert raw.text == "x" * 2000
@@ -0,0 +1,93 @@
+from backend.application.sessions.history_compaction import compact_history, estimate_tokens
+from backend.application.use_cases.answer_questions_use_case import AnswerQuestionUseCase
+from backend.domain.entities import Answer, ChatMessage
+from backend.infrastructure.caches.in_memory_answer_cache import InMemoryAnswerCache
+from backend.infrastructure.services.openai_prompt import build_messages
+from backend.infrastructure.sessions.in_memory_session_store import InMemorySessionStore
+
+
+class StaticRepo:
+    def get_profile_text(self) -> str:
+        return "Profile"
+
+
+class RecordingLLM:
+    model = "test-model"
+    def __init__(self):
+        self.histories = []
+    def answer(self, prompt: str, context_markdown: str, history=None) -> Answer:
+        self.histories.append(history)
+        return Answer(answer=f"Answer to {prompt}", highlights=[], follow_up_questions=[])
+
+
+def _turns(n: int) -> list[ChatMessage]:
+    history = []
+    for i in range(n):
+        history.append(ChatMessage(role="user", content=f"Question number {i} about my projects?"))
+        history.append(ChatMessage(role="assistant", content=f"A fairly long answer number {i}. " * 10))
+    return history
+
+
+def test_compaction_keeps_recent_turns_and_summarizes_older_ones():
+    history = _turns(20)
+    compacted = compact_history(history, budget_tokens=300)
+    assert compacted[-1] == history[-1]
+    assert compacted[0].role == "system"
+    assert "Question number" in compacted[0].content
+    assert len(compacted) < len(history)
+    total = sum(estimate_tokens(m.content) + 4 for m in compacted)
+    assert total <= 300
+
+
+def test_compaction_is_bounded_for_any_length():
+    sizes = {sum(len(m.content) for m in compact_history(_turns(n), budget_tokens=200)) for n in (5, 50, 500)}
+    assert max(sizes) <= 200 * 4
+
+
+def test_session_store_lru_ttl_and_message_caps():
+    now = [0.0]
+    store = InMemorySessionStore(max_sessions=2, ttl_seconds=10, max_messages=3, clock=lambda: now[0])
+    store.append("a", _turns(2))
+    assert len(store.get_history("a")) == 3
+    store.append("b", _turns(1))
+    store.get_history("a")
+    store.append("c", _turns(1))  # evicts least recently used "b"
+    assert store.get_history("b") == []
+    now[0] = 11
+    assert store.get_history("a") == []
+    assert store.stats()["evictions"] == 1
+
+
+def test_use_case_threads_history_and_skips_answer_cache():
+    llm = RecordingLLM()
+    store = InMemorySessionStore()
+    cache = InMemoryAnswerCache()
+    uc = AnswerQuestionUseCase(StaticRepo(), llm, answer_cache=cache, session_store=store)
+    uc.execute("What did you build?", session_id="s1")
+    uc.execute("What did you build?", session_id="s1")
+    assert llm.histories[0] is None
+    assert [m.role for m in llm.histories[1]] == ["user", "assistant"]
+    assert len(store.get_history("s1")) == 4
+    uc.execute("What did you build?")  # no session: served from the cache filled by turn one
+    assert len(llm.histories) == 2
+
+
+def test_history_sits_between_context_and_question():
+    history = [ChatMessage(role="user", content="Hi"), ChatMessage(role="assistant", content="Hello")]
+    messages = build_messages("And then?", "Profile", history)
+    assert [m["role"] for m in messages] == ["system", "system", "user", "assistant", "user"]
+    assert messages[:2] == build_messages("Other", "Profile")[:2]
+
+
+def test_follow_ups_skip_questions_compacted_into_the_summary():
+    asked = "How do you monitor AI systems in production?"
+    store = InMemorySessionStore()
+    store.append("s1", [ChatMessage(role="user", content=asked), ChatMessage(role="assistant", content="Dashboards.")])
+    store.append("s1", _turns(18))  # within the store cap, over the history token budget
+    uc = AnswerQuestionUseCase(StaticRepo(), RecordingLLM(), session_store=store)
+    question = "Which alerts and dashboards do you use for AI in production?"  # would suggest `asked`
+    prepared = uc._prepare(question, session_id="s1")
+    assert asked not in [m.content for m in prepared.history]  # compacted away
+    answer = uc.execute(question, session_id="s1")
+    assert asked not in answer.follow_up_questions
+    assert answer.follow_up_questions
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from backend.domain.entities import Answer
+from backend.infrastructure.services.lazy_llm_service import LazyAsyncLLMService, LazyLLMService
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class CountingLLM:
+    def __init__(self):
+        self.closed = False
+
+    def answer(self, prompt: str, context_markdown: str) -> Answer:
+        return Answer(answer=prompt, highlights=[], follow_up_questions=[])
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_lazy_service_is_built_once_on_first_use():
+    built = []
+
+    def factory():
+        built.append(CountingLLM())
+        return built[-1]
+
+    service = LazyLLMService(factory, model="m")
+    assert not service.constructed and service.model == "m"
+    assert service.answer(prompt="a", context_markdown="").answer == "a"
+    service.answer(prompt="b", context_markdown="")
+    assert len(built) == 1
+
+    never_used = LazyAsyncLLMService(factory)
+    asyncio.run(never_used.aclose())  # nothing to close, nothing built
+    assert len(built) == 1
+
+
+def test_async_proxy_builds_the_service_off_the_event_loop():
+    import threading
+    import time
+
+    class AsyncLLM:
+        async def answer(self, prompt: str, context_markdown: str) -> Answer:
+            return Answer(answer=prompt, highlights=[], follow_up_questions=[])
+
+        async def stream_answer(self, prompt: str, context_markdown: str):
+            yield prompt
+            yield Answer(answer=prompt, highlights=[], follow_up_questions=[])
+
+    built_on = []
+
+    def slow_factory():
+        built_on.append(threading.get_ident())
+        time.sleep(0.05)  # stands in for the SDK import
+        return AsyncLLM()
+
+    async def run():
+        service = LazyAsyncLLMService(slow_factory)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        answer = await service.answer(prompt="a", context_markdown="")
+        ticking.cancel()
+        streamed = [item async for item in LazyAsyncLLMService(slow_factory).stream_answer(prompt="b", context_markdown="")]
+        return threading.get_ident(), answer, ticks, streamed
+
+    loop_thread, answer, ticks, streamed = asyncio.run(run())
+    assert answer.answer == "a" and streamed[0] == "b"
+    assert loop_thread not in built_on
+    assert ticks >= 2  # the loop kept running while the service was built
+
+
+def test_app_import_does_not_load_llm_sdk():
+    # Regression guard for cold start: the SDK (and the schema-built system prompt) must
+    # only load when an adapter or the prompt budget is first used
+    modules = "('openai', 'tenacity', 'backend.infrastructure.services.openai_prompt')"
+    code = f"import sys, start; print(sorted(m for m in {modules} if m in sys.modules))"
+    env = {**os.environ, "LAZY_WIRING": "true", "LLM_PROVIDER": "openai", "PRECOMPUTE_ANSWERS": "false"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
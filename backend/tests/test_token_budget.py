@@ -0,0 +1,106 @@
+from backend.application.tokens.context_budget import PromptBudget, TRUNCATION_MARKER, fit_context
+from backend.application.tokens.token_counter import count_message_tokens, count_tokens
+from backend.application.use_cases.answer_questions_use_case import AnswerQuestionUseCase
+from backend.domain.entities import Answer
+from backend.infrastructure.caches.in_memory_answer_cache import InMemoryAnswerCache
+
+CONTEXT = "\n".join(
+    [
+        "# Candidate",
+        "Core facts. " * 5,
+        "## Experience",
+        "Built LLM features. " * 20,
+        "## Projects",
+        "Side projects. " * 20,
+        "## Interests",
+        "Climbing and chess. " * 20,
+    ]
+)
+
+
+class StaticRepo:
+    def get_profile_text(self) -> str:
+        return CONTEXT
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.contexts = []
+
+    def answer(self, prompt: str, context_markdown: str) -> Answer:
+        self.contexts.append(context_markdown)
+        return Answer(answer="ok", highlights=[], follow_up_questions=[])
+
+
+def test_token_counts_are_positive_and_include_message_overhead():
+    assert count_tokens("") == 0
+    assert count_tokens("hello world") >= 1
+    messages = [{"role": "system", "content": "abc"}, {"role": "user", "content": "def"}]
+    assert count_message_tokens(messages) > count_tokens("abc") + count_tokens("def")
+
+
+def test_context_within_budget_is_unchanged():
+    fitted = fit_context(CONTEXT, 10_000)
+    assert fitted.text == CONTEXT
+    assert not fitted.dropped_sections and not fitted.truncated
+
+
+def test_low_priority_sections_are_dropped_first_then_trailing_ones():
+    full = count_tokens(CONTEXT)
+    interests = count_tokens("Climbing and chess. " * 20)
+    fitted = fit_context(CONTEXT, full - interests // 2, ("interests",))
+    assert fitted.dropped_sections == ("Interests",)
+    assert "## Projects" in fitted.text
+
+    fitted = fit_context(CONTEXT, full - interests // 2)
+    assert fitted.dropped_sections == ("Interests",)  # trailing section goes first
+
+    fitted = fit_context(CONTEXT, count_tokens("Core facts. " * 5) + 20, ("projects",))
+    assert fitted.dropped_sections == ("Projects", "Interests", "Experience")
+    assert fitted.text.startswith("# Candidate")
+    assert fitted.tokens <= count_tokens("Core facts. " * 5) + 20
+
+
+def test_oversized_preamble_is_truncated_deterministically():
+    fitted = fit_context(CONTEXT, 15)
+    assert fitted.truncated
+    assert fitted.text.endswith(TRUNCATION_MARKER)
+    assert fitted.tokens <= 15
+    assert fit_context(CONTEXT, 15) == fitted
+
+
+def test_use_case_enforces_prompt_budget():
+    llm = RecordingLLM()
+    budget = PromptBudget(max_prompt_tokens=count_tokens(CONTEXT) - 50, fixed_tokens=20, low_priority_sections=("interests",))
+    use_case = AnswerQuestionUseCase(profile_repository=StaticRepo(), llm_service=llm, prompt_budget=budget)
+    use_case.execute("What did you build?")
+    assert "## Interests" not in llm.contexts[0]
+    assert "## Experience" in llm.contexts[0]
+
+
+def test_answers_to_a_cut_context_are_cached_under_their_own_namespace():
+    llm = RecordingLLM()
+    cache = InMemoryAnswerCache()
+    budget = PromptBudget(max_prompt_tokens=count_tokens(CONTEXT) - 50, fixed_tokens=20)
+    fitted = AnswerQuestionUseCase(StaticRepo(), llm, answer_cache=cache, prompt_budget=budget)
+    unbounded = AnswerQuestionUseCase(StaticRepo(), llm, answer_cache=cache)
+    fitted.execute("What did you build?")
+    unbounded.execute("What did you build?")
+    assert len(llm.contexts) == 2 and llm.contexts[0] != llm.contexts[1]
+    fitted.execute("What did you build?")
+    assert len(llm.contexts) == 2
+
+
+def test_fixed_messages_are_counted_once_on_first_use():
+    messages = [{"role": "system", "content": "You answer questions about the candidate."}]
+    calls = []
+
+    def fixed_messages():
+        calls.append(1)
+        return messages
+
+    budget = PromptBudget(max_prompt_tokens=1000, fixed_messages=fixed_messages)
+    assert calls == []  # nothing is built at construction (startup)
+    expected = 1000 - count_message_tokens(messages, None) - 10
+    assert budget.context_budget(10, 0) == budget.context_budget(10, 0) == expected
+    assert calls == [1]
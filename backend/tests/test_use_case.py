@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from backend.application.use_cases.answer_questions_use_case import AnswerQuestionUseCase
 from backend.application.use_cases.pii_processing_use_case import PIIProcessingUseCase
@@ -55,3 +56,57 @@ def test_pii_masking():
     uc = AnswerQuestionUseCase(DummyProfileRepo(), DummyLLM(), settings=settings, pii_processor=pii_proc)
     ans = uc.execute("+123456789 tell me more")
     assert "PHONE_" in ans.answer
+
+
+class DummyAsyncLLM:
+    def __init__(self):
+        self.calls = 0
+    async def answer(self, prompt: str, context_markdown: str) -> Answer:
+        self.calls += 1
+        return Answer(answer=f"Async: {prompt}", highlights=[], follow_up_questions=[])
+
+
+def test_execute_async_uses_async_llm():
+    async_llm = DummyAsyncLLM()
+    uc = AnswerQuestionUseCase(DummyProfileRepo(), DummyLLM(), async_llm_service=async_llm)
+    ans = asyncio.run(uc.execute_async("Hello"))
+    assert ans.answer == "Async: Hello"
+    assert async_llm.calls == 1
+    assert ans.follow_up_questions
+
+
+def test_execute_async_falls_back_to_sync_llm():
+    uc = AnswerQuestionUseCase(DummyProfileRepo(), DummyLLM())
+    ans = asyncio.run(uc.execute_async("Hello"))
+    assert ans.answer.startswith("Echo: Hello")
+
+
+class CountingProfileRepo(DummyProfileRepo):
+    def __init__(self):
+        self.calls = 0
+    def get_profile_text(self) -> str:
+        self.calls += 1
+        return super().get_profile_text()
+
+
+class SlowAsyncLLM:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+    async def answer(self, prompt: str, context_markdown: str) -> Answer:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01 if prompt != "q0" else 0.05)
+        self.running -= 1
+        return Answer(answer=f"Async: {prompt}", highlights=[], follow_up_questions=[])
+
+
+def test_execute_many_keeps_order_bounds_concurrency_and_reports_errors():
+    repo, llm = CountingProfileRepo(), SlowAsyncLLM()
+    uc = AnswerQuestionUseCase(repo, DummyLLM(), async_llm_service=llm)
+    messages = [f"q{i}" for i in range(10)] + [""]
+    results = asyncio.run(uc.execute_many(messages, concurrency=3))
+    assert [r.answer for r in results[:10]] == [f"Async: q{i}" for i in range(10)]
+    assert isinstance(results[10], ValidationError)
+    assert llm.peak == 3
+    assert repo.calls == 1
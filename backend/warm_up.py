@@ -0,0 +1,38 @@
+"""CLI: precompute answers for the catalog and suggestion questions.
+
+Usage (from the repository root):
+    python -m backend.warm_up            # reuse the file if profile + model are unchanged
+    python -m backend.warm_up --force    # regenerate everything
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+
+from .container import build_container
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="ignore the existing file and regenerate")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    container = build_container()
+    if container.answer_warm_up is None:
+        raise SystemExit("Warm-up disabled (requires ANSWER_CACHE_ENABLED and PRECOMPUTE_ANSWERS)")
+    if not container.settings.openai_api_key:
+        raise SystemExit("OPENAI_API_KEY missing – cannot generate answers.")
+
+    async def _run() -> dict:
+        try:
+            return await container.answer_warm_up.run(force=args.force)
+        finally:
+            await container.async_llm_service.aclose()
+
+    print(json.dumps(asyncio.run(_run()), indent=2))
+
+
+if __name__ == "__main__":
+    main()
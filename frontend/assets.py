@@ -0,0 +1,47 @@
+"""Lookup of the pre-built image variants (see `build_assets.py`).
+
+Falls back to the original file in `data/` when no variants have been built, so the app
+works without the build step (just with heavier images).
+"""
+
+import json
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+@st.cache_resource
+def _manifest() -> dict:
+    try:
+        return json.loads((STATIC_DIR / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _variant(name: str, width: int) -> dict | None:
+    """Smallest variant at least `width` px wide (largest one if none is)."""
+    variants = _manifest().get(name) or {}
+    if not variants:
+        return None
+    widths = sorted(int(w) for w in variants)
+    chosen = next((w for w in widths if w >= width), widths[-1])
+    return variants[str(chosen)]
+
+
+def image_path(name: str, width: int) -> str:
+    """Local file of the best variant (for APIs that need a path, e.g. avatars)."""
+    variant = _variant(name, width)
+    return str(STATIC_DIR / variant["file"]) if variant else str(DATA_DIR / name)
+
+
+def static_image(name: str, width: int, alt: str = "") -> None:
+    """Render an image from Streamlit's static file serving (browser-cacheable URL)."""
+    variant = _variant(name, width)
+    if variant is None:
+        st.image(str(DATA_DIR / name))
+        return
+    url = f"app/static/{variant['file']}?v={variant['hash']}"
+    st.markdown(f'<img src="{url}" alt="{alt}" style="width:100%;height:auto">', unsafe_allow_html=True)
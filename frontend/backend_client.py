@@ -0,0 +1,161 @@
+"""Shared HTTP client for the FastAPI backend.
+
+One `requests.Session` per Streamlit server process (`st.cache_resource`), so chat turns
+reuse pooled keep-alive connections instead of paying a new TCP + TLS handshake each time.
+Timeouts are split into connect and read: the read timeout is the maximum silence
+between bytes, which for streaming means between SSE events. Retries are bounded and
+only happen where they cannot duplicate work: connection failures (the request never
+reached the backend) for any method, and 502/503/504 for idempotent methods.
+"""
+
+import json
+import os
+from http.cookiejar import DefaultCookiePolicy
+from typing import Iterator
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+CONNECT_TIMEOUT_SECONDS = 5.0
+READ_TIMEOUT_SECONDS = 60.0
+POOL_SIZE = 16
+CONNECT_RETRIES = 2
+
+
+def _backend_url() -> str:
+    # Priority: Streamlit secrets -> env var -> localhost fallback
+    try:
+        url = st.secrets.get("BACKEND_URL")
+    except Exception:  # no secrets.toml
+        url = None
+    return (url or os.getenv("BACKEND_URL") or "http://127.0.0.1:8000").rstrip("/")
+
+
+def _error_detail(response: requests.Response) -> dict:
+    try:
+        detail = response.json().get("detail", {})
+    except ValueError:
+        return {}
+    return detail if isinstance(detail, dict) else {}
+
+
+def _overloaded(response: requests.Response) -> dict:
+    """Payload for a 429 (backend LLM capacity exhausted)."""
+    try:
+        retry_after = int(response.headers.get("Retry-After", "5"))
+    except ValueError:
+        retry_after = 5
+    return {"overloaded": True, "retry_after": retry_after}
+
+
+def _rejected(response: requests.Response) -> dict | None:
+    """Payload for expected rejections (overload, PII block); None for anything else."""
+    if response.status_code == 429:
+        return _overloaded(response)
+    if response.status_code == 400:
+        detail = _error_detail(response)
+        if detail.get("error") == "PII_BLOCKED":
+            return {"pii_blocked": True, **detail}
+    return None
+
+
+def _iter_sse(response: requests.Response) -> Iterator[tuple[str, dict]]:
+    """Yield (event, payload) pairs from a Server-Sent Events response."""
+    event, data_lines = "message", []
+    for line in response.iter_lines(decode_unicode=True):
+        if line is None:
+            continue
+        if line == "":
+            if data_lines:
+                yield event, json.loads("\n".join(data_lines))
+            event, data_lines = "message", []
+        elif line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data_lines.append(line[len("data:"):].strip())
+
+
+class BackendClient:
+    def __init__(
+        self,
+        base_url: str,
+        connect_timeout: float = CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = READ_TIMEOUT_SECONDS,
+        pool_size: int = POOL_SIZE,
+        connect_retries: int = CONNECT_RETRIES,
+    ):
+        self.base_url = base_url
+        self.timeout = (connect_timeout, read_timeout)
+        retry = Retry(
+            total=connect_retries,
+            connect=connect_retries,
+            read=0,  # a POST may already be processed; never resend it after a read error
+            status=connect_retries,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,  # idempotent methods only
+            backoff_factor=0.3,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Shared by all users of this process: never keep cookies between their requests
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.session.headers.update({"Content-Type": "application/json"})
+
+    def _post(self, path: str, body: dict, **kwargs) -> requests.Response:
+        return self.session.post(f"{self.base_url}{path}", data=json.dumps(body), timeout=self.timeout, **kwargs)
+
+    def get_json(self, path: str) -> dict:
+        response = self.session.get(f"{self.base_url}{path}", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def chat(self, body: dict) -> dict:
+        """POST /v1/chat; overload (429) and PII blocks (400) come back as marker payloads."""
+        response = self._post("/v1/chat", body)
+        rejected = _rejected(response)
+        if rejected is not None:
+            return rejected
+        response.raise_for_status()
+        return response.json()
+
+    def chat_stream(self, body: dict) -> Iterator[tuple[str, dict]]:
+        """POST /v1/chat/stream yielding ("delta", {"text": ...}) events, then exactly one
+        ("result", payload) with the same shape `chat` returns.
+
+        Falls back to `chat` if the backend has no streaming endpoint.
+        """
+        with self._post("/v1/chat/stream", body, headers={"Accept": "text/event-stream"}, stream=True) as response:
+            if response.status_code in (404, 405):
+                yield "result", self.chat(body)
+                return
+            rejected = _rejected(response)
+            if rejected is not None:
+                yield "result", rejected
+                return
+            response.raise_for_status()
+            for event, payload in _iter_sse(response):
+                if event == "delta":
+                    yield "delta", payload
+                elif event == "final":
+                    # Read to the end of the body so the connection returns to the pool
+                    for _ in response.iter_content(chunk_size=None):
+                        pass
+                    yield "result", payload
+                    return
+                elif event == "error":
+                    if payload.get("type") == "overloaded":
+                        yield "result", {"overloaded": True, "retry_after": payload.get("retry_after", 5)}
+                        return
+                    raise RuntimeError(payload.get("message", "Streaming failed"))
+        raise RuntimeError("Stream ended before the final answer")
+
+
+@st.cache_resource
+def get_backend_client() -> BackendClient:
+    """Process-wide client (connection pool shared by all sessions and reruns)."""
+    return BackendClient(_backend_url())
@@ -0,0 +1,93 @@
+"""Build right-sized, content-hashed variants of the images in `data/`.
+
+Every image is re-encoded as WebP at a few widths (never upscaled) and written to
+`frontend/static/` as `<name>-<width>.<hash>.webp`, plus `manifest.json` mapping the
+source file name to its variants. Streamlit serves that folder under `app/static/` when
+`server.enableStaticServing` is on; URLs carry the content hash as `?v=`, for which the
+static file handler (tornado) sends a long-lived `Cache-Control`, so browsers fetch each
+variant once. Re-run after changing anything in `data/`:
+
+    python frontend/build_assets.py
+
+Requires Pillow (installed with Streamlit).
+"""
+
+import argparse
+import hashlib
+import json
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = REPO_ROOT / "data"
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+MANIFEST = "manifest.json"
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+# Avatar (2-3x of ~40 css px), sidebar (2x of ~240 css px) and page-width images
+WIDTHS = (128, 480, 960)
+WEBP_QUALITY = 80
+
+
+def _encode(image: Image.Image, width: int) -> bytes:
+    if image.width > width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.LANCZOS)
+    out = BytesIO()
+    image.save(out, "WEBP", quality=WEBP_QUALITY, method=6)
+    return out.getvalue()
+
+
+def build_image(source: Path, out_dir: Path) -> dict[str, dict]:
+    """Write the variants of one image; returns {width: {"file", "hash", "bytes"}}."""
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        widths = sorted({min(width, image.width) for width in WIDTHS})
+        variants = {}
+        for width in widths:
+            data = _encode(image, width)
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            name = f"{source.stem.lower()}-{width}.{digest}.webp"
+            (out_dir / name).write_bytes(data)
+            variants[str(width)] = {"file": name, "hash": digest, "bytes": len(data)}
+    return variants
+
+
+def build(data_dir: Path = DATA_DIR, out_dir: Path = STATIC_DIR) -> dict:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    previous = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+
+    manifest = {}
+    for source in sorted(data_dir.iterdir()):
+        if source.suffix.lower() in IMAGE_SUFFIXES:
+            manifest[source.name] = build_image(source, out_dir)
+
+    # Drop variants the new build no longer references (old hashes)
+    current = {v["file"] for variants in manifest.values() for v in variants.values()}
+    for variants in previous.values():
+        for variant in variants.values():
+            if variant["file"] not in current:
+                (out_dir / variant["file"]).unlink(missing_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build static image variants for the frontend")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--out-dir", type=Path, default=STATIC_DIR)
+    args = parser.parse_args()
+
+    manifest = build(args.data_dir, args.out_dir)
+    for source, variants in manifest.items():
+        original = (args.data_dir / source).stat().st_size
+        sizes = ", ".join(f"{w}px {v['bytes'] / 1024:.1f} KB" for w, v in variants.items())
+        print(f"{source} ({original / 1024:.1f} KB): {sizes}")
+
+
+if __name__ == "__main__":
+    main()
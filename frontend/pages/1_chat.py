@@ -1,30 +1,29 @@
-import os
 import json
 from pathlib import Path
-import requests
 import streamlit as st
 from sidebar import render_common_sidebar
+from backend_client import get_backend_client
+from assets import image_path
 
 
-# Resolve backend base URL (priority: Streamlit secrets -> env var -> localhost fallback)
-BACKEND_URL = (
-    (st.secrets.get("BACKEND_URL") if hasattr(st, "secrets") else None)
-    or os.getenv("BACKEND_URL")
-    or "http://127.0.0.1:8000"
-)
-
 # Session State
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-# Avatars
-_data_dir = Path(__file__).resolve().parents[2] / "data"
-_avatar = _data_dir / "thinking_bitmoji.webp"
+# Avatars (small pre-built variant; the original is 512 px)
+_avatar = Path(image_path("thinking_bitmoji.webp", width=128))
 ASSISTANT_AVATAR = str(_avatar) if _avatar.exists() else "🤖"
 USER_AVATAR = "🧑‍💻"
+SUGGESTION_PROMPTS_PATH = "data/suggestion_prompts.json"
 
 
 # Helper Functions
+@st.cache_data
+def load_suggestion_prompts(path: str = SUGGESTION_PROMPTS_PATH) -> list[str]:
+    """Suggestion prompts from the JSON list shared with the backend."""
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
 def full_width_columns(n: int):
     """Create evenly spaced columns using Streamlit's native layout.
 
@@ -36,23 +35,30 @@ def stretch_button(label: str, **kwargs):
     """Full-width button helper (uses container width)."""
     return st.button(label, use_container_width=True, **kwargs)
 
-def send_sync(prompt: str) -> dict:
-    """Send prompt; gracefully handle PII blocking (400)."""
-    r = requests.post(
-        f"{BACKEND_URL}/v1/chat",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps({"message": prompt}),
-        timeout=120,
-    )
-    if r.status_code == 400:
-        try:
-            detail = r.json().get("detail", {})
-        except Exception:
-            detail = {}
-        if detail.get("error") == "PII_BLOCKED":
-            return {"pii_blocked": True, **detail}
-    r.raise_for_status()
-    return r.json()
+def _payload(prompt: str) -> dict:
+    """Request body; carries the backend session id so follow-ups keep their context."""
+    body = {"message": prompt}
+    if st.session_state.get("chat_session_id"):
+        body["session_id"] = st.session_state.chat_session_id
+    return body
+
+def _remember_session(payload: dict) -> dict:
+    if payload.get("session_id"):
+        st.session_state.chat_session_id = payload["session_id"]
+    return payload
+
+def send_stream(prompt: str, placeholder) -> dict:
+    """Stream the answer into `placeholder` as it arrives; return the final payload."""
+    text = ""
+    for event, payload in get_backend_client().chat_stream(_payload(prompt)):
+        if event == "delta":
+            text += payload.get("text", "")
+            placeholder.markdown(text + "▌")
+        else:
+            if payload.get("answer") is not None:
+                placeholder.markdown(payload["answer"])
+            return _remember_session(payload)
+    raise RuntimeError("Stream ended before the final answer")
 
 def _render_pii_warning(detail: dict):
     findings = detail.get("findings", [])
@@ -97,11 +103,8 @@ st.divider()
 if not any(m.get("role") == "user" for m in st.session_state.messages):
     st.markdown("#### 💡 Suggestions")
 
-    example_prompts = [
-        "How did you enable AI‑assisted content production at simpleclub?",
-        "How do you align technical design with business impact?",
-        "Describe the free‑text evaluation or media asset generation prototypes you built.",
-    ]
+    # Shared with the backend, which precomputes their answers at startup
+    example_prompts = load_suggestion_prompts()
 
     BUTTON_HEIGHT = 84
     st.markdown(
@@ -157,31 +160,40 @@ for index, m in enumerate(st.session_state.messages):
             with st.chat_message("assistant", avatar=ASSISTANT_AVATAR):
                 if not st.session_state.get("pending_in_progress"):
                     st.session_state.pending_in_progress = True
-                    with st.spinner("Thinking…"):
-                        try:
-                            resp = send_sync(st.session_state.get("pending_prompt", ""))
-                            if resp.get("pii_blocked"):
-                                _render_pii_warning(resp)
-                                st.session_state.messages.pop(index)
-                            else:
-                                answer = resp.get("answer", "")
-                                highlights = resp.get("highlights", []) or []
-                                followups = resp.get("follow_up_questions", []) or []
-                                st.session_state.messages[index] = {
-                                    "role": "assistant",
-                                    "content": answer,
-                                    "highlights": highlights,
-                                    "follow_up_questions": followups,
-                                }
-                        except Exception as e:
+                    placeholder = st.empty()
+                    placeholder.markdown("_Thinking…_")
+                    try:
+                        resp = send_stream(st.session_state.get("pending_prompt", ""), placeholder)
+                        if resp.get("pii_blocked"):
+                            _render_pii_warning(resp)
+                            st.session_state.messages.pop(index)
+                        elif resp.get("overloaded"):
+                            st.session_state.messages[index] = {
+                                "role": "assistant",
+                                "content": (
+                                    "⏳ I'm answering a lot of questions right now. "
+                                    f"Please ask again in about {resp.get('retry_after', 5)} seconds."
+                                ),
+                            }
+                        else:
+                            answer = resp.get("answer", "")
+                            highlights = resp.get("highlights", []) or []
+                            followups = resp.get("follow_up_questions", []) or []
                             st.session_state.messages[index] = {
                                 "role": "assistant",
-                                "content": f"⚠️ Error: {e}",
+                                "content": answer,
+                                "highlights": highlights,
+                                "follow_up_questions": followups,
                             }
-                        finally:
-                            # Clean flags
-                            st.session_state.pop("pending_prompt", None)
-                            st.session_state.pending_in_progress = False
+                    except Exception as e:
+                        st.session_state.messages[index] = {
+                            "role": "assistant",
+                            "content": f"⚠️ Error: {e}",
+                        }
+                    finally:
+                        # Clean flags
+                        st.session_state.pop("pending_prompt", None)
+                        st.session_state.pending_in_progress = False
                     st.rerun()
                 else:
                     with st.spinner("Thinking…"):
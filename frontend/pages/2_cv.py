@@ -1,6 +1,16 @@
 import streamlit as st
 from sidebar import render_common_sidebar
 
+PDF_PATH = "data/CV_Marc_Poehler.pdf"
+
+
+@st.cache_resource
+def load_cv_bytes(path: str = PDF_PATH) -> bytes:
+    """Read the CV once per process; every session and rerun shares the same bytes."""
+    with open(path, "rb") as file:
+        return file.read()
+
+
 # Gate check
 if "auth_gate" not in st.session_state:
     st.warning("Please sign in on the Welcome page first.")
@@ -11,10 +21,7 @@ st.set_page_config(page_title="Curriculum Vitae", page_icon="📄", layout="cent
 st.title("📄 Curriculum Vitae")
 render_common_sidebar()
 
-pdf_path = "data/CV_Marc_Poehler.pdf"
-
-with open(pdf_path, "rb") as file:
-    pdf_bytes = file.read()
+pdf_bytes = load_cv_bytes()
 st.download_button(
     "📥 Download CV as PDF",
     data=pdf_bytes,
@@ -22,4 +29,7 @@ st.download_button(
     mime="application/pdf",
     use_container_width=True,
 )
-st.pdf(pdf_path, height=900)
+
+# The inline viewer ships the whole document, so it is only rendered on request
+if st.toggle("Show preview", key="cv_preview"):
+    st.pdf(pdf_bytes, height=900)
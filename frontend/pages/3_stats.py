@@ -1,21 +1,25 @@
-import streamlit as st
-import pandas as pd
+import html
 import json
 import os
+import streamlit as st
 from sidebar import render_common_sidebar
 
 
 DATA_FILE = os.path.join("data", "skills", "skills.json")
 
+# (category, [(skill, level), ...] sorted by skill), categories in file order
+SkillGroups = list[tuple[str, list[tuple[str, int]]]]
+
 @st.cache_data(show_spinner=False)
-def load_skills(path: str) -> pd.DataFrame:
+def load_skills(path: str) -> SkillGroups:
+    """Validate and group the skills once; no DataFrame needed for a static table."""
     with open(path, "r", encoding="utf-8") as f:
         raw = json.load(f)
     # Basic validation
     if "categories" not in raw or not isinstance(raw["categories"], list):
         raise ValueError("skills.json missing 'categories' list")
-    rows = []
-    for category_index, category in enumerate(raw["categories"]):
+    groups: dict[str, list[tuple[str, int]]] = {}
+    for category in raw["categories"]:
         name = category.get("name")
         skills = category.get("skills", [])
         if not name or not isinstance(skills, list):
@@ -25,24 +29,33 @@ def load_skills(path: str) -> pd.DataFrame:
             lvl = skill_item.get("level")
             if not skill_name or not isinstance(lvl, int) or not (1 <= lvl <= 5):
                 raise ValueError(f"Invalid skill entry in category '{name}'")
-            rows.append({"category": name, "skill": skill_name, "level": lvl, "category_order": category_index})
-    df_local = pd.DataFrame(rows)
-    return df_local
+            groups.setdefault(name, []).append((skill_name, lvl))
+    return [(name, sorted(skills)) for name, skills in groups.items()]
 
 def render_dots(level: int, max_dots: int = 5) -> str:
     filled = max(0, min(max_dots, int(level)))
     empty = max_dots - filled
     return " ".join(["●"] * filled + ["○"] * empty)
 
-def render_category(category_name: str):
-    st.subheader(category_name)
-    sub = df[df["category"] == category_name].sort_values("skill")
-    for row in sub.itertuples():
-        c1, c2 = st.columns([2,1])
-        with c1:
-            st.write(row.skill)
-        with c2:
-            st.write(render_dots(int(row.level)))
+TABLE_STYLE = """
+<style>
+.skill-table { width: 100%; border-collapse: collapse; margin-bottom: 1.5rem; }
+.skill-table td { padding: 0.3rem 0; border: none; }
+.skill-table td.level { width: 33%; white-space: nowrap; }
+</style>
+"""
+
+def category_html(category_name: str, skills: list[tuple[str, int]]) -> str:
+    rows = "".join(
+        f'<tr><td>{html.escape(skill)}</td><td class="level">{render_dots(level)}</td></tr>'
+        for skill, level in skills
+    )
+    return f'<h3>{html.escape(category_name)}</h3><table class="skill-table">{rows}</table>'
+
+def render_categories(groups: SkillGroups) -> None:
+    """One markdown element per column, however many skills there are."""
+    if groups:
+        st.markdown("".join(category_html(name, skills) for name, skills in groups), unsafe_allow_html=True)
 
 # Gate check
 if "auth_gate" not in st.session_state:
@@ -60,21 +73,17 @@ st.divider()
 
 
 try:
-    df = load_skills(DATA_FILE)
+    skill_groups = load_skills(DATA_FILE)
 except Exception as e:  # noqa: BLE001
     st.error(f"Failed to load skills data: {e}")
     st.stop()
 
-categories_ordered = list(df.sort_values(["category_order", "category"])["category"].unique())
-mid = (len(categories_ordered) + 1) // 2
-left_categories = categories_ordered[:mid]
-right_categories = categories_ordered[mid:]
+st.markdown(TABLE_STYLE, unsafe_allow_html=True)
+mid = (len(skill_groups) + 1) // 2
 
 col_left, col_right = st.columns(2, gap="large")
 
 with col_left:
-    for category in left_categories:
-        render_category(category)
+    render_categories(skill_groups[:mid])
 with col_right:
-    for category in right_categories:
-        render_category(category)
+    render_categories(skill_groups[mid:])
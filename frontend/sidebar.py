@@ -1,10 +1,11 @@
 import streamlit as st
+from assets import static_image
 
 
 def render_common_sidebar() -> None:
     """Render the common sidebar with Contacts and Focus areas."""
     with st.sidebar:
-        st.image("data/Headshot_Marc_Poehler.jpeg")
+        static_image("Headshot_Marc_Poehler.jpeg", width=480, alt="Marc Pöhler")
         st.subheader("Marc Pöhler – AI Software Engineer")
         st.subheader("Contact")
         st.link_button("📧 Email", "mailto:marcpoehler@aol.com")
@@ -1,11 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from backend.container import build_container
 from backend.presentation.http_chat_router import get_chat_router
 from backend.presentation.errors import domain_error_handler, generic_error_handler
+from backend.presentation.metrics import MetricsMiddleware, register_container_collectors
+from backend.presentation.compression import CompressionMiddleware
+from backend.presentation.responses import FastJSONResponse
 from backend.domain.errors import DomainError
 
 logging.basicConfig(level=logging.INFO)
@@ -24,7 +28,7 @@ def create_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):  # noqa: D401 (simple lifespan)
         # Startup phase
-        if not container.settings.openai_api_key:
+        if not container.settings.openai_api_key and container.settings.llm_provider != "fake":
             logger.warning("OPENAI_API_KEY missing – LLM calls will fail.")
         logger.info(
             "Startup env=%s model=%s cors=%s",
@@ -32,10 +36,29 @@ def create_app() -> FastAPI:
             container.settings.llm_model,
             cors_origins,
         )
+        prewarm_task = None
+        if container.lazy_services:
+            # Build the deferred adapters (OpenAI SDK import, clients) off the event loop
+            # while startup completes; a request that needs one earlier waits for it
+            prewarm_task = asyncio.create_task(asyncio.to_thread(container.prewarm))
+        warm_up_task = None
+        if container.answer_warm_up:
+            # Background task: startup is not blocked by answer generation
+            warm_up_task = asyncio.create_task(
+                container.answer_warm_up.watch(container.settings.precompute_check_interval_seconds)
+            )
         yield
-        # Shutdown phase (currently no cleanup needed)
+        # Shutdown phase: stop warm-up, release pooled upstream connections
+        if warm_up_task:
+            warm_up_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await warm_up_task
+        if prewarm_task:
+            with suppress(Exception):
+                await prewarm_task
+        await container.async_llm_service.aclose()
 
-    app = FastAPI(title="ai-portfolio-backend", lifespan=lifespan)
+    app = FastAPI(title="ai-portfolio-backend", lifespan=lifespan, default_response_class=FastJSONResponse)
 
     app.add_middleware(
         CORSMiddleware,
@@ -45,6 +68,14 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if container.settings.compression_min_bytes > 0:
+        app.add_middleware(CompressionMiddleware, minimum_size=container.settings.compression_min_bytes)
+
+    if container.settings.metrics_enabled:
+        # Outermost: timings also cover CORS handling and error responses
+        app.add_middleware(MetricsMiddleware)
+        register_container_collectors(container)
+
     # Exception handlers
     app.add_exception_handler(DomainError, domain_error_handler)
     app.add_exception_handler(Exception, generic_error_handler)